@@ -0,0 +1,100 @@
+"""Event-loop responsiveness while the async client uploads large arrays concurrently.
+
+A heartbeat coroutine sleeps in short intervals and records how late it wakes up.
+"inline" serializes arrays on the event loop, which is what the async client did
+before serialization was moved to worker threads; "offloaded" is the current client.
+
+The transport drains request bodies chunk by chunk, yielding to the loop between
+chunks the way a socket write would, and returns a canned batch response.
+
+Usage:
+    python benchmarks/bench_async_upload_latency.py
+    python benchmarks/bench_async_upload_latency.py --size-mb 500 --uploads 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import typing
+
+import httpx
+import numpy as np
+
+from conductorquantum import AsyncConductorQuantum
+from conductorquantum.core import File
+from conductorquantum.models.extended_client import AsyncExtendedModelsClient
+
+MODEL = "coulomb-blockade-peak-detector-v2"
+HEARTBEAT_SECONDS = 0.005
+
+
+class _DrainingTransport(httpx.AsyncBaseTransport):
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async for _chunk in request.stream:  # type: ignore[union-attr]
+            await asyncio.sleep(0)
+        body = {
+            "id": "batch-result-id",
+            "created_at": "2026-05-13T19:00:00Z",
+            "input_file_name": "batch.npy",
+            "model": MODEL,
+            "batch_size": 1,
+            "output": {"outputs": [{}]},
+        }
+        return httpx.Response(200, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+
+async def _inline_convert(
+    self: AsyncExtendedModelsClient, data: typing.Any
+) -> typing.Tuple[File, typing.Optional[str]]:
+    return self._convert_to_file(data)
+
+
+async def _run(uploads: int, array: np.ndarray, inline: bool) -> typing.Tuple[float, typing.List[float]]:
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url="https://api.example.test/v0/control",
+        httpx_client=httpx.AsyncClient(transport=_DrainingTransport()),
+    )
+    models = typing.cast(AsyncExtendedModelsClient, client.control.models)
+    if inline:
+        models._convert_to_file_async = _inline_convert.__get__(models)  # type: ignore[method-assign]
+
+    lags: typing.List[float] = []
+
+    async def heartbeat() -> None:
+        while True:
+            expected = time.perf_counter() + HEARTBEAT_SECONDS
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(models.batch.run(model=MODEL, data=array) for _ in range(uploads)))
+    finally:
+        beat.cancel()
+    return time.perf_counter() - start, lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=128, help="size of each uploaded array")
+    parser.add_argument("--uploads", type=int, default=4, help="concurrent uploads")
+    args = parser.parse_args()
+
+    array = np.random.default_rng(0).random((1, args.size_mb * 2**20 // 8))
+    print(f"{args.uploads} concurrent uploads of {args.size_mb} MB")
+    print(f"{'mode':>10} {'wall (s)':>9} {'p50 lag (ms)':>13} {'p99 lag (ms)':>13} {'max lag (ms)':>13}")
+    for mode in ("inline", "offloaded"):
+        wall, lags = asyncio.run(_run(args.uploads, array, inline=mode == "inline"))
+        lags_ms = sorted(lag * 1e3 for lag in lags) or [0.0]
+        p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+        print(f"{mode:>10} {wall:>9.2f} {statistics.median(lags_ms):>13.2f} {p99:>13.2f} {max(lags_ms):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Decoding a large model-results listing: ``list`` versus ``list_columnar``.
+
+"list" builds one pydantic ``ModelResultPublicMasked`` per result (with the default
+"validate" and with "trusted" decoding); "list_columnar" decodes the same page into a
+struct-of-arrays ``ResultSet``. Peak memory is measured with tracemalloc in a second,
+untimed call; "retained" is what the decoded results still hold afterwards.
+
+Usage:
+    python benchmarks/bench_columnar_results.py
+    python benchmarks/bench_columnar_results.py --results 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from conductorquantum import ConductorQuantum
+
+
+def _listing(count: int) -> bytes:
+    items = [
+        {
+            "id": f"{index:08x}-0000-4000-8000-000000000000",
+            "model": f"model-{index % 4}",
+            "created_at": f"2026-05-{index % 28 + 1:02d}T19:00:00Z",
+            "output": {"score": index / count, "peaks": [index % 7, index % 11, index % 13], "label": "ok"},
+        }
+        for index in range(count)
+    ]
+    return json.dumps(items).encode()
+
+
+def _measure(name: str, call: typing.Callable[[], typing.Any]) -> None:
+    start = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = call()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:>16}: {elapsed:6.2f} s, peak {peak / 2**20:7.1f} MB, retained {retained / 2**20:7.1f} MB for {len(result)} results"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=200_000)
+    args = parser.parse_args()
+
+    body = _listing(args.results)
+    client = ConductorQuantum(
+        token="test-token",
+        base_url="https://api.example.test/v0/control",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=body, headers={"content-type": "application/json"})
+            )
+        ),
+    )
+    model_results = client.control.model_results
+
+    _measure("list", lambda: model_results.list())
+    _measure("list (trusted)", lambda: model_results.list(request_options={"decode_mode": "trusted"}))
+    _measure("list_columnar", lambda: model_results.list_columnar())
+
+
+if __name__ == "__main__":
+    main()
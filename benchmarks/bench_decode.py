@@ -0,0 +1,54 @@
+"""Compare validated and trusted response decoding on large model-result listings.
+
+Usage:
+    python benchmarks/bench_decode.py
+    python benchmarks/bench_decode.py --sizes 1000 50000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import typing
+
+from conductorquantum import ModelResultPublicMasked
+from conductorquantum.core.decoding import DecodeMode, parse_obj_as
+
+
+def _listing(size: int) -> typing.List[typing.Dict[str, typing.Any]]:
+    return [
+        {
+            "id": f"00000000-0000-0000-0000-{index:012d}",
+            "model": "coulomb-blockade-peak-detector-v2",
+            "created_at": "2026-05-13T19:00:00Z",
+            "output": {"peak_indices": [index % 97, index % 89, index % 83], "confidence": 0.5},
+        }
+        for index in range(size)
+    ]
+
+
+def _best_of(repeat: int, payload: typing.Any, decode_mode: DecodeMode) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_obj_as(typing.List[ModelResultPublicMasked], payload, decode_mode=decode_mode)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'validate (ms)':>14} {'trusted (ms)':>13} {'speedup':>8}")
+    for size in args.sizes:
+        payload = _listing(size)
+        validated = _best_of(args.repeat, payload, "validate")
+        trusted = _best_of(args.repeat, payload, "trusted")
+        print(f"{size:>8} {validated * 1e3:>14.1f} {trusted * 1e3:>13.1f} {validated / trusted:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
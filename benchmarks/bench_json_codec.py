@@ -0,0 +1,78 @@
+"""Compare JSON codecs on batch model responses and Coda agent event streams.
+
+Only installed codecs are measured; the standard library is always present.
+
+Usage:
+    python benchmarks/bench_json_codec.py
+    python benchmarks/bench_json_codec.py --batch-sizes 64 4096 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import typing
+
+from conductorquantum.core import json_codec
+
+
+def _batch_response(batch_size: int) -> bytes:
+    outputs = [
+        {"peak_indices": [index % 97, index % 89, index % 83], "peak_heights": [0.125 * index, 0.5, 1.75]}
+        for index in range(batch_size)
+    ]
+    return json.dumps(
+        {
+            "id": "batch-result-id",
+            "created_at": "2026-05-13T19:00:00Z",
+            "input_file_name": "batch.npy",
+            "model": "coulomb-blockade-peak-detector-v2",
+            "batch_size": batch_size,
+            "output": {"outputs": outputs},
+        }
+    ).encode()
+
+
+def _event_lines(count: int) -> typing.List[str]:
+    return [json.dumps({"type": "delta", "index": index, "text": "token " * 8}) for index in range(count)]
+
+
+def _best_of(repeat: int, run: typing.Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 1_024, 16_384])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = [name for name in json_codec.JSON_CODECS if json_codec._load_decoder(name) is not None]
+    workloads: typing.Dict[str, typing.Callable[[], object]] = {}
+    for size in args.batch_sizes:
+        document = _batch_response(size)
+        workloads[f"batch[{size}]"] = lambda document=document: json_codec.loads(document)  # type: ignore[misc]
+    lines = _event_lines(args.events)
+    workloads[f"sse[{args.events}]"] = lambda: [json_codec.loads(line) for line in lines]
+
+    print(f"{'workload':>14} " + " ".join(f"{name + ' (ms)':>14}" for name in codecs))
+    try:
+        for workload, run in workloads.items():
+            timings = []
+            for name in codecs:
+                json_codec.set_json_codec(name)
+                timings.append(_best_of(args.repeat, run))
+            print(f"{workload:>14} " + " ".join(f"{seconds * 1e3:>14.2f}" for seconds in timings))
+    finally:
+        json_codec.set_json_codec(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Upload time for a memory-mapped ``.npy`` file, streamed from its pages or copied first.
+
+"copied" converts the memmap to an in-memory array, which the client serializes
+through a temporary ``.npy`` file as before; "streamed" passes the memmap itself,
+which the client now reads page by page during the upload. The stand-in server
+drains the request body without storing it.
+
+Usage:
+    python benchmarks/bench_memmap_upload.py
+    python benchmarks/bench_memmap_upload.py --size-mb 2048
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import httpx
+import numpy as np
+
+from conductorquantum import ConductorQuantum
+
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+class _DrainTransport(httpx.BaseTransport):
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in request.stream:  # type: ignore[union-attr]
+            pass
+        body = {
+            "id": "batch-result-id",
+            "created_at": "2026-05-13T19:00:00Z",
+            "input_file_name": "data.npy",
+            "model": MODEL,
+            "batch_size": 1,
+            "output": {"outputs": [{}]},
+        }
+        return httpx.Response(200, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=512)
+    args = parser.parse_args()
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url="https://api.example.test/v0/control",
+        httpx_client=httpx.Client(transport=_DrainTransport()),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "scan.npy")
+        rows = args.size_mb * 2**20 // (8 * 4096)
+        writer = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(rows, 4096))
+        writer[:] = 1.0
+        writer.flush()
+        del writer
+
+        for name, load in (
+            ("copied", lambda: np.array(np.load(path, mmap_mode="r"))),
+            ("streamed", lambda: np.load(path, mmap_mode="r")),
+        ):
+            start = time.perf_counter()
+            client.control.models.batch.run(model=MODEL, data=load())
+            print(f"{name:>9}: {time.perf_counter() - start:6.2f} s for {args.size_mb} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Per-call overhead of parse_obj_as with and without the cached TypeAdapter registry.
+
+"uncached" rebuilds a TypeAdapter and walks the payload for aliases on every call,
+which is what parse_obj_as did before adapters were cached; "cached" is the
+current parse_obj_as.
+
+Usage:
+    python benchmarks/bench_parse_obj_as.py
+    python benchmarks/bench_parse_obj_as.py --calls 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import typing
+
+import pydantic
+
+from conductorquantum import ModelBatchResultPublic, ModelResultPublic, ModelResultPublicMasked
+from conductorquantum.core.decoding import parse_obj_as
+from conductorquantum.core.serialization import convert_and_respect_annotation_metadata
+
+_CREATED_AT = "2026-05-13T19:00:00Z"
+_MODEL = "coulomb-blockade-peak-detector-v2"
+
+CASES: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {
+    "info": (
+        ModelResultPublic,
+        {
+            "id": "08047949-7263-4557-9122-ab293a49cae5",
+            "model": _MODEL,
+            "created_at": _CREATED_AT,
+            "input_file_name": "trace.npy",
+            "input_file_size": 1152,
+            "output": {"peak_indices": [12, 40, 77]},
+        },
+    ),
+    "list": (
+        typing.List[ModelResultPublicMasked],
+        [
+            {"id": f"result-{index}", "model": _MODEL, "created_at": _CREATED_AT, "output": {"peak_indices": [index]}}
+            for index in range(10)
+        ],
+    ),
+    "batch": (
+        ModelBatchResultPublic,
+        {
+            "id": "batch-result-id",
+            "model": _MODEL,
+            "created_at": _CREATED_AT,
+            "input_file_name": "batch.npy",
+            "batch_size": 8,
+            "output": {"outputs": [{"peak_indices": [index, index + 3]} for index in range(8)]},
+        },
+    ),
+}
+
+
+def _uncached_parse(type_: typing.Any, object_: typing.Any) -> typing.Any:
+    dealiased = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
+    return pydantic.TypeAdapter(type_).validate_python(dealiased)
+
+
+def _per_call_us(calls: int, parse: typing.Callable[[typing.Any, typing.Any], typing.Any], case: str) -> float:
+    type_, payload = CASES[case]
+    parse(type_, payload)
+    start = time.perf_counter()
+    for _ in range(calls):
+        parse(type_, payload)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{'response':>8} {'uncached (us)':>14} {'cached (us)':>12} {'speedup':>8}")
+    for case in CASES:
+        uncached = _per_call_us(args.calls, _uncached_parse, case)
+        cached = _per_call_us(args.calls, parse_obj_as, case)
+        print(f"{case:>8} {uncached:>14.1f} {cached:>12.1f} {uncached / cached:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Upload size and preprocessing time when mapping a batch to the NN input shape.
+
+Compares resampling a batch item by item in a Python loop with the single
+vectorized ``to_nn_input`` call that ``batch.run(preprocess=...)`` uses, and
+reports how much smaller the serialized upload becomes.
+
+Usage:
+    python benchmarks/bench_preprocess.py
+    python benchmarks/bench_preprocess.py --batch 256 --length 100000 --target 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import typing
+
+import numpy as np
+
+from conductorquantum.models.preprocess import PreprocessMode, to_nn_input
+
+
+def _npy_size(array: np.ndarray) -> int:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.tell()
+
+
+def _best(repeat: int, func: typing.Callable[[], np.ndarray]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument("--length", type=int, default=50_003)
+    parser.add_argument("--target", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = np.random.default_rng(0).standard_normal((args.batch, args.length)).astype(np.float32)
+    shape = (args.target,)
+    modes: typing.Tuple[PreprocessMode, ...] = ("resample", "crop")
+    for mode in modes:
+        looped = _best(args.repeat, lambda: np.stack([to_nn_input(item, shape, mode=mode) for item in data]))
+        vectorized = _best(args.repeat, lambda: to_nn_input(data, shape, mode=mode, batched=True))
+        print(
+            f"{mode:>8}: loop {looped * 1e3:8.1f} ms  vectorized {vectorized * 1e3:8.1f} ms  "
+            f"({looped / vectorized:.1f}x)"
+        )
+    before, after = _npy_size(data), _npy_size(to_nn_input(data, shape, batched=True))
+    print(f"upload: {before / 2**20:.1f} MB -> {after / 2**20:.2f} MB ({before / after:.0f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Decode throughput and peak memory when reading compressed API responses.
+
+"httpx read" is ``httpx.Response.read()``, which joins a list of decoded chunks;
+"streamed" is ``core.compression.read_response``, which the SDK now uses. Both read
+a compressed model-result listing that arrives in 64 KiB network-sized chunks.
+Codecs other than gzip are measured only when httpx can decode them, which needs
+``zstandard`` (zstd) or ``brotli`` (br).
+
+Usage:
+    python benchmarks/bench_response_decompression.py
+    python benchmarks/bench_response_decompression.py --items 200000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import importlib
+import json
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from conductorquantum.core.compression import read_response
+
+_NETWORK_CHUNK = 64 * 1024
+
+
+class _ChunkedStream(httpx.SyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for start in range(0, len(self._body), _NETWORK_CHUNK):
+            yield self._body[start : start + _NETWORK_CHUNK]
+
+
+def _listing(items: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": f"00000000-0000-0000-0000-{index:012d}",
+                "model": "coulomb-blockade-peak-detector-v2",
+                "created_at": "2026-05-13T19:00:00Z",
+                "output": {"peak_indices": [index % 97, index % 89, index % 83], "confidence": 0.5},
+            }
+            for index in range(items)
+        ]
+    ).encode()
+
+
+def _compressors() -> typing.Dict[str, typing.Callable[[bytes], bytes]]:
+    from httpx._decoders import SUPPORTED_DECODERS
+
+    compressors: typing.Dict[str, typing.Callable[[bytes], bytes]] = {"gzip": gzip.compress}
+    if "zstd" in SUPPORTED_DECODERS:
+        compressors["zstd"] = importlib.import_module("zstandard").ZstdCompressor().compress
+    if "br" in SUPPORTED_DECODERS:
+        compressors["br"] = importlib.import_module("brotli").compress
+    return compressors
+
+
+def _measure(
+    repeat: int, encoding: str, compressed: bytes, read: typing.Callable[[httpx.Response], object]
+) -> typing.Tuple[float, int]:
+    best = float("inf")
+    peak = 0
+    for _ in range(repeat):
+        response = httpx.Response(200, headers={"content-encoding": encoding}, stream=_ChunkedStream(compressed))
+        tracemalloc.start()
+        start = time.perf_counter()
+        read(response)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = _listing(args.items)
+    size_mb = len(body) / 2**20
+    print(f"listing of {args.items} results, {size_mb:.1f} MB decompressed")
+    print(f"{'codec':>6} {'ratio':>6} {'reader':>10} {'MB/s':>8} {'peak (MB)':>10}")
+    for encoding, compress in _compressors().items():
+        compressed = compress(body)
+        for name, read in (("httpx read", httpx.Response.read), ("streamed", read_response)):
+            seconds, peak = _measure(args.repeat, encoding, compressed, read)
+            print(
+                f"{encoding:>6} {len(body) / len(compressed):>5.1f}x {name:>10} "
+                f"{size_mb / seconds:>8.0f} {peak / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Fan-out of one array to several models: one ``run`` per model versus ``run_multi``.
+
+"sequential" calls ``models.run`` once per model, which writes a temporary ``.npy``
+file for every call; "run_multi" serializes the array once and uploads the same bytes
+to every model concurrently. The stand-in server drains the request body without
+storing it.
+
+Usage:
+    python benchmarks/bench_run_multi.py
+    python benchmarks/bench_run_multi.py --size-mb 256 --models 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import httpx
+import numpy as np
+
+from conductorquantum import ConductorQuantum
+
+
+class _DrainTransport(httpx.BaseTransport):
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in request.stream:  # type: ignore[union-attr]
+            pass
+        body = {
+            "id": "result-id",
+            "created_at": "2026-05-13T19:00:00Z",
+            "input_file_name": "data.npy",
+            "input_file_size": 0,
+            "model": "model",
+            "output": {},
+        }
+        return httpx.Response(200, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--models", type=int, default=5)
+    args = parser.parse_args()
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url="https://api.example.test/v0/control",
+        httpx_client=httpx.Client(transport=_DrainTransport()),
+    )
+    array = np.ones(args.size_mb * 2**20 // 8, dtype=np.float64)
+    models = [f"model-{index}" for index in range(args.models)]
+
+    start = time.perf_counter()
+    for model in models:
+        client.control.models.run(model=model, data=array)
+    print(f"sequential: {time.perf_counter() - start:6.2f} s for {args.models} x {args.size_mb} MB")
+
+    start = time.perf_counter()
+    client.control.models.run_multi(models=models, data=array)
+    print(f" run_multi: {time.perf_counter() - start:6.2f} s for {args.models} x {args.size_mb} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Full-history pulls: ``iter_all`` (serial skip/limit) versus ``iter_sharded`` (parallel date shards).
+
+The stand-in server sleeps ``--latency`` per request plus a little per skipped row, to
+mimic deep offsets getting slower.
+
+Usage:
+    python benchmarks/bench_sharded_listing.py
+    python benchmarks/bench_sharded_listing.py --results 100000 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import datetime as dt
+import json
+import time
+
+import httpx
+
+from conductorquantum import ConductorQuantum
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per request.")
+    parser.add_argument("--skip-cost", type=float, default=1e-6, help="Seconds per skipped row.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    start = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+    step = dt.timedelta(days=365) / args.results
+    created = [(start + step * index).strftime("%Y-%m-%dT%H:%M:%S.%fZ") for index in range(args.results)]
+    items = [
+        json.dumps({"id": f"result-{index}", "model": "model", "created_at": stamp, "output": {"score": index}})
+        for index, stamp in enumerate(created)
+    ]
+    keys = [stamp[:-1] for stamp in created]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        low = bisect.bisect_left(keys, params["start_date"].rstrip("Z")) if "start_date" in params else 0
+        high = bisect.bisect_right(keys, params["end_date"].rstrip("Z")) if "end_date" in params else len(keys)
+        skip, limit = int(params["skip"]), int(params["limit"])
+        time.sleep(args.latency + args.skip_cost * skip)
+        page = items[low + skip : min(high, low + skip + limit)]
+        return httpx.Response(200, content=b"[" + ",".join(page).encode() + b"]")
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url="https://api.example.test/v0/control",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    model_results = client.control.model_results
+
+    begin = time.perf_counter()
+    count = sum(len(page) for page in model_results.iter_all(page_size=args.page_size, columnar=True))
+    print(f"    iter_all: {time.perf_counter() - begin:6.2f} s for {count} results")
+
+    begin = time.perf_counter()
+    count = sum(
+        len(page)
+        for page in model_results.iter_sharded(
+            start_date="2026-01-01",
+            end_date="2027-01-01",
+            shards=args.shards,
+            max_workers=args.workers,
+            page_size=args.page_size,
+            columnar=True,
+        )
+    )
+    print(f"iter_sharded: {time.perf_counter() - begin:6.2f} s for {count} results")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time to first output and peak memory for a large batch response, parsed whole or streamed.
+
+"whole" is ``batch.run``, which reads the full body, decodes it and validates the
+result before returning; "streamed" is ``batch.run_streaming``, which decodes
+``output.outputs`` element by element as the body arrives. The stand-in server
+sends the body in 64 KiB chunks.
+
+Usage:
+    python benchmarks/bench_streaming_outputs.py
+    python benchmarks/bench_streaming_outputs.py --items 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+import typing
+
+import httpx
+import numpy as np
+
+from conductorquantum import ConductorQuantum
+
+MODEL = "coulomb-blockade-peak-detector-v2"
+_CHUNK = 1 << 16
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20_000)
+    args = parser.parse_args()
+
+    outputs = [{"peak_indices": list(range(index % 50)), "score": index / 7} for index in range(args.items)]
+    body = json.dumps(
+        {
+            "id": "batch-result-id",
+            "created_at": "2026-05-13T19:00:00Z",
+            "input_file_name": "data.npy",
+            "model": MODEL,
+            "batch_size": args.items,
+            "output": {"outputs": outputs},
+        }
+    ).encode()
+    del outputs
+
+    def chunks() -> typing.Iterator[bytes]:
+        for start in range(0, len(body), _CHUNK):
+            yield body[start : start + _CHUNK]
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url="https://api.example.test/v0/control",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))),
+    )
+    data = np.zeros((args.items, 1), dtype=np.float32)
+    print(f"response body: {len(body) / 2**20:.1f} MB")
+
+    for name in ("whole", "streamed"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        if name == "whole":
+            result = client.control.models.batch.run(model=MODEL, data=data)
+            first = time.perf_counter() - start
+            count = sum(1 for _ in result.output["outputs"])
+            del result
+        else:
+            stream = client.control.models.batch.run_streaming(model=MODEL, data=data)
+            next(stream)
+            first = time.perf_counter() - start
+            count = 1 + sum(1 for _ in stream)
+        total = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:>9}: first output {first:6.3f} s, all {count} in {total:6.3f} s, peak {peak / 2**20:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
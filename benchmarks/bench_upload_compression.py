@@ -0,0 +1,99 @@
+"""Bytes on the wire and end-to-end upload latency with and without upload compression.
+
+Uploads go through the real sync client to a local stand-in server: an httpx
+transport that consumes the request body at a simulated link speed and then
+returns a canned batch response. Arrays are synthetic 16-bit charge-sensor
+stability diagrams stored as float32, which is what instrument data typically
+looks like. ``zstd`` is measured only when the ``zstandard`` package is installed.
+
+Usage:
+    python benchmarks/bench_upload_compression.py
+    python benchmarks/bench_upload_compression.py --sizes-mb 1 16 --links-mbps 50 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import time
+import typing
+
+import httpx
+import numpy as np
+
+from conductorquantum import ConductorQuantum
+
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+class _LinkTransport(httpx.BaseTransport):
+    """Stand-in server that drains the request body at ``mbps`` and records its size."""
+
+    def __init__(self, mbps: float) -> None:
+        self.bytes_per_second = mbps * 1e6 / 8
+        self.received = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.received = 0
+        started = time.perf_counter()
+        for chunk in request.stream:  # type: ignore[union-attr]
+            self.received += len(chunk)
+            # Sleep until the link would have finished sending everything received so far.
+            lag = self.received / self.bytes_per_second - (time.perf_counter() - started)
+            if lag > 0:
+                time.sleep(lag)
+        body = {
+            "id": "batch-result-id",
+            "created_at": "2026-05-13T19:00:00Z",
+            "input_file_name": "data.npy",
+            "model": MODEL,
+            "batch_size": 1,
+            "output": {"outputs": [{}]},
+        }
+        return httpx.Response(200, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+
+def _stability_diagram(size_mb: int) -> np.ndarray:
+    side = int((size_mb * 2**20 / 4) ** 0.5)
+    plunger, barrier = np.meshgrid(np.linspace(0, 40, side), np.linspace(0, 25, side))
+    rng = np.random.default_rng(0)
+    current = np.abs(np.sin(plunger + 0.3 * barrier)) ** 8 + 0.002 * rng.standard_normal((side, side))
+    counts = np.round(current * 2**15).clip(-(2**15), 2**15 - 1)
+    return (counts / 2**15).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--links-mbps", type=float, nargs="+", default=[20.0, 100.0, 1000.0])
+    args = parser.parse_args()
+
+    modes: typing.List[typing.Optional[str]] = [None, "gzip"]
+    if importlib.util.find_spec("zstandard") is not None:
+        modes.append("zstd")
+
+    print(f"{'size':>6} {'link':>10} {'mode':>6} {'wire (MB)':>10} {'ratio':>6} {'latency (s)':>12}")
+    for size_mb in args.sizes_mb:
+        array = _stability_diagram(size_mb)
+        for mbps in args.links_mbps:
+            raw_bytes = None
+            for mode in modes:
+                transport = _LinkTransport(mbps)
+                client = ConductorQuantum(
+                    token="test-token",
+                    base_url="https://api.example.test/v0/control",
+                    httpx_client=httpx.Client(transport=transport),
+                )
+                start = time.perf_counter()
+                client.control.models.batch.run(model=MODEL, data=array, compression=mode)  # type: ignore[arg-type]
+                latency = time.perf_counter() - start
+                raw_bytes = raw_bytes or transport.received
+                print(
+                    f"{size_mb:>4}MB {mbps:>6.0f}Mbps {mode or 'none':>6} {transport.received / 2**20:>10.2f} "
+                    f"{raw_bytes / transport.received:>5.1f}x {latency:>12.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
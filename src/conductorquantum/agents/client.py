@@ -10,17 +10,18 @@ import typing
 from json.decoder import JSONDecodeError
 
 from ..core.api_error import ApiError
-from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.decoding import parse_obj_as
+from ..core.extended_client_wrapper import AsyncExtendedClientWrapper, ExtendedSyncClientWrapper
+from ..core.extended_request_options import AnyRequestOptions
+from ..core.json_codec import response_json
 from ..core.jsonable_encoder import jsonable_encoder
-from ..core.pydantic_utilities import parse_obj_as
-from ..core.request_options import RequestOptions
 from ..types.agent_public import AgentPublic
 
 
 class AgentsClient:
     """Sync client for Control API agents (``/agents``)."""
 
-    def __init__(self, *, client_wrapper: SyncClientWrapper) -> None:
+    def __init__(self, *, client_wrapper: ExtendedSyncClientWrapper) -> None:
         self._client_wrapper = client_wrapper
 
     def list(
@@ -28,7 +29,7 @@ class AgentsClient:
         *,
         skip: typing.Optional[int] = None,
         limit: typing.Optional[int] = None,
-        request_options: typing.Optional[RequestOptions] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> typing.List[AgentPublic]:
         """List agents the authenticated user can access.
 
@@ -38,7 +39,7 @@ class AgentsClient:
             Number of agents to skip.
         limit : int, optional
             Max number of agents to return.
-        request_options : RequestOptions, optional
+        request_options : AnyRequestOptions, optional
             Request-specific configuration.
 
         Returns
@@ -63,10 +64,11 @@ class AgentsClient:
                     typing.List[AgentPublic],
                     parse_obj_as(
                         type_=typing.List[AgentPublic],  # type: ignore
-                        object_=_response.json(),
+                        object_=response_json(_response),
+                        decode_mode=self._client_wrapper.get_decode_mode(request_options),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = response_json(_response)
         except JSONDecodeError:
             raise ApiError(
                 status_code=_response.status_code,
@@ -84,7 +86,7 @@ class AgentsClient:
         agent_id: str,
         *,
         body: typing.Dict[str, typing.Any],
-        request_options: typing.Optional[RequestOptions] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> typing.Dict[str, typing.Any]:
         """Execute an agent by its string ID.
 
@@ -94,7 +96,7 @@ class AgentsClient:
             The string ID of the agent (e.g. ``"ising-calibration-v1"``).
         body : dict
             Agent-specific request body.
-        request_options : RequestOptions, optional
+        request_options : AnyRequestOptions, optional
             Request-specific configuration.
 
         Returns
@@ -110,8 +112,8 @@ class AgentsClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                return typing.cast(typing.Dict[str, typing.Any], _response.json())
-            _response_json = _response.json()
+                return typing.cast(typing.Dict[str, typing.Any], response_json(_response))
+            _response_json = response_json(_response)
         except JSONDecodeError:
             raise ApiError(
                 status_code=_response.status_code,
@@ -128,7 +130,7 @@ class AgentsClient:
 class AsyncAgentsClient:
     """Async client for Control API agents (``/agents``)."""
 
-    def __init__(self, *, client_wrapper: AsyncClientWrapper) -> None:
+    def __init__(self, *, client_wrapper: AsyncExtendedClientWrapper) -> None:
         self._client_wrapper = client_wrapper
 
     async def list(
@@ -136,7 +138,7 @@ class AsyncAgentsClient:
         *,
         skip: typing.Optional[int] = None,
         limit: typing.Optional[int] = None,
-        request_options: typing.Optional[RequestOptions] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> typing.List[AgentPublic]:
         """List agents the authenticated user can access."""
         params: typing.Dict[str, typing.Any] = {}
@@ -157,10 +159,11 @@ class AsyncAgentsClient:
                     typing.List[AgentPublic],
                     parse_obj_as(
                         type_=typing.List[AgentPublic],  # type: ignore
-                        object_=_response.json(),
+                        object_=response_json(_response),
+                        decode_mode=self._client_wrapper.get_decode_mode(request_options),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = response_json(_response)
         except JSONDecodeError:
             raise ApiError(
                 status_code=_response.status_code,
@@ -178,7 +181,7 @@ class AsyncAgentsClient:
         agent_id: str,
         *,
         body: typing.Dict[str, typing.Any],
-        request_options: typing.Optional[RequestOptions] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> typing.Dict[str, typing.Any]:
         """Execute an agent by its string ID."""
         _response = await self._client_wrapper.httpx_client.request(
@@ -189,8 +192,8 @@ class AsyncAgentsClient:
         )
         try:
             if 200 <= _response.status_code < 300:
-                return typing.cast(typing.Dict[str, typing.Any], _response.json())
-            _response_json = _response.json()
+                return typing.cast(typing.Dict[str, typing.Any], response_json(_response))
+            _response_json = response_json(_response)
         except JSONDecodeError:
             raise ApiError(
                 status_code=_response.status_code,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import typing
 import warnings
 from collections.abc import AsyncIterator, Iterator
@@ -7,14 +8,18 @@ from collections.abc import AsyncIterator, Iterator
 import httpx
 from .agents.client import AgentsClient, AsyncAgentsClient
 from .base_client import AsyncBaseConductorQuantum, BaseConductorQuantum
-from .coda._http import api_base_url_from_env
-from .coda.client import AsyncCodaClient, CodaClient
 from .control import AsyncControlClient, ControlClient
+from .core.compression import SpillToDisk
+from .core.decoding import DecodeMode
+from .core.extended_client_wrapper import AsyncExtendedClientWrapper, ExtendedSyncClientWrapper
 from .environment import ConductorQuantumEnvironment
-from .model_results.client import AsyncModelResultsClient, ModelResultsClient
+from .model_results.extended_client import AsyncExtendedModelResultsClient, ExtendedModelResultsClient
 from .models.extended_client import AsyncExtendedModelsClient, ExtendedModelsClient
 from .version import __version__
 
+if typing.TYPE_CHECKING:
+    from .coda.client import AsyncCodaClient, CodaClient
+
 DEFAULT_TIMEOUT_SECONDS = 120
 
 
@@ -58,6 +63,9 @@ class ConductorQuantum(BaseConductorQuantum):
         timeout: typing.Optional[float] = DEFAULT_TIMEOUT_SECONDS,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.Client] = None,
+        decode_mode: DecodeMode = "validate",
+        spill_to_disk: SpillToDisk = False,
+        coalesce_requests: bool = False,
     ):
         if token is None:
             raise ValueError("Provide token")
@@ -70,22 +78,37 @@ class ConductorQuantum(BaseConductorQuantum):
             follow_redirects=follow_redirects,
             httpx_client=httpx_client,
         )
-        self._models = ExtendedModelsClient(client_wrapper=self._client_wrapper)
-        self._agents = AgentsClient(client_wrapper=self._client_wrapper)
-        _base_model_results = super(ConductorQuantum, self).model_results
+        # The generated wrapper knows nothing of the SDK's own settings; swap in the
+        # extended one, reusing the httpx client the generated constructor chose.
+        client_wrapper = ExtendedSyncClientWrapper(
+            token=token,
+            base_url=self._client_wrapper.get_base_url(),
+            timeout=self._client_wrapper.get_timeout(),
+            httpx_client=self._client_wrapper.httpx_client.httpx_client,
+            decode_mode=decode_mode,
+            spill_to_disk=spill_to_disk,
+            coalesce_requests=coalesce_requests,
+        )
+        self._client_wrapper = client_wrapper
+        self._models = ExtendedModelsClient(client_wrapper=client_wrapper)
+        self._agents = AgentsClient(client_wrapper=client_wrapper)
+        self._model_results = ExtendedModelResultsClient(client_wrapper=client_wrapper)
         self._control = ControlClient(
             models=self._models,
-            model_results=_base_model_results,
+            model_results=self._model_results,
             agents=self._agents,
         )
 
-        resolved_coda_base_url = coda_base_url or base_url or api_base_url_from_env()
-        self._coda = CodaClient(
-            token=token,
-            base_url=resolved_coda_base_url,
-            timeout=timeout or DEFAULT_TIMEOUT_SECONDS,
-            sdk_version=__version__,
-        )
+        # The Coda stack (and its own httpx client) is built on first use so that
+        # Control-only callers do not pay for it at construction time. CODA_* environment
+        # variables are read, and a malformed base URL reported, at that point too.
+        self._coda_token = token
+        self._coda_base_url = coda_base_url or base_url
+        self._coda_timeout = timeout or DEFAULT_TIMEOUT_SECONDS
+        self._coda_spill_to_disk = spill_to_disk
+        self._coda_coalesce_requests = coalesce_requests
+        self._coda_client: typing.Optional[CodaClient] = None
+        self._coda_lock = threading.Lock()
 
     @property
     def control(self) -> ControlClient:
@@ -97,6 +120,25 @@ class ConductorQuantum(BaseConductorQuantum):
         """Coda product line — circuit tools, QPU, and agents."""
         return self._coda
 
+    @property
+    def _coda(self) -> CodaClient:
+        if self._coda_client is None:
+            # Threads racing on first use must not each build (and leak) an httpx client.
+            with self._coda_lock:
+                if self._coda_client is None:
+                    from .coda._http import api_base_url_from_env
+                    from .coda.client import CodaClient
+
+                    self._coda_client = CodaClient(
+                        token=self._coda_token,
+                        base_url=self._coda_base_url or api_base_url_from_env(),
+                        timeout=self._coda_timeout,
+                        spill_to_disk=self._coda_spill_to_disk,
+                        coalesce_requests=self._coda_coalesce_requests,
+                        sdk_version=__version__,
+                    )
+        return self._coda_client
+
     # -- Backwards-compatible accessors (deprecated) --
     # These override the Fern-generated base class properties so we can
     # emit deprecation warnings. The base class defines them too, but
@@ -115,7 +157,7 @@ class ConductorQuantum(BaseConductorQuantum):
         return self._control.models
 
     @property
-    def model_results(self) -> ModelResultsClient:  # type: ignore[override]
+    def model_results(self) -> ExtendedModelResultsClient:  # type: ignore[override]
         """**Deprecated.** Use ``client.control.model_results`` instead."""
         # TODO(v2): Remove deprecated client.model_results accessor
         warnings.warn(
@@ -297,6 +339,9 @@ class AsyncConductorQuantum(AsyncBaseConductorQuantum):
         timeout: typing.Optional[float] = DEFAULT_TIMEOUT_SECONDS,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        decode_mode: DecodeMode = "validate",
+        spill_to_disk: SpillToDisk = False,
+        coalesce_requests: bool = False,
     ):
         if token is None:
             raise ValueError("Provide token")
@@ -309,22 +354,37 @@ class AsyncConductorQuantum(AsyncBaseConductorQuantum):
             follow_redirects=follow_redirects,
             httpx_client=httpx_client,
         )
-        self._models = AsyncExtendedModelsClient(client_wrapper=self._client_wrapper)
-        self._agents = AsyncAgentsClient(client_wrapper=self._client_wrapper)
-        _base_model_results = super(AsyncConductorQuantum, self).model_results
+        # The generated wrapper knows nothing of the SDK's own settings; swap in the
+        # extended one, reusing the httpx client the generated constructor chose.
+        client_wrapper = AsyncExtendedClientWrapper(
+            token=token,
+            base_url=self._client_wrapper.get_base_url(),
+            timeout=self._client_wrapper.get_timeout(),
+            httpx_client=self._client_wrapper.httpx_client.httpx_client,
+            decode_mode=decode_mode,
+            spill_to_disk=spill_to_disk,
+            coalesce_requests=coalesce_requests,
+        )
+        self._client_wrapper = client_wrapper
+        self._models = AsyncExtendedModelsClient(client_wrapper=client_wrapper)
+        self._agents = AsyncAgentsClient(client_wrapper=client_wrapper)
+        self._model_results = AsyncExtendedModelResultsClient(client_wrapper=client_wrapper)
         self._control = AsyncControlClient(
             models=self._models,
-            model_results=_base_model_results,
+            model_results=self._model_results,
             agents=self._agents,
         )
 
-        resolved_coda_base_url = coda_base_url or base_url or api_base_url_from_env()
-        self._coda = AsyncCodaClient(
-            token=token,
-            base_url=resolved_coda_base_url,
-            timeout=timeout or DEFAULT_TIMEOUT_SECONDS,
-            sdk_version=__version__,
-        )
+        # The Coda stack (and its own httpx client) is built on first use so that
+        # Control-only callers do not pay for it at construction time. CODA_* environment
+        # variables are read, and a malformed base URL reported, at that point too.
+        self._coda_token = token
+        self._coda_base_url = coda_base_url or base_url
+        self._coda_timeout = timeout or DEFAULT_TIMEOUT_SECONDS
+        self._coda_spill_to_disk = spill_to_disk
+        self._coda_coalesce_requests = coalesce_requests
+        self._coda_client: typing.Optional[AsyncCodaClient] = None
+        self._coda_lock = threading.Lock()
 
     @property
     def control(self) -> AsyncControlClient:
@@ -336,6 +396,25 @@ class AsyncConductorQuantum(AsyncBaseConductorQuantum):
         """Coda product line — circuit tools, QPU, and agents."""
         return self._coda
 
+    @property
+    def _coda(self) -> AsyncCodaClient:
+        if self._coda_client is None:
+            # Threads racing on first use must not each build (and leak) an httpx client.
+            with self._coda_lock:
+                if self._coda_client is None:
+                    from .coda._http import api_base_url_from_env
+                    from .coda.client import AsyncCodaClient
+
+                    self._coda_client = AsyncCodaClient(
+                        token=self._coda_token,
+                        base_url=self._coda_base_url or api_base_url_from_env(),
+                        timeout=self._coda_timeout,
+                        spill_to_disk=self._coda_spill_to_disk,
+                        coalesce_requests=self._coda_coalesce_requests,
+                        sdk_version=__version__,
+                    )
+        return self._coda_client
+
     # -- Backwards-compatible accessors (deprecated) --
 
     @property
@@ -350,7 +429,7 @@ class AsyncConductorQuantum(AsyncBaseConductorQuantum):
         return self._control.models
 
     @property
-    def model_results(self) -> AsyncModelResultsClient:  # type: ignore[override]
+    def model_results(self) -> AsyncExtendedModelResultsClient:  # type: ignore[override]
         """**Deprecated.** Use ``client.control.model_results`` instead."""
         # TODO(v2): Remove deprecated client.model_results accessor
         warnings.warn(
@@ -5,12 +5,16 @@ from __future__ import annotations
 import json
 import os
 import time
+import weakref
 from collections.abc import Callable, Generator
 from typing import Any, Union
 
 import httpx
 
 from conductorquantum.coda.errors import CodaAPIError, CodaAuthError, CodaTimeoutError
+from conductorquantum.core.coalescing import AsyncSingleflight, Singleflight, request_key
+from conductorquantum.core.compression import aread_response, read_response, with_accept_encoding
+from conductorquantum.core.json_codec import response_json
 
 DEFAULT_BASE_URL = "https://api.conductorquantum.com/v0/coda"
 DEFAULT_TIMEOUT = 120.0
@@ -97,7 +101,7 @@ def _raise_for_status(response: httpx.Response) -> None:
 
     status = response.status_code
     try:
-        body = response.json()
+        body = response_json(response)
     except Exception:
         body = None
 
@@ -131,7 +135,7 @@ def parse_json(response: httpx.Response) -> dict[str, Any]:
     """Parse response JSON, raising on error."""
     _raise_for_status(response)
     try:
-        result: dict[str, Any] = response.json()
+        result: dict[str, Any] = response_json(response)
     except json.JSONDecodeError as exc:
         raw = response.text or ""
         preview = raw[:400].replace("\n", "\\n")
@@ -159,6 +163,25 @@ def retry_delay(attempt: int) -> float:
     return delay
 
 
+# Clients whose identical in-flight GETs share one request, see :func:`enable_coalescing`.
+_sync_flights: weakref.WeakKeyDictionary[httpx.Client, Singleflight[httpx.Response]] = weakref.WeakKeyDictionary()
+_async_flights: weakref.WeakKeyDictionary[httpx.AsyncClient, AsyncSingleflight[httpx.Response]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def enable_coalescing(client: Union[httpx.Client, httpx.AsyncClient]) -> None:
+    """Coalesce identical GETs made concurrently through ``client`` by :func:`sync_request`/:func:`async_request`.
+
+    The Coda token is applied when a request is sent, so requests are only ever merged
+    with others made through the same client, i.e. with the same credentials.
+    """
+    if isinstance(client, httpx.AsyncClient):
+        _async_flights.setdefault(client, AsyncSingleflight())
+    else:
+        _sync_flights.setdefault(client, Singleflight())
+
+
 def sync_request(
     client: httpx.Client,
     method: str,
@@ -166,12 +189,35 @@ def sync_request(
     *,
     json: dict[str, Any] | None = None,
     max_retries: int = MAX_RETRIES,
+    spill_threshold: int | None = None,
+) -> httpx.Response:
+    """Make a sync HTTP request with retries; bodies over ``spill_threshold`` bytes are spilled to disk."""
+    flights = _sync_flights.get(client)
+    key = request_key(client.build_request(method, path, json=json)) if flights is not None else None
+    if flights is None or key is None:
+        return _sync_request(client, method, path, json=json, max_retries=max_retries, spill_threshold=spill_threshold)
+    return flights.do(
+        key,
+        lambda: _sync_request(
+            client, method, path, json=json, max_retries=max_retries, spill_threshold=spill_threshold
+        ),
+    )
+
+
+def _sync_request(
+    client: httpx.Client,
+    method: str,
+    path: str,
+    *,
+    json: dict[str, Any] | None,
+    max_retries: int,
+    spill_threshold: int | None,
 ) -> httpx.Response:
-    """Make a sync HTTP request with retries."""
     last_exc: Exception | None = None
     for attempt in range(max_retries + 1):
         try:
-            response = client.request(method, path, json=json)
+            request = client.build_request(method, path, json=json, headers=with_accept_encoding())
+            response = read_response(client.send(request, stream=True), spill_threshold)
             if _should_retry(response.status_code) and attempt < max_retries:
                 time.sleep(retry_delay(attempt))
                 continue
@@ -200,14 +246,39 @@ async def async_request(
     *,
     json: dict[str, Any] | None = None,
     max_retries: int = MAX_RETRIES,
+    spill_threshold: int | None = None,
+) -> httpx.Response:
+    """Make an async HTTP request with retries; bodies over ``spill_threshold`` bytes are spilled to disk."""
+    flights = _async_flights.get(client)
+    key = request_key(client.build_request(method, path, json=json)) if flights is not None else None
+    if flights is None or key is None:
+        return await _async_request(
+            client, method, path, json=json, max_retries=max_retries, spill_threshold=spill_threshold
+        )
+    return await flights.do(
+        key,
+        lambda: _async_request(
+            client, method, path, json=json, max_retries=max_retries, spill_threshold=spill_threshold
+        ),
+    )
+
+
+async def _async_request(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    *,
+    json: dict[str, Any] | None,
+    max_retries: int,
+    spill_threshold: int | None,
 ) -> httpx.Response:
-    """Make an async HTTP request with retries."""
     import asyncio
 
     last_exc: Exception | None = None
     for attempt in range(max_retries + 1):
         try:
-            response = await client.request(method, path, json=json)
+            request = client.build_request(method, path, json=json, headers=with_accept_encoding())
+            response = await aread_response(await client.send(request, stream=True), spill_threshold)
             if _should_retry(response.status_code) and attempt < max_retries:
                 await asyncio.sleep(retry_delay(attempt))
                 continue
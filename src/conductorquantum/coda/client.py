@@ -20,9 +20,11 @@ from conductorquantum.coda._http import (
     TokenLike,
     async_request,
     build_headers,
+    enable_coalescing,
     parse_json,
     sync_request,
 )
+from conductorquantum.core import compression, json_codec
 
 # ── Sync sub-clients ─────────────────────────────────────────────────────────
 
@@ -30,12 +32,19 @@ from conductorquantum.coda._http import (
 class CodaToolsClient:
     """Quantum circuit tools: transpile, simulate, convert, estimate, and split."""
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, spill_threshold: int | None = None) -> None:
         self._client = client
+        self._spill_threshold = spill_threshold
 
     def transpile(self, *, source_code: str, target: str) -> dict[str, Any]:
         """Transpile quantum code to a target framework."""
-        resp = sync_request(self._client, "POST", "/transpile", json={"source_code": source_code, "target": target})
+        resp = sync_request(
+            self._client,
+            "POST",
+            "/transpile",
+            json={"source_code": source_code, "target": target},
+            spill_threshold=self._spill_threshold,
+        )
         return parse_json(resp)
 
     def simulate(
@@ -51,30 +60,37 @@ class CodaToolsClient:
         body: dict[str, Any] = {"code": code, "method": method, "shots": shots, "backend": backend}
         if seed_simulator is not None:
             body["seed_simulator"] = seed_simulator
-        resp = sync_request(self._client, "POST", "/simulate", json=body)
+        resp = sync_request(self._client, "POST", "/simulate", json=body, spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     def to_openqasm3(self, *, code: str) -> dict[str, Any]:
         """Convert a quantum circuit to OpenQASM 3.0."""
-        resp = sync_request(self._client, "POST", "/to-openqasm3", json={"code": code})
+        resp = sync_request(
+            self._client, "POST", "/to-openqasm3", json={"code": code}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     def estimate_resources(self, *, code: str) -> dict[str, Any]:
         """Estimate resource requirements for a quantum circuit."""
-        resp = sync_request(self._client, "POST", "/estimate-resources", json={"code": code})
+        resp = sync_request(
+            self._client, "POST", "/estimate-resources", json={"code": code}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     def split_circuit(self, *, code: str) -> dict[str, Any]:
         """Split a circuit using circuit cutting."""
-        resp = sync_request(self._client, "POST", "/split-circuit", json={"code": code})
+        resp = sync_request(
+            self._client, "POST", "/split-circuit", json={"code": code}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
 
 class CodaQPUsClient:
     """QPU operations: submit jobs, check status, list devices, estimate cost."""
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, spill_threshold: int | None = None) -> None:
         self._client = client
+        self._spill_threshold = spill_threshold
 
     def run(
         self,
@@ -96,17 +112,19 @@ class CodaQPUsClient:
         }
         if braket_execution_mode_hint is not None:
             body["braket_execution_mode_hint"] = braket_execution_mode_hint
-        resp = sync_request(self._client, "POST", "/qpu/submit", json=body)
+        resp = sync_request(self._client, "POST", "/qpu/submit", json=body, spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     def status(self, *, job_id: str) -> dict[str, Any]:
         """Check status of a submitted QPU job."""
-        resp = sync_request(self._client, "POST", "/qpu/status", json={"job_id": job_id})
+        resp = sync_request(
+            self._client, "POST", "/qpu/status", json={"job_id": job_id}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     def list(self) -> dict[str, Any]:
         """List available QPU devices."""
-        resp = sync_request(self._client, "GET", "/qpu/devices")
+        resp = sync_request(self._client, "GET", "/qpu/devices", spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     def estimate_cost(
@@ -127,15 +145,18 @@ class CodaQPUsClient:
         }
         if braket_execution_mode_hint is not None:
             body["braket_execution_mode_hint"] = braket_execution_mode_hint
-        resp = sync_request(self._client, "POST", "/qpu/estimate-cost", json=body)
+        resp = sync_request(
+            self._client, "POST", "/qpu/estimate-cost", json=body, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
 
 class CodaAgentsClient:
     """Agent operations: chat (SSE) and list available modes."""
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, spill_threshold: int | None = None) -> None:
         self._client = client
+        self._spill_threshold = spill_threshold
 
     def run(
         self,
@@ -162,13 +183,13 @@ class CodaAgentsClient:
             for line in response.iter_lines():
                 if line.startswith("data: "):
                     try:
-                        yield json.loads(line[6:])
+                        yield json_codec.loads(line[6:])
                     except json.JSONDecodeError:
                         continue
 
     def list(self) -> dict[str, Any]:
         """List available agent modes."""
-        resp = sync_request(self._client, "GET", "/agents")
+        resp = sync_request(self._client, "GET", "/agents", spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     def __call__(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
@@ -187,13 +208,18 @@ class CodaAgentsClient:
 class AsyncCodaToolsClient:
     """Async quantum circuit tools: transpile, simulate, convert, estimate, and split."""
 
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(self, client: httpx.AsyncClient, spill_threshold: int | None = None) -> None:
         self._client = client
+        self._spill_threshold = spill_threshold
 
     async def transpile(self, *, source_code: str, target: str) -> dict[str, Any]:
         """Transpile quantum code to a target framework."""
         resp = await async_request(
-            self._client, "POST", "/transpile", json={"source_code": source_code, "target": target}
+            self._client,
+            "POST",
+            "/transpile",
+            json={"source_code": source_code, "target": target},
+            spill_threshold=self._spill_threshold,
         )
         return parse_json(resp)
 
@@ -210,30 +236,37 @@ class AsyncCodaToolsClient:
         body: dict[str, Any] = {"code": code, "method": method, "shots": shots, "backend": backend}
         if seed_simulator is not None:
             body["seed_simulator"] = seed_simulator
-        resp = await async_request(self._client, "POST", "/simulate", json=body)
+        resp = await async_request(self._client, "POST", "/simulate", json=body, spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     async def to_openqasm3(self, *, code: str) -> dict[str, Any]:
         """Convert a quantum circuit to OpenQASM 3.0."""
-        resp = await async_request(self._client, "POST", "/to-openqasm3", json={"code": code})
+        resp = await async_request(
+            self._client, "POST", "/to-openqasm3", json={"code": code}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     async def estimate_resources(self, *, code: str) -> dict[str, Any]:
         """Estimate resource requirements for a quantum circuit."""
-        resp = await async_request(self._client, "POST", "/estimate-resources", json={"code": code})
+        resp = await async_request(
+            self._client, "POST", "/estimate-resources", json={"code": code}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     async def split_circuit(self, *, code: str) -> dict[str, Any]:
         """Split a circuit using circuit cutting."""
-        resp = await async_request(self._client, "POST", "/split-circuit", json={"code": code})
+        resp = await async_request(
+            self._client, "POST", "/split-circuit", json={"code": code}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
 
 class AsyncCodaQPUsClient:
     """Async QPU operations: submit jobs, check status, list devices, estimate cost."""
 
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(self, client: httpx.AsyncClient, spill_threshold: int | None = None) -> None:
         self._client = client
+        self._spill_threshold = spill_threshold
 
     async def run(
         self,
@@ -255,17 +288,21 @@ class AsyncCodaQPUsClient:
         }
         if braket_execution_mode_hint is not None:
             body["braket_execution_mode_hint"] = braket_execution_mode_hint
-        resp = await async_request(self._client, "POST", "/qpu/submit", json=body)
+        resp = await async_request(
+            self._client, "POST", "/qpu/submit", json=body, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     async def status(self, *, job_id: str) -> dict[str, Any]:
         """Check status of a submitted QPU job."""
-        resp = await async_request(self._client, "POST", "/qpu/status", json={"job_id": job_id})
+        resp = await async_request(
+            self._client, "POST", "/qpu/status", json={"job_id": job_id}, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
     async def list(self) -> dict[str, Any]:
         """List available QPU devices."""
-        resp = await async_request(self._client, "GET", "/qpu/devices")
+        resp = await async_request(self._client, "GET", "/qpu/devices", spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     async def estimate_cost(
@@ -286,15 +323,18 @@ class AsyncCodaQPUsClient:
         }
         if braket_execution_mode_hint is not None:
             body["braket_execution_mode_hint"] = braket_execution_mode_hint
-        resp = await async_request(self._client, "POST", "/qpu/estimate-cost", json=body)
+        resp = await async_request(
+            self._client, "POST", "/qpu/estimate-cost", json=body, spill_threshold=self._spill_threshold
+        )
         return parse_json(resp)
 
 
 class AsyncCodaAgentsClient:
     """Async agent operations: chat (SSE) and list available modes."""
 
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(self, client: httpx.AsyncClient, spill_threshold: int | None = None) -> None:
         self._client = client
+        self._spill_threshold = spill_threshold
 
     async def run(
         self,
@@ -321,13 +361,13 @@ class AsyncCodaAgentsClient:
             async for line in response.aiter_lines():
                 if line.startswith("data: "):
                     try:
-                        yield json.loads(line[6:])
+                        yield json_codec.loads(line[6:])
                     except json.JSONDecodeError:
                         continue
 
     async def list(self) -> dict[str, Any]:
         """List available agent modes."""
-        resp = await async_request(self._client, "GET", "/agents")
+        resp = await async_request(self._client, "GET", "/agents", spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     def __call__(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
@@ -362,6 +402,8 @@ class CodaClient:
         token: TokenLike,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
+        spill_to_disk: compression.SpillToDisk = False,
+        coalesce_requests: bool = False,
         sdk_version: str = "0.0.0",
     ) -> None:
         self._client = httpx.Client(
@@ -370,9 +412,12 @@ class CodaClient:
             auth=CodaTokenAuth(token),
             timeout=timeout,
         )
-        self._tools = CodaToolsClient(self._client)
-        self._qpus = CodaQPUsClient(self._client)
-        self._agents = CodaAgentsClient(self._client)
+        self._spill_threshold = compression.spill_threshold(spill_to_disk)
+        if coalesce_requests:
+            enable_coalescing(self._client)
+        self._tools = CodaToolsClient(self._client, self._spill_threshold)
+        self._qpus = CodaQPUsClient(self._client, self._spill_threshold)
+        self._agents = CodaAgentsClient(self._client, self._spill_threshold)
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -397,7 +442,7 @@ class CodaClient:
 
     def health(self) -> dict[str, Any]:
         """Check API health."""
-        resp = sync_request(self._client, "GET", "/health")
+        resp = sync_request(self._client, "GET", "/health", spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     # === Deprecated methods (delegate to sub-clients) ===
@@ -546,6 +591,8 @@ class AsyncCodaClient:
         token: TokenLike,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
+        spill_to_disk: compression.SpillToDisk = False,
+        coalesce_requests: bool = False,
         sdk_version: str = "0.0.0",
     ) -> None:
         self._client = httpx.AsyncClient(
@@ -554,9 +601,12 @@ class AsyncCodaClient:
             auth=CodaTokenAuth(token),
             timeout=timeout,
         )
-        self._tools = AsyncCodaToolsClient(self._client)
-        self._qpus = AsyncCodaQPUsClient(self._client)
-        self._agents = AsyncCodaAgentsClient(self._client)
+        self._spill_threshold = compression.spill_threshold(spill_to_disk)
+        if coalesce_requests:
+            enable_coalescing(self._client)
+        self._tools = AsyncCodaToolsClient(self._client, self._spill_threshold)
+        self._qpus = AsyncCodaQPUsClient(self._client, self._spill_threshold)
+        self._agents = AsyncCodaAgentsClient(self._client, self._spill_threshold)
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -581,7 +631,7 @@ class AsyncCodaClient:
 
     async def health(self) -> dict[str, Any]:
         """Check API health."""
-        resp = await async_request(self._client, "GET", "/health")
+        resp = await async_request(self._client, "GET", "/health", spill_threshold=self._spill_threshold)
         return parse_json(resp)
 
     # === Deprecated methods (delegate to sub-clients) ===
@@ -17,7 +17,10 @@ import typing
 
 if typing.TYPE_CHECKING:
     from conductorquantum.agents.client import AgentsClient, AsyncAgentsClient
-    from conductorquantum.model_results.client import AsyncModelResultsClient, ModelResultsClient
+    from conductorquantum.model_results.extended_client import (
+        AsyncExtendedModelResultsClient,
+        ExtendedModelResultsClient,
+    )
     from conductorquantum.models.extended_client import AsyncExtendedModelsClient, ExtendedModelsClient
 
 
@@ -33,7 +36,7 @@ class ControlClient:
         self,
         *,
         models: ExtendedModelsClient,
-        model_results: ModelResultsClient,
+        model_results: ExtendedModelResultsClient,
         agents: AgentsClient,
     ) -> None:
         self._models = models
@@ -45,7 +48,7 @@ class ControlClient:
         return self._models
 
     @property
-    def model_results(self) -> ModelResultsClient:
+    def model_results(self) -> ExtendedModelResultsClient:
         return self._model_results
 
     @property
@@ -65,7 +68,7 @@ class AsyncControlClient:
         self,
         *,
         models: AsyncExtendedModelsClient,
-        model_results: AsyncModelResultsClient,
+        model_results: AsyncExtendedModelResultsClient,
         agents: AsyncAgentsClient,
     ) -> None:
         self._models = models
@@ -77,7 +80,7 @@ class AsyncControlClient:
         return self._models
 
     @property
-    def model_results(self) -> AsyncModelResultsClient:
+    def model_results(self) -> AsyncExtendedModelResultsClient:
         return self._model_results
 
     @property
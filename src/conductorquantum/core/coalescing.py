@@ -0,0 +1,103 @@
+"""Coalescing of identical in-flight GET requests ("singleflight").
+
+When several threads or tasks issue the same GET at the same moment, only the first
+one goes to the network; the others wait for it and receive the same
+:class:`httpx.Response`. The response body has already been read by then, so every
+caller can decode it on its own and none of them share mutable results. Only calls
+that overlap are coalesced; nothing is cached once the response has arrived.
+
+Requests are keyed on method, URL (including the query string) and headers, which
+carry the ``Authorization`` of the caller, so requests made with different tokens or
+per-request headers are never merged. Only ``GET`` and ``HEAD`` requests without a
+body are coalesced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import typing
+
+import httpx
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+RequestKey = typing.Tuple[str, str, typing.Tuple[typing.Tuple[str, str], ...]]
+_T = typing.TypeVar("_T")
+
+
+def request_key(request: httpx.Request) -> typing.Optional[RequestKey]:
+    """Return the key identical requests share, or ``None`` if ``request`` must not be coalesced."""
+    if request.method not in COALESCED_METHODS:
+        return None
+    if "transfer-encoding" in request.headers or request.headers.get("content-length", "0") != "0":
+        return None
+    headers = tuple(sorted((name.lower(), value) for name, value in request.headers.multi_items()))
+    return request.method, str(request.url), headers
+
+
+class _Call(typing.Generic[_T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: typing.Optional[_T] = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class Singleflight(typing.Generic[_T]):
+    """Run at most one call per key at a time across threads; concurrent callers share its outcome."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Hashable, _Call[_T]] = {}
+
+    def do(self, key: typing.Hashable, call: typing.Callable[[], _T]) -> _T:
+        """Return ``call()``, or the result of the identical call already in flight."""
+        with self._lock:
+            pending = self._calls.get(key)
+            if pending is None:
+                pending = self._calls[key] = _Call()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return typing.cast(_T, pending.result)
+        try:
+            pending.result = call()
+            return pending.result
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            pending.done.set()
+
+
+class AsyncSingleflight(typing.Generic[_T]):
+    """Run at most one call per key at a time across tasks; concurrent callers share its outcome.
+
+    The call runs in its own task, so cancelling one caller does not cancel the request
+    the others are waiting for.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[typing.Hashable, asyncio.Future[_T]] = {}
+
+    async def do(self, key: typing.Hashable, call: typing.Callable[[], typing.Awaitable[_T]]) -> _T:
+        """Return ``await call()``, or the result of the identical call already in flight."""
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(call())
+
+            def forget(finished: asyncio.Future[_T]) -> None:
+                if self._calls.get(key) is finished:
+                    del self._calls[key]
+                # Mark the outcome as retrieved even if every caller was cancelled.
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
@@ -0,0 +1,247 @@
+"""Response compression negotiation and streaming decompression.
+
+Requests read with :func:`read_response` advertise ``zstd`` and ``br`` ahead of
+``gzip``/``deflate`` whenever a decoder is installed (``zstandard``; ``brotli`` or
+``brotlicffi``); see :func:`with_accept_encoding`. httpx decodes those itself when it
+supports them; for older httpx releases that do not, the decoders here are applied to
+the raw stream instead. Responses consumed as a stream (file downloads, Coda agent
+events) are decoded by httpx alone, so those requests keep httpx's own
+``Accept-Encoding``, which lists only what it can decode.
+
+:func:`read_response` and :func:`aread_response` read a streamed response by
+decompressing chunk by chunk into a single growing buffer that becomes ``content``
+without a copy. ``httpx.Response.read`` joins a list of decoded chunks instead, which
+briefly holds the decompressed body twice.
+
+With a ``spill_threshold``, a body that grows past that many bytes is moved to an
+anonymous temporary file and the rest is streamed there. The response becomes a
+:class:`SpilledResponse`: the SDK decodes it from a read-only memory map of the file
+(see :func:`spilled_body`), so its pages are backed by disk instead of process memory,
+while ``content``, ``text`` and ``json()`` still behave as on any httpx response. The
+file has no name on POSIX (on Windows it is deleted on close) and disappears once the
+response is garbage-collected.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import importlib.util
+import io
+import mmap
+import tempfile
+import typing
+
+import httpx
+
+_PREFERRED_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+
+DEFAULT_SPILL_THRESHOLD = 64 * 2**20
+"""Body size, in bytes, above which ``spill_to_disk=True`` moves a response to a temporary file."""
+
+SpillToDisk = typing.Union[bool, int]
+
+
+class _Decoder(typing.Protocol):
+    def decompress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _BrotliDecoder:
+    def __init__(self) -> None:
+        # brotli and brotlicffi both expose Decompressor, under process() and decompress().
+        module = importlib.import_module("brotli" if importlib.util.find_spec("brotli") else "brotlicffi")
+        self._decompressor = module.Decompressor()
+        self._process = getattr(self._decompressor, "process", None) or self._decompressor.decompress
+
+    def decompress(self, data: bytes) -> bytes:
+        return typing.cast(bytes, self._process(data))
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _ZstdDecoder:
+    def __init__(self) -> None:
+        self._decompressor = importlib.import_module("zstandard").ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return typing.cast(bytes, self._decompressor.decompress(data))
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def _httpx_decoders() -> typing.Collection[str]:
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:
+        return ("gzip", "deflate")
+    return SUPPORTED_DECODERS.keys()
+
+
+@functools.lru_cache(maxsize=None)
+def _fallback_decoders() -> typing.Dict[str, typing.Callable[[], _Decoder]]:
+    """Decoders for encodings the installed httpx cannot decode itself."""
+    available: typing.Dict[str, typing.Callable[[], _Decoder]] = {}
+    httpx_decoders = _httpx_decoders()
+    if "zstd" not in httpx_decoders and importlib.util.find_spec("zstandard"):
+        available["zstd"] = _ZstdDecoder
+    if "br" not in httpx_decoders and (importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")):
+        available["br"] = _BrotliDecoder
+    return available
+
+
+@functools.lru_cache(maxsize=None)
+def accept_encoding() -> str:
+    """The ``Accept-Encoding`` value to send, best codec first."""
+    decodable = set(_httpx_decoders()) | set(_fallback_decoders())
+    return ", ".join(encoding for encoding in _PREFERRED_ENCODINGS if encoding in decodable)
+
+
+def with_accept_encoding(headers: typing.Optional[typing.Mapping[str, str]] = None) -> httpx.Headers:
+    """``headers`` plus ``Accept-Encoding: accept_encoding()``, unless they already set one.
+
+    Only for requests whose response is read with :func:`read_response` or
+    :func:`aread_response`, which apply the fallback decoders.
+    """
+    merged = httpx.Headers(headers)
+    merged.setdefault("Accept-Encoding", accept_encoding())
+    return merged
+
+
+def _fallback_decoder(response: httpx.Response) -> typing.Optional[_Decoder]:
+    encoding = response.headers.get("content-encoding", "").strip().lower()
+    factory = _fallback_decoders().get(encoding)
+    return factory() if factory is not None else None
+
+
+def spill_threshold(spill_to_disk: typing.Optional[SpillToDisk]) -> typing.Optional[int]:
+    """Resolve a ``spill_to_disk`` setting: ``True`` uses :data:`DEFAULT_SPILL_THRESHOLD`, an int is the threshold."""
+    if spill_to_disk is None or spill_to_disk is False:
+        return None
+    if spill_to_disk is True:
+        return DEFAULT_SPILL_THRESHOLD
+    if spill_to_disk < 0:
+        raise ValueError("spill_to_disk must be True, False or a non-negative number of bytes.")
+    return spill_to_disk
+
+
+class SpilledResponse(httpx.Response):
+    """A response whose body :func:`read_response` spilled to a memory-mapped temporary file.
+
+    ``content`` copies the body into memory on first use, since httpx callers expect
+    ``bytes``; the SDK's own decoders read the mapping through :func:`spilled_body`.
+    """
+
+    _spilled: memoryview
+
+    @property
+    def content(self) -> bytes:
+        if not hasattr(self, "_content"):
+            self._content = bytes(self._spilled)
+        return self._content
+
+    def read(self) -> bytes:
+        return self.content
+
+    async def aread(self) -> bytes:
+        return self.content
+
+
+def spilled_body(response: httpx.Response) -> typing.Optional[memoryview]:
+    """The memory-mapped body of a spilled response, or ``None`` if it was read into memory."""
+    return response._spilled if isinstance(response, SpilledResponse) else None
+
+
+class _ResponseBuffer:
+    """Collects a response body in memory, moving it to a temporary file past ``threshold`` bytes."""
+
+    def __init__(self, threshold: typing.Optional[int]) -> None:
+        self._threshold = threshold
+        self._buffer = io.BytesIO()
+        self._file: typing.Optional[typing.IO[bytes]] = None
+
+    def write(self, chunk: bytes) -> None:
+        if self._file is not None:
+            self._file.write(chunk)
+            return
+        self._buffer.write(chunk)
+        if self._threshold is not None and self._buffer.tell() > self._threshold:
+            self._file = tempfile.TemporaryFile()
+            self._file.write(self._buffer.getbuffer())
+            self._buffer = io.BytesIO()
+
+    def content(self) -> typing.Union[bytes, memoryview]:
+        """The collected body: the in-memory bytes, or a read-only view of the mapped file."""
+        if self._file is None:
+            # BytesIO hands over its internal bytes object instead of copying it.
+            return self._buffer.getvalue()
+        with self._file:
+            self._file.flush()
+            # The mapping keeps the file's pages reachable after it is closed.
+            return memoryview(mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _set_body(response: httpx.Response, content: typing.Union[bytes, memoryview]) -> None:
+    if isinstance(content, memoryview):
+        response.__class__ = SpilledResponse
+        typing.cast(SpilledResponse, response)._spilled = content
+    else:
+        response._content = content
+
+
+def read_response(response: httpx.Response, spill_threshold: typing.Optional[int] = None) -> httpx.Response:
+    """Read a response opened with ``stream=True``, decompressing as chunks arrive.
+
+    Bodies larger than ``spill_threshold`` bytes are spilled to a memory-mapped temporary file.
+    """
+    if response.is_stream_consumed:
+        response.read()
+        return response
+    buffer = _ResponseBuffer(spill_threshold)
+    try:
+        decoder = _fallback_decoder(response)
+        if decoder is None:
+            for chunk in response.iter_bytes():
+                buffer.write(chunk)
+        else:
+            for chunk in response.iter_raw():
+                buffer.write(decoder.decompress(chunk))
+            buffer.write(decoder.flush())
+    except BaseException:
+        buffer.discard()
+        raise
+    finally:
+        response.close()
+    _set_body(response, buffer.content())
+    return response
+
+
+async def aread_response(response: httpx.Response, spill_threshold: typing.Optional[int] = None) -> httpx.Response:
+    """Async variant of :func:`read_response`."""
+    if response.is_stream_consumed:
+        await response.aread()
+        return response
+    buffer = _ResponseBuffer(spill_threshold)
+    try:
+        decoder = _fallback_decoder(response)
+        if decoder is None:
+            async for chunk in response.aiter_bytes():
+                buffer.write(chunk)
+        else:
+            async for chunk in response.aiter_raw():
+                buffer.write(decoder.decompress(chunk))
+            buffer.write(decoder.flush())
+    except BaseException:
+        buffer.discard()
+        raise
+    finally:
+        await response.aclose()
+    _set_body(response, buffer.content())
+    return response
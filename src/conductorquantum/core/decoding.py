@@ -0,0 +1,205 @@
+"""Fast decoding of API responses into the generated pydantic types.
+
+:func:`parse_obj_as` is a drop-in for ``pydantic_utilities.parse_obj_as`` (which is
+generated and left untouched) used by the handwritten clients. It reuses one
+``TypeAdapter`` per type instead of compiling a validator per call, skips the
+dealiasing walk for types that declare no aliases, and with ``decode_mode="trusted"``
+builds models without validation via :func:`construct_obj_as`.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import inspect
+import typing
+
+import pydantic
+import typing_extensions
+from .pydantic_utilities import (
+    IS_PYDANTIC_V2,
+    _get_model_fields,
+    get_args,
+    get_origin,
+    is_union,
+    parse_date,
+    parse_datetime,
+)
+from .serialization import FieldMetadata, convert_and_respect_annotation_metadata, get_alias_to_field_mapping
+
+T = typing.TypeVar("T")
+
+# "validate" runs full pydantic validation on every response (the default).
+# "trusted" builds models with `model_construct`, skipping validation; only use it
+# for payloads that come straight from the API and are known to match the schema.
+DecodeMode = typing_extensions.Literal["validate", "trusted"]
+
+
+def parse_obj_as(type_: typing.Type[T], object_: typing.Any, *, decode_mode: DecodeMode = "validate") -> T:
+    if decode_mode == "trusted":
+        return typing.cast(T, construct_obj_as(type_, object_))
+    dealiased_object = (
+        convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
+        if _declares_aliases(type_)
+        else object_
+    )
+    if IS_PYDANTIC_V2:
+        return typing.cast(T, get_type_adapter(type_).validate_python(dealiased_object))
+    return pydantic.parse_obj_as(type_, dealiased_object)
+
+
+_TYPE_ADAPTERS: typing.Dict[typing.Any, typing.Any] = {}
+
+
+def get_type_adapter(type_: typing.Any) -> typing.Any:
+    """
+    Return the pydantic v2 `TypeAdapter` for `type_`, building it on first use.
+
+    Building an adapter compiles a validator, which costs far more than validating a typical
+    response, so adapters are kept for the life of the process. Response types are a small,
+    fixed set, so the cache does not need eviction.
+    """
+    try:
+        adapter = _TYPE_ADAPTERS.get(type_)
+    except TypeError:
+        # Annotated metadata can make a type unhashable; such types are simply not cached.
+        return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+    if adapter is None:
+        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+        _TYPE_ADAPTERS[type_] = adapter
+    return adapter
+
+
+_DECLARES_ALIASES: typing.Dict[typing.Any, bool] = {}
+
+
+def _declares_aliases(type_: typing.Any) -> bool:
+    # Dealiasing walks the whole payload and re-reads type hints for every nested model, so it
+    # is skipped for types that declare no `FieldMetadata` aliases anywhere in their tree.
+    try:
+        declares = _DECLARES_ALIASES.get(type_)
+    except TypeError:
+        return True
+    if declares is None:
+        declares = _find_aliases(type_, set())
+        _DECLARES_ALIASES[type_] = declares
+    return declares
+
+
+def _find_aliases(type_: typing.Any, seen: typing.Set[int]) -> bool:
+    if id(type_) in seen:
+        return False
+    seen.add(id(type_))
+    if get_origin(type_) is typing_extensions.Annotated and any(
+        isinstance(arg, FieldMetadata) for arg in get_args(type_)[1:]
+    ):
+        return True
+    if inspect.isclass(type_) and (issubclass(type_, pydantic.BaseModel) or typing_extensions.is_typeddict(type_)):
+        try:
+            hints = typing_extensions.get_type_hints(type_, include_extras=True)
+        except NameError:
+            return True
+        return any(_find_aliases(hint, seen) for hint in hints.values() if get_origin(hint) is not typing.ClassVar)
+    return any(_find_aliases(arg, seen) for arg in get_args(type_))
+
+
+def construct_obj_as(type_: typing.Any, object_: typing.Any) -> typing.Any:
+    """
+    Build `type_` from already-decoded JSON without running validation.
+
+    Nested models are created with `model_construct`, aliases are still respected and
+    datetime fields are parsed from their ISO strings, so the result has the same shape
+    as `parse_obj_as`. Values are otherwise taken as-is, so malformed payloads are not
+    rejected.
+    """
+    return _constructor_for(type_)(object_)
+
+
+_Constructor = typing.Callable[[typing.Any], typing.Any]
+
+
+def _identity(object_: typing.Any) -> typing.Any:
+    return object_
+
+
+_CONSTRUCTORS: typing.Dict[typing.Any, _Constructor] = {}
+
+
+def _constructor_for(type_: typing.Any) -> _Constructor:
+    # Type introspection happens once per type; decoding a payload only runs the returned closures.
+    constructor = _CONSTRUCTORS.get(type_)
+    if constructor is None:
+        # Register a forwarding stub first so self-referencing models do not recurse forever.
+        _CONSTRUCTORS[type_] = lambda object_: _CONSTRUCTORS[type_](object_)
+        constructor = _build_constructor(type_)
+        _CONSTRUCTORS[type_] = constructor
+    return constructor
+
+
+def _build_constructor(type_: typing.Any) -> _Constructor:
+    origin = get_origin(type_)
+    if origin is typing_extensions.Annotated:
+        return _constructor_for(get_args(type_)[0])
+    if inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel):
+        return _model_constructor(type_)
+    if type_ is dt.datetime:
+        return _construct_datetime
+    if type_ is dt.date:
+        return lambda object_: parse_date(object_) if isinstance(object_, str) else object_
+    if origin in (list, typing.List):
+        item = _constructor_for(get_args(type_)[0]) if get_args(type_) else _identity
+        if item is _identity:
+            return _identity
+        return lambda object_: [item(value) for value in object_] if isinstance(object_, list) else object_
+    if origin in (dict, typing.Dict):
+        value_ = _constructor_for(get_args(type_)[1]) if get_args(type_) else _identity
+        if value_ is _identity:
+            return _identity
+        return lambda object_: (
+            {key: value_(value) for key, value in object_.items()} if isinstance(object_, dict) else object_
+        )
+    if is_union(origin):
+        members = [member for member in get_args(type_) if member is not type(None)]
+        if len(members) == 1:
+            member = _constructor_for(members[0])
+            if member is _identity:
+                return _identity
+            return lambda object_: None if object_ is None else member(object_)
+    return _identity
+
+
+def _construct_datetime(object_: typing.Any) -> typing.Any:
+    if not isinstance(object_, str):
+        return object_
+    try:
+        # The C parser accepts the ISO 8601 timestamps the API returns and is far cheaper than regex parsing.
+        return dt.datetime.fromisoformat(object_)
+    except ValueError:
+        return parse_datetime(object_)
+
+
+def _model_constructor(model: typing.Type[pydantic.BaseModel]) -> _Constructor:
+    aliases = get_alias_to_field_mapping(model)
+    fields: typing.Dict[str, typing.Tuple[str, _Constructor]] = {}
+    for name, field in _get_model_fields(model).items():
+        annotation = field.annotation if IS_PYDANTIC_V2 else field.outer_type_  # type: ignore[union-attr]
+        fields[name] = (name, _constructor_for(annotation))
+    for alias, name in aliases.items():
+        if name in fields:
+            fields[alias] = fields[name]
+    # Skip UniversalBaseModel.construct, which would walk the object again to dealias it.
+    construct = (
+        pydantic.BaseModel.model_construct.__func__  # type: ignore[attr-defined]
+        if IS_PYDANTIC_V2
+        else pydantic.BaseModel.construct.__func__  # type: ignore[attr-defined]
+    )
+
+    def _construct(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, typing.Mapping):
+            return object_
+        values: typing.Dict[str, typing.Any] = {}
+        for key, value in object_.items():
+            name, constructor = fields.get(key, (key, _identity))
+            values[name] = value if value is None else constructor(value)
+        return construct(model, **values)
+
+    return _construct
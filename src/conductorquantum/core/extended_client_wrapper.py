@@ -0,0 +1,92 @@
+"""Client wrappers that carry the SDK's own client settings next to the generated ones.
+
+``decode_mode``, ``spill_to_disk`` and ``coalesce_requests`` are read here, with
+per-request overrides from :class:`~.extended_request_options.ExtendedRequestOptions`,
+and the wrappers send requests through :mod:`.extended_http_client`.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import httpx
+from .client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .compression import SpillToDisk, spill_threshold
+from .decoding import DecodeMode
+from .extended_http_client import AsyncExtendedHttpClient, ExtendedHttpClient
+from .extended_request_options import AnyRequestOptions, ExtendedRequestOptions
+
+
+class _ClientSettings:
+    _decode_mode: DecodeMode
+    _spill_to_disk: SpillToDisk
+    _coalesce_requests: bool
+
+    def get_decode_mode(self, request_options: typing.Optional[AnyRequestOptions] = None) -> DecodeMode:
+        options = typing.cast(ExtendedRequestOptions, request_options or {})
+        decode_mode = options.get("decode_mode")
+        return self._decode_mode if decode_mode is None else decode_mode
+
+    def get_spill_threshold(self, request_options: typing.Optional[AnyRequestOptions] = None) -> typing.Optional[int]:
+        options = typing.cast(ExtendedRequestOptions, request_options or {})
+        spill_to_disk = options.get("spill_to_disk")
+        return spill_threshold(self._spill_to_disk if spill_to_disk is None else spill_to_disk)
+
+    def get_coalesce_requests(self, request_options: typing.Optional[AnyRequestOptions] = None) -> bool:
+        options = typing.cast(ExtendedRequestOptions, request_options or {})
+        coalesce_requests = options.get("coalesce_requests")
+        return self._coalesce_requests if coalesce_requests is None else coalesce_requests
+
+
+class ExtendedSyncClientWrapper(_ClientSettings, SyncClientWrapper):
+    def __init__(
+        self,
+        *,
+        token: typing.Union[str, typing.Callable[[], str]],
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        base_url: str,
+        timeout: typing.Optional[float] = None,
+        httpx_client: httpx.Client,
+        decode_mode: DecodeMode = "validate",
+        spill_to_disk: SpillToDisk = False,
+        coalesce_requests: bool = False,
+    ):
+        super().__init__(token=token, headers=headers, base_url=base_url, timeout=timeout, httpx_client=httpx_client)
+        self._decode_mode = decode_mode
+        self._spill_to_disk = spill_to_disk
+        self._coalesce_requests = coalesce_requests
+        self.httpx_client = ExtendedHttpClient(
+            httpx_client=httpx_client,
+            base_headers=self.get_headers,
+            base_timeout=self.get_timeout,
+            base_url=self.get_base_url,
+            spill_threshold=self.get_spill_threshold,
+            coalesce_requests=self.get_coalesce_requests,
+        )
+
+
+class AsyncExtendedClientWrapper(_ClientSettings, AsyncClientWrapper):
+    def __init__(
+        self,
+        *,
+        token: typing.Union[str, typing.Callable[[], str]],
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        base_url: str,
+        timeout: typing.Optional[float] = None,
+        httpx_client: httpx.AsyncClient,
+        decode_mode: DecodeMode = "validate",
+        spill_to_disk: SpillToDisk = False,
+        coalesce_requests: bool = False,
+    ):
+        super().__init__(token=token, headers=headers, base_url=base_url, timeout=timeout, httpx_client=httpx_client)
+        self._decode_mode = decode_mode
+        self._spill_to_disk = spill_to_disk
+        self._coalesce_requests = coalesce_requests
+        self.httpx_client = AsyncExtendedHttpClient(
+            httpx_client=httpx_client,
+            base_headers=self.get_headers,
+            base_timeout=self.get_timeout,
+            base_url=self.get_base_url,
+            spill_threshold=self.get_spill_threshold,
+            coalesce_requests=self.get_coalesce_requests,
+        )
@@ -0,0 +1,145 @@
+"""HTTP clients that read responses through core/compression.py and coalesce identical GETs.
+
+The generated ``HttpClient.request`` builds its arguments and calls
+``httpx_client.request``. :class:`ExtendedHttpClient` puts a sender in front of the
+httpx client for that call: it sends the request with ``stream=True``, reads the body
+with :func:`~.compression.read_response` (decompressing it chunk by chunk and spilling
+large bodies to disk), and lets identical GETs in flight at the same time share one
+response (see core/coalescing.py). Every other use of the httpx client, such as the
+generated ``stream()``, reaches it unchanged.
+
+The generated code does not forward ``request_options`` to the httpx client, so the
+options of the current call are handed to the sender in a context variable.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import typing
+
+import httpx
+from .coalescing import AsyncSingleflight, Singleflight, request_key
+from .compression import aread_response, read_response, with_accept_encoding
+from .extended_request_options import AnyRequestOptions
+from .http_client import AsyncHttpClient, HttpClient
+
+_T = typing.TypeVar("_T")
+OptionGetter = typing.Callable[[typing.Optional[AnyRequestOptions]], _T]
+
+_REQUEST_OPTIONS: contextvars.ContextVar[typing.Optional[AnyRequestOptions]] = contextvars.ContextVar(
+    "conductorquantum_request_options", default=None
+)
+
+
+class _Sender:
+    """Stands in for the httpx client; ``request`` reads the body through core/compression.py."""
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        spill_threshold: OptionGetter[typing.Optional[int]],
+        coalesce_requests: OptionGetter[bool],
+    ) -> None:
+        self._client = client
+        self._spill_threshold = spill_threshold
+        self._coalesce_requests = coalesce_requests
+        self._singleflight: Singleflight[httpx.Response] = Singleflight()
+
+    def request(self, **kwargs: typing.Any) -> httpx.Response:
+        options = _REQUEST_OPTIONS.get()
+        threshold = self._spill_threshold(options)
+        request = self._client.build_request(**{**kwargs, "headers": with_accept_encoding(kwargs.get("headers"))})
+
+        def send() -> httpx.Response:
+            return read_response(self._client.send(request, stream=True), threshold)
+
+        key = request_key(request) if self._coalesce_requests(options) else None
+        return send() if key is None else self._singleflight.do(key, send)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._client, name)
+
+
+class _AsyncSender:
+    """Async variant of :class:`_Sender`."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        spill_threshold: OptionGetter[typing.Optional[int]],
+        coalesce_requests: OptionGetter[bool],
+    ) -> None:
+        self._client = client
+        self._spill_threshold = spill_threshold
+        self._coalesce_requests = coalesce_requests
+        self._singleflight: AsyncSingleflight[httpx.Response] = AsyncSingleflight()
+
+    async def request(self, **kwargs: typing.Any) -> httpx.Response:
+        options = _REQUEST_OPTIONS.get()
+        threshold = self._spill_threshold(options)
+        request = self._client.build_request(**{**kwargs, "headers": with_accept_encoding(kwargs.get("headers"))})
+
+        async def send() -> httpx.Response:
+            return await aread_response(await self._client.send(request, stream=True), threshold)
+
+        key = request_key(request) if self._coalesce_requests(options) else None
+        return await send() if key is None else await self._singleflight.do(key, send)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._client, name)
+
+
+class ExtendedHttpClient(HttpClient):
+    """``HttpClient`` whose buffered requests honour ``spill_to_disk`` and ``coalesce_requests``."""
+
+    def __init__(
+        self,
+        *,
+        httpx_client: httpx.Client,
+        base_timeout: typing.Callable[[], typing.Optional[float]],
+        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_url: typing.Optional[typing.Callable[[], str]] = None,
+        spill_threshold: OptionGetter[typing.Optional[int]],
+        coalesce_requests: OptionGetter[bool],
+    ):
+        super().__init__(
+            httpx_client=typing.cast(httpx.Client, _Sender(httpx_client, spill_threshold, coalesce_requests)),
+            base_timeout=base_timeout,
+            base_headers=base_headers,
+            base_url=base_url,
+        )
+
+    def request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Response:
+        token = _REQUEST_OPTIONS.set(kwargs.get("request_options"))
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            _REQUEST_OPTIONS.reset(token)
+
+
+class AsyncExtendedHttpClient(AsyncHttpClient):
+    """Async variant of :class:`ExtendedHttpClient`."""
+
+    def __init__(
+        self,
+        *,
+        httpx_client: httpx.AsyncClient,
+        base_timeout: typing.Callable[[], typing.Optional[float]],
+        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_url: typing.Optional[typing.Callable[[], str]] = None,
+        spill_threshold: OptionGetter[typing.Optional[int]],
+        coalesce_requests: OptionGetter[bool],
+    ):
+        super().__init__(
+            httpx_client=typing.cast(httpx.AsyncClient, _AsyncSender(httpx_client, spill_threshold, coalesce_requests)),
+            base_timeout=base_timeout,
+            base_headers=base_headers,
+            base_url=base_url,
+        )
+
+    async def request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Response:
+        token = _REQUEST_OPTIONS.set(kwargs.get("request_options"))
+        try:
+            return await super().request(*args, **kwargs)
+        finally:
+            _REQUEST_OPTIONS.reset(token)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import typing
+
+from .compression import SpillToDisk
+from .decoding import DecodeMode
+from .request_options import RequestOptions
+
+try:
+    from typing import NotRequired  # type: ignore
+except ImportError:
+    from typing_extensions import NotRequired
+
+
+class ExtendedRequestOptions(RequestOptions, total=False):
+    """
+    :class:`RequestOptions` plus the per-request overrides of the SDK's own client settings.
+    They are read by the handwritten clients and by ``ExtendedHttpClient``; the generated
+    code passes them through untouched.
+
+    Attributes:
+        - decode_mode: DecodeMode. How successful responses are turned into models. "validate" runs full pydantic validation, "trusted" skips it for faster decoding of large payloads. Overrides the client's `decode_mode` for this request.
+
+        - spill_to_disk: Union[bool, int]. Stream response bodies larger than this many bytes (64 MiB for `True`) into a temporary file and parse them from a memory map of it. Overrides the client's `spill_to_disk` for this request.
+
+        - coalesce_requests: bool. Let this GET share the response of an identical GET already in flight from another thread or task. Overrides the client's `coalesce_requests` for this request.
+    """
+
+    decode_mode: NotRequired[DecodeMode]
+    spill_to_disk: NotRequired[SpillToDisk]
+    coalesce_requests: NotRequired[bool]
+
+
+# The handwritten clients accept either options type. A union (rather than
+# ExtendedRequestOptions alone) keeps their overrides of generated methods compatible
+# with the generated signatures.
+AnyRequestOptions = typing.Union[RequestOptions, ExtendedRequestOptions]
@@ -0,0 +1,104 @@
+"""JSON decoding for API responses, using the fastest codec that is installed.
+
+``orjson`` is preferred, then ``msgspec``, then the standard library. The codec is
+resolved on first use so importing the SDK never pays for it. Set
+``CONDUCTORQUANTUM_JSON_CODEC`` (``orjson``, ``msgspec`` or ``json``) or call
+:func:`set_json_codec` to pin one.
+
+Every codec raises :class:`json.JSONDecodeError` on bad input, so callers keep
+catching the same exception regardless of which codec is active. Integers wider
+than 64 bits are the one known difference: depending on its version, orjson
+rejects them (the standard library then decodes the document) or widens them
+to floats. The API does not return such values.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import typing
+
+import httpx
+from .compression import spilled_body
+
+JSON_CODECS = ("orjson", "msgspec", "json")
+JSON_CODEC_ENV_VAR = "CONDUCTORQUANTUM_JSON_CODEC"
+
+_JsonInput = typing.Union[str, bytes, bytearray, memoryview]
+_Decoder = typing.Callable[[_JsonInput], typing.Any]
+
+_codec: typing.Optional[typing.Tuple[str, _Decoder]] = None
+
+
+def _load_decoder(name: str) -> typing.Optional[_Decoder]:
+    if name == "json":
+        return json.loads
+    if name not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of {', '.join(JSON_CODECS)}.")
+    # Optional dependencies are imported by name so type checkers do not require them.
+    try:
+        module = importlib.import_module("msgspec.json" if name == "msgspec" else name)
+    except ImportError:
+        return None
+    if name == "msgspec":
+        return typing.cast(_Decoder, module.Decoder().decode)
+    return typing.cast(_Decoder, module.loads)
+
+
+def _resolve_codec() -> typing.Tuple[str, _Decoder]:
+    global _codec
+    if _codec is None:
+        requested = os.environ.get(JSON_CODEC_ENV_VAR, "").strip()
+        for name in (requested,) if requested else JSON_CODECS:
+            decoder = _load_decoder(name)
+            if decoder is not None:
+                _codec = (name, decoder)
+                break
+        else:
+            raise ImportError(f"JSON codec {requested!r} requested via {JSON_CODEC_ENV_VAR} is not installed.")
+    return _codec
+
+
+def get_json_codec() -> str:
+    """Name of the codec used by :func:`loads`."""
+    return _resolve_codec()[0]
+
+
+def set_json_codec(name: typing.Optional[str]) -> None:
+    """Pin the JSON codec by name, or pass ``None`` to pick the fastest installed one again."""
+    global _codec
+    if name is None:
+        _codec = None
+        return
+    decoder = _load_decoder(name)
+    if decoder is None:
+        raise ImportError(f"JSON codec {name!r} is not installed.")
+    _codec = (name, decoder)
+
+
+def loads(data: _JsonInput) -> typing.Any:
+    """Decode a JSON document with the active codec."""
+    name, decoder = _resolve_codec()
+    if name == "json":
+        return json.loads(data if isinstance(data, (str, bytes, bytearray)) else bytes(data))
+    try:
+        return decoder(data)
+    except Exception:
+        # The fast codecs reject a few documents the standard library accepts (NaN, Infinity).
+        # Re-decoding with it keeps results identical and, for genuinely malformed input,
+        # raises the usual json.JSONDecodeError.
+        return json.loads(data if isinstance(data, (str, bytes, bytearray)) else bytes(data))
+
+
+def response_json(response: httpx.Response) -> typing.Any:
+    """Drop-in replacement for :meth:`httpx.Response.json` that uses the active codec.
+
+    Bodies spilled to disk by ``compression.read_response`` are decoded from their memory
+    map rather than copied into ``content``.
+    """
+    encoding = response.charset_encoding
+    if encoding is not None and encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+        return loads(response.text)
+    body = spilled_body(response)
+    return loads(response.content if body is None else body)
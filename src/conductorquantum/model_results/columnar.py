@@ -0,0 +1,202 @@
+"""Struct-of-arrays view of model result listings.
+
+A :class:`ResultSet` keeps a listing as one NumPy array per field instead of one
+pydantic object per result: ``id`` as an object array, ``model`` as integer codes
+into a small tuple of model names, ``created_at`` as ``datetime64[us]`` (UTC, without
+a timezone) and every field of ``output`` as its own column. Numeric output fields
+present in every result are stacked along axis 0; other fields are a list with one
+value per result. Filtering is plain NumPy indexing, e.g.
+``results[results.created_at >= np.datetime64("2025-01-01")]``.
+
+:meth:`ResultSet.to_pandas` and :meth:`ResultSet.to_arrow` hand the numeric and
+datetime columns over without copying; pandas and pyarrow are only imported there.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import importlib
+import typing
+
+import numpy as np
+from ..models.outputs import _stack
+
+if typing.TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+    import pyarrow as pa  # type: ignore
+
+Column = typing.Union[np.ndarray, typing.List[typing.Any]]
+Index = typing.Union[slice, np.ndarray, typing.Sequence[int], typing.Sequence[bool]]
+
+_UTC_SUFFIXES = ("Z", "+00:00")
+
+
+def _optional(name: str) -> typing.Any:
+    try:
+        # Optional dependency, imported by name so type checkers do not require it.
+        return importlib.import_module(name)
+    except ImportError as err:
+        raise ImportError(f"This conversion requires {name}; install it with `pip install {name}`.") from err
+
+
+def _utc_datetime64(values: typing.Sequence[str]) -> np.ndarray:
+    """Parse ISO 8601 timestamps into naive UTC ``datetime64[us]``."""
+    naive = []
+    for value in values:
+        for suffix in _UTC_SUFFIXES:
+            if value.endswith(suffix):
+                naive.append(value[: -len(suffix)])
+                break
+        else:
+            parsed = dt.datetime.fromisoformat(value)
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(dt.timezone.utc).replace(tzinfo=None)
+            naive.append(parsed.isoformat())
+    return np.array(naive, dtype="datetime64[us]")
+
+
+def _flatten(columns: typing.Mapping[str, typing.Any], prefix: str = "") -> typing.Dict[str, Column]:
+    flat: typing.Dict[str, Column] = {}
+    for name, column in columns.items():
+        if isinstance(column, dict):
+            flat.update(_flatten(column, f"{prefix}{name}."))
+        else:
+            flat[f"{prefix}{name}"] = column
+    return flat
+
+
+def _take(column: Column, index: typing.Any) -> Column:
+    if isinstance(column, np.ndarray):
+        return column[index]
+    positions = np.arange(len(column))[index]
+    return [column[position] for position in positions]
+
+
+def _concat_column(pieces: typing.Sequence[typing.Tuple[typing.Optional[Column], int]]) -> Column:
+    # Empty pages carry no fields and must not turn a stacked column into a list.
+    pieces = [(column, length) for column, length in pieces if length]
+    arrays = [column for column, _ in pieces if isinstance(column, np.ndarray)]
+    if len(arrays) == len(pieces) and len({array.shape[1:] for array in arrays}) == 1:
+        return np.concatenate(arrays)
+    values: typing.List[typing.Any] = []
+    for column, length in pieces:
+        values.extend([None] * length if column is None else list(column))
+    return values
+
+
+def _arrow_column(pa: typing.Any, column: Column) -> typing.Any:
+    if not isinstance(column, np.ndarray):
+        return pa.array([value.tolist() if isinstance(value, np.ndarray) else value for value in column])
+    array = pa.array(np.ascontiguousarray(column).reshape(-1))
+    for size in reversed(column.shape[1:]):
+        array = pa.FixedSizeListArray.from_arrays(array, size)
+    return array
+
+
+class ResultSet:
+    """Model results stored column by column; see the module docstring."""
+
+    def __init__(
+        self,
+        *,
+        id: np.ndarray,
+        model_codes: np.ndarray,
+        models: typing.Sequence[str],
+        created_at: np.ndarray,
+        output: typing.Mapping[str, Column],
+    ) -> None:
+        self.id = id
+        self.model_codes = model_codes
+        self.models = tuple(models)
+        self.created_at = created_at
+        self.output = dict(output)
+
+    @classmethod
+    def from_json(cls, items: typing.Sequence[typing.Mapping[str, typing.Any]]) -> ResultSet:
+        """Build a result set from the decoded JSON items of a ``model-results`` listing."""
+        names = [item["model"] for item in items]
+        models = list(dict.fromkeys(names))
+        lookup = {name: code for code, name in enumerate(models)}
+        outputs = [item.get("output") or {} for item in items]
+        return cls(
+            id=np.array([item["id"] for item in items], dtype=object),
+            model_codes=np.fromiter((lookup[name] for name in names), dtype=np.int32, count=len(names)),
+            models=models,
+            created_at=_utc_datetime64([item["created_at"] for item in items]),
+            output=_flatten(_stack(outputs)) if outputs else {},
+        )
+
+    @classmethod
+    def concat(cls, parts: typing.Iterable[ResultSet]) -> ResultSet:
+        """Join result sets, e.g. the pages from ``iter_all(columnar=True)``, into one."""
+        parts = list(parts)
+        if not parts:
+            return cls.from_json([])
+        models = list(dict.fromkeys(name for part in parts for name in part.models))
+        lookup = {name: code for code, name in enumerate(models)}
+        fields = dict.fromkeys(name for part in parts for name in part.output)
+        return cls(
+            id=np.concatenate([part.id for part in parts]),
+            model_codes=np.concatenate(
+                [np.array([lookup[name] for name in part.models], dtype=np.int32)[part.model_codes] for part in parts]
+            ),
+            models=models,
+            created_at=np.concatenate([part.created_at for part in parts]),
+            output={name: _concat_column([(part.output.get(name), len(part)) for part in parts]) for name in fields},
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        return f"ResultSet({len(self)} results, models={list(self.models)}, output fields={list(self.output)})"
+
+    @property
+    def model(self) -> np.ndarray:
+        """Model name of each result, as an object array."""
+        return np.array(self.models, dtype=object)[self.model_codes]
+
+    def __getitem__(self, index: Index) -> ResultSet:
+        """Select results with a slice, integer positions or a boolean mask."""
+        if not isinstance(index, slice):
+            index = np.asarray(index)
+        return ResultSet(
+            id=self.id[index],
+            model_codes=self.model_codes[index],
+            models=self.models,
+            created_at=self.created_at[index],
+            output={name: _take(column, index) for name, column in self.output.items()},
+        )
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Return a DataFrame with ``model`` as a categorical and output fields as ``output.<field>`` columns.
+
+        Numeric output fields with more than one dimension become object columns of
+        per-result array views.
+        """
+        pandas = _optional("pandas")
+        columns: typing.Dict[str, typing.Any] = {
+            "id": self.id,
+            "model": pandas.Categorical.from_codes(self.model_codes, categories=list(self.models)),
+            "created_at": self.created_at,
+        }
+        for name, column in self.output.items():
+            columns[f"output.{name}"] = (
+                column if not isinstance(column, np.ndarray) or column.ndim == 1 else list(column)
+            )
+        return pandas.DataFrame(columns, copy=False)
+
+    def to_arrow(self) -> pa.Table:
+        """Return a ``pyarrow.Table`` with ``model`` dictionary-encoded.
+
+        Numeric output fields with more than one dimension become nested fixed-size lists.
+        """
+        pa = _optional("pyarrow")
+        columns: typing.Dict[str, typing.Any] = {
+            "id": pa.array(self.id, type=pa.string()),
+            "model": pa.DictionaryArray.from_arrays(self.model_codes, pa.array(self.models, type=pa.string())),
+            "created_at": pa.array(self.created_at),
+        }
+        for name, column in self.output.items():
+            columns[f"output.{name}"] = _arrow_column(pa, column)
+        return pa.table(columns)
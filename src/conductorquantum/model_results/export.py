@@ -0,0 +1,194 @@
+"""Streaming export of model result listings to Parquet, Arrow IPC or JSON Lines files.
+
+Pages are fetched with ``skip``/``limit`` on background threads, up to ``prefetch``
+of them ahead of the writer, and each page is appended to the output file as soon as
+it arrives. Memory use is bounded by the pages in flight, whatever the size of the
+listing.
+
+``"jsonl"`` writes each result exactly as the API returned it, one per line. The
+Arrow formats convert each page with :meth:`ResultSet.to_arrow
+<conductorquantum.model_results.columnar.ResultSet.to_arrow>` and write it as one
+record batch (Parquet: one row group); they need pyarrow. Their schema is taken from
+the first page: later pages may leave output fields out, which are then written as
+nulls, but an output field the first page did not have, or one whose type changed, is
+an error, since Arrow and Parquet files have a single schema. For listings whose
+outputs vary, pass ``output="json"`` to store each result's output as one JSON string
+column instead of one column per field.
+
+The file is written under a temporary name next to ``path`` and renamed to ``path``
+once complete. If the export fails partway, only the temporary file is removed, so a
+file already at ``path`` is left as it was.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import os
+import typing
+import uuid
+
+from .columnar import ResultSet, _optional
+from .extended_client import prefetched_pages
+
+DEFAULT_EXPORT_PAGE_SIZE = 5000
+DEFAULT_EXPORT_PREFETCH = 2
+
+ExportFormat = typing.Literal["parquet", "arrow", "jsonl"]
+EXPORT_FORMATS: typing.Tuple[str, ...] = typing.get_args(ExportFormat)
+ExportOutput = typing.Literal["columns", "json"]
+EXPORT_OUTPUTS: typing.Tuple[str, ...] = typing.get_args(ExportOutput)
+
+Items = typing.List[typing.Dict[str, typing.Any]]
+
+
+class _JsonlWriter:
+    def __init__(self, path: typing.Union[str, os.PathLike[str]]) -> None:
+        self._path = path
+        self._temp_path = _temp_path(path)
+        self._file = open(self._temp_path, "x", encoding="utf-8")
+
+    def convert(self, items: Items) -> Items:
+        return items
+
+    def write(self, items: Items) -> int:
+        self._file.writelines(json.dumps(item, separators=(",", ":")) + "\n" for item in items)
+        return len(items)
+
+    def close(self) -> None:
+        _finish(self._file.close, self._temp_path, self._path)
+
+    def abort(self) -> None:
+        self._file.close()
+        _remove(self._temp_path)
+
+
+class _ArrowWriter:
+    def __init__(self, path: typing.Union[str, os.PathLike[str]], format: ExportFormat, output: ExportOutput) -> None:
+        self._pa = _optional("pyarrow")
+        self._path = path
+        self._temp_path = _temp_path(path)
+        self._format = format
+        self._output = output
+        self._writer: typing.Any = None
+        self._schema: typing.Any = None
+        self._pages = 0
+
+    def convert(self, items: Items) -> typing.Any:
+        if self._output == "json":
+            table = ResultSet.from_json([{**item, "output": None} for item in items]).to_arrow()
+            outputs = [None if item.get("output") is None else json.dumps(item["output"]) for item in items]
+            table = table.append_column("output", self._pa.array(outputs, type=self._pa.string()))
+        else:
+            table = ResultSet.from_json(items).to_arrow()
+        # Every page has its own dictionary of model names, and the IPC file format cannot
+        # replace a dictionary between batches; store plain strings (Parquet
+        # dictionary-encodes them on its own).
+        index = table.schema.get_field_index("model")
+        return table.set_column(index, "model", table.column(index).cast(self._pa.string()))
+
+    def _conform(self, table: typing.Any) -> typing.Any:
+        """Give a later page the schema of the first one, filling missing output fields with nulls."""
+        extra = [name for name in table.column_names if self._schema.get_field_index(name) < 0]
+        if extra:
+            raise ValueError(
+                f"Page {self._pages} has output fields the first page did not have: {extra}. "
+                "Export this listing with output='json' or as 'jsonl' instead."
+            )
+        columns = [
+            table.column(field.name)
+            if field.name in table.column_names
+            else self._pa.chunked_array([self._pa.nulls(table.num_rows, type=field.type)])
+            for field in self._schema
+        ]
+        try:
+            return self._pa.Table.from_arrays(columns, names=self._schema.names).cast(self._schema)
+        except self._pa.ArrowException as err:
+            raise ValueError(
+                f"Page {self._pages} does not fit the schema of the first page: {err}. "
+                "Export this listing with output='json' or as 'jsonl' instead."
+            ) from err
+
+    def write(self, table: typing.Any) -> int:
+        self._pages += 1
+        if self._writer is None:
+            self._schema = table.schema
+            if self._format == "parquet":
+                self._writer = _optional("pyarrow.parquet").ParquetWriter(self._temp_path, self._schema)
+            else:
+                self._writer = self._pa.ipc.new_file(self._temp_path, self._schema)
+        else:
+            table = self._conform(table)
+        if table.num_rows:
+            self._writer.write_table(table)
+        return int(table.num_rows)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            _finish(self._writer.close, self._temp_path, self._path)
+
+    def abort(self) -> None:
+        # The temporary file is only created with the first page.
+        if self._writer is not None:
+            self._writer.close()
+            _remove(self._temp_path)
+
+
+def _temp_path(path: typing.Union[str, os.PathLike[str]]) -> str:
+    """Return an unused name in the directory of ``path``, so the finished file can be renamed over it."""
+    directory, name = os.path.split(os.fspath(path))
+    return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+
+
+def _finish(close: typing.Callable[[], None], temp_path: str, path: typing.Union[str, os.PathLike[str]]) -> None:
+    """Close the temporary file and rename it to ``path``, or remove it if that fails."""
+    try:
+        close()
+        os.replace(temp_path, path)
+    except BaseException:
+        _remove(temp_path)
+        raise
+
+
+def _remove(path: typing.Union[str, os.PathLike[str]]) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def export_pages(
+    fetch_items: typing.Callable[[int], Items],
+    path: typing.Union[str, os.PathLike[str]],
+    *,
+    format: ExportFormat,
+    output: ExportOutput = "columns",
+    page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+    prefetch: int = DEFAULT_EXPORT_PREFETCH,
+) -> int:
+    """Write every page ``fetch_items(skip)`` returns to ``path``; return the number of results written.
+
+    ``output`` chooses how the Arrow formats store result outputs and is ignored for ``"jsonl"``.
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {format!r}; expected one of {', '.join(EXPORT_FORMATS)}.")
+    if output not in EXPORT_OUTPUTS:
+        raise ValueError(f"Unknown export output {output!r}; expected one of {', '.join(EXPORT_OUTPUTS)}.")
+    writer: typing.Union[_JsonlWriter, _ArrowWriter] = (
+        _JsonlWriter(path) if format == "jsonl" else _ArrowWriter(path, format, output)
+    )
+
+    def fetch(skip: int) -> typing.Tuple[int, typing.Any]:
+        # Fetch and convert on the prefetch thread, so only writing happens on the caller's.
+        items = fetch_items(skip)
+        return len(items), writer.convert(items)
+
+    written = 0
+    try:
+        for _, page in prefetched_pages(fetch, page_size=page_size, prefetch=prefetch, size=operator.itemgetter(0)):
+            written += writer.write(page)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return written
@@ -0,0 +1,705 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import os
+import typing
+from json.decoder import JSONDecodeError
+
+import httpx
+from ..core.api_error import ApiError
+from ..core.decoding import DecodeMode, parse_obj_as
+from ..core.extended_client_wrapper import AsyncExtendedClientWrapper, ExtendedSyncClientWrapper
+from ..core.extended_request_options import AnyRequestOptions
+from ..core.json_codec import response_json
+from ..core.jsonable_encoder import jsonable_encoder
+from ..errors.forbidden_error import ForbiddenError
+from ..errors.not_found_error import NotFoundError
+from ..errors.unprocessable_entity_error import UnprocessableEntityError
+from ..types.http_validation_error import HttpValidationError
+from ..types.model_result_public import ModelResultPublic
+from ..types.model_result_public_masked import ModelResultPublicMasked
+from ..types.vote_response import VoteResponse
+from .client import AsyncModelResultsClient, ModelResultsClient
+
+if typing.TYPE_CHECKING:
+    from .columnar import ResultSet
+    from .export import ExportFormat, ExportOutput
+    from .mirror import ResultsMirror
+
+# this is used as the default value for optional parameters
+OMIT = typing.cast(typing.Any, ...)
+
+DEFAULT_PAGE_SIZE = 1000
+
+_Page = typing.TypeVar("_Page")
+
+
+def _list_params(
+    *,
+    skip: typing.Optional[int],
+    limit: typing.Optional[int],
+    model_str_id: typing.Optional[str],
+    start_date: typing.Optional[str],
+    end_date: typing.Optional[str],
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "skip": skip,
+        "limit": limit,
+        "model_str_id": model_str_id,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+
+def _parse_list_response(response: httpx.Response) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Return the decoded JSON items of a listing, or raise the generated SDK errors."""
+    try:
+        if 200 <= response.status_code < 300:
+            return typing.cast(typing.List[typing.Dict[str, typing.Any]], response_json(response))
+        if response.status_code == 404:
+            raise NotFoundError(headers=dict(response.headers), body=response_json(response))
+        if response.status_code == 422:
+            raise UnprocessableEntityError(
+                headers=dict(response.headers),
+                body=typing.cast(
+                    HttpValidationError,
+                    parse_obj_as(
+                        type_=HttpValidationError,  # type: ignore
+                        object_=response_json(response),
+                    ),
+                ),
+            )
+        _response_json = response_json(response)
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=response.text)
+    raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=_response_json)
+
+
+def _parse_response(response: httpx.Response, type_: typing.Any, *, decode_mode: DecodeMode) -> typing.Any:
+    """Decode a response as ``type_`` or raise the generated SDK errors, as the generated client does."""
+    try:
+        if 200 <= response.status_code < 300:
+            return parse_obj_as(type_=type_, object_=response_json(response), decode_mode=decode_mode)
+        if response.status_code == 403:
+            raise ForbiddenError(
+                headers=dict(response.headers),
+                body=typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=response_json(response),
+                    ),
+                ),
+            )
+        if response.status_code == 404:
+            raise NotFoundError(
+                headers=dict(response.headers),
+                body=typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=response_json(response),
+                    ),
+                ),
+            )
+        if response.status_code == 422:
+            raise UnprocessableEntityError(
+                headers=dict(response.headers),
+                body=typing.cast(
+                    HttpValidationError,
+                    parse_obj_as(
+                        type_=HttpValidationError,  # type: ignore
+                        object_=response_json(response),
+                    ),
+                ),
+            )
+        _response_json = response_json(response)
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=response.text)
+    raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=_response_json)
+
+
+def prefetched_pages(
+    fetch: typing.Callable[[int], _Page],
+    *,
+    page_size: int,
+    prefetch: int,
+    size: typing.Callable[[_Page], int],
+) -> typing.Iterator[_Page]:
+    """Yield ``fetch(skip)`` for ``skip = 0, page_size, ...`` until ``size(page)`` comes back short.
+
+    Up to ``prefetch`` pages are fetched ahead on background threads; requests made
+    past the end of the listing are cancelled or discarded.
+    """
+    if page_size <= 0 or prefetch <= 0:
+        raise ValueError("page_size and prefetch must be positive.")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending: typing.Deque[concurrent.futures.Future[_Page]] = collections.deque()
+        skip = 0
+        try:
+            while True:
+                while len(pending) < prefetch:
+                    pending.append(executor.submit(fetch, skip))
+                    skip += page_size
+                page = pending.popleft().result()
+                yield page
+                if size(page) < page_size:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _result_set(items: typing.List[typing.Dict[str, typing.Any]]) -> ResultSet:
+    from .columnar import ResultSet
+
+    return ResultSet.from_json(items)
+
+
+class ExtendedModelResultsClient(ModelResultsClient):
+    """Model results client with columnar listings and automatic paging."""
+
+    def __init__(self, *, client_wrapper: ExtendedSyncClientWrapper) -> None:
+        super().__init__(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
+
+    def vote_on_model_result(
+        self,
+        result_id: str,
+        *,
+        vote: int,
+        feedback: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> VoteResponse:
+        response = self._client_wrapper.httpx_client.request(
+            f"model-results/{jsonable_encoder(result_id)}/vote",
+            method="PUT",
+            json={"vote": vote, "feedback": feedback},
+            headers={"content-type": "application/json"},
+            request_options=request_options,
+            omit=OMIT,
+        )
+        return typing.cast(
+            VoteResponse,
+            _parse_response(response, VoteResponse, decode_mode=self._client_wrapper.get_decode_mode(request_options)),
+        )
+
+    def remove_vote_on_model_result(
+        self, result_id: str, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Dict[str, str]:
+        response = self._client_wrapper.httpx_client.request(
+            f"model-results/{jsonable_encoder(result_id)}/vote",
+            method="DELETE",
+            request_options=request_options,
+        )
+        return typing.cast(
+            typing.Dict[str, str],
+            _parse_response(
+                response,
+                typing.Dict[str, str],
+                decode_mode=self._client_wrapper.get_decode_mode(request_options),
+            ),
+        )
+
+    def info(self, id: str, *, request_options: typing.Optional[AnyRequestOptions] = None) -> ModelResultPublic:
+        response = self._client_wrapper.httpx_client.request(
+            f"model-results/{jsonable_encoder(id)}",
+            method="GET",
+            request_options=request_options,
+        )
+        return typing.cast(
+            ModelResultPublic,
+            _parse_response(
+                response, ModelResultPublic, decode_mode=self._client_wrapper.get_decode_mode(request_options)
+            ),
+        )
+
+    def list(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.List[ModelResultPublicMasked]:
+        items = self._list_items(
+            skip=skip,
+            limit=limit,
+            model_str_id=model_str_id,
+            start_date=start_date,
+            end_date=end_date,
+            request_options=request_options,
+        )
+        return typing.cast(
+            typing.List[ModelResultPublicMasked],
+            parse_obj_as(
+                type_=typing.List[ModelResultPublicMasked],  # type: ignore
+                object_=items,
+                decode_mode=self._client_wrapper.get_decode_mode(request_options),
+            ),
+        )
+
+    def list_columnar(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> ResultSet:
+        """Like :meth:`list`, but decode the page into a columnar :class:`ResultSet`.
+
+        No pydantic model is built per result, so large listings take much less time
+        and memory. ``decode_mode`` does not apply.
+        """
+        return _result_set(
+            self._list_items(
+                skip=skip,
+                limit=limit,
+                model_str_id=model_str_id,
+                start_date=start_date,
+                end_date=end_date,
+                request_options=request_options,
+            )
+        )
+
+    def _list_items(
+        self,
+        *,
+        skip: typing.Optional[int],
+        limit: typing.Optional[int],
+        model_str_id: typing.Optional[str],
+        start_date: typing.Optional[str],
+        end_date: typing.Optional[str],
+        request_options: typing.Optional[AnyRequestOptions],
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        response = self._client_wrapper.httpx_client.request(
+            "model-results",
+            method="GET",
+            params=_list_params(
+                skip=skip, limit=limit, model_str_id=model_str_id, start_date=start_date, end_date=end_date
+            ),
+            request_options=request_options,
+        )
+        return _parse_list_response(response)
+
+    @typing.overload
+    def iter_all(
+        self,
+        *,
+        page_size: typing.Optional[int] = ...,
+        model_str_id: typing.Optional[str] = ...,
+        start_date: typing.Optional[str] = ...,
+        end_date: typing.Optional[str] = ...,
+        columnar: typing.Literal[False] = ...,
+        request_options: typing.Optional[AnyRequestOptions] = ...,
+    ) -> typing.Iterator[ModelResultPublicMasked]: ...
+
+    @typing.overload
+    def iter_all(
+        self,
+        *,
+        page_size: typing.Optional[int] = ...,
+        model_str_id: typing.Optional[str] = ...,
+        start_date: typing.Optional[str] = ...,
+        end_date: typing.Optional[str] = ...,
+        columnar: typing.Literal[True],
+        request_options: typing.Optional[AnyRequestOptions] = ...,
+    ) -> typing.Iterator[ResultSet]: ...
+
+    def iter_all(
+        self,
+        *,
+        page_size: typing.Optional[int] = None,
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        columnar: bool = False,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Iterator[typing.Any]:
+        """Page through every matching result with ``skip``/``limit``.
+
+        Yields each :class:`ModelResultPublicMasked`, or with ``columnar=True`` one
+        :class:`ResultSet` per page (join them with :meth:`ResultSet.concat`).
+        """
+        page_size = DEFAULT_PAGE_SIZE if page_size is None else page_size
+        if page_size <= 0:
+            raise ValueError("page_size must be positive.")
+        skip = 0
+        while True:
+            filters = dict(model_str_id=model_str_id, start_date=start_date, end_date=end_date)
+            page: typing.Sized
+            if columnar:
+                page = self.list_columnar(skip=skip, limit=page_size, request_options=request_options, **filters)
+                yield page
+            else:
+                page = self.list(skip=skip, limit=page_size, request_options=request_options, **filters)
+                yield from page
+            if len(page) < page_size:
+                return
+            skip += page_size
+
+    def _iter_item_pages(
+        self,
+        *,
+        page_size: int,
+        model_str_id: typing.Optional[str],
+        start_date: typing.Optional[str],
+        end_date: typing.Optional[str],
+        request_options: typing.Optional[AnyRequestOptions],
+    ) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+        skip = 0
+        while True:
+            page = self._list_items(
+                skip=skip,
+                limit=page_size,
+                model_str_id=model_str_id,
+                start_date=start_date,
+                end_date=end_date,
+                request_options=request_options,
+            )
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            skip += page_size
+
+    @typing.overload
+    def iter_sharded(
+        self,
+        *,
+        start_date: str,
+        end_date: str,
+        model_str_id: typing.Optional[str] = ...,
+        shards: typing.Optional[int] = ...,
+        max_workers: typing.Optional[int] = ...,
+        page_size: typing.Optional[int] = ...,
+        columnar: typing.Literal[False] = ...,
+        request_options: typing.Optional[AnyRequestOptions] = ...,
+    ) -> typing.Iterator[ModelResultPublicMasked]: ...
+
+    @typing.overload
+    def iter_sharded(
+        self,
+        *,
+        start_date: str,
+        end_date: str,
+        model_str_id: typing.Optional[str] = ...,
+        shards: typing.Optional[int] = ...,
+        max_workers: typing.Optional[int] = ...,
+        page_size: typing.Optional[int] = ...,
+        columnar: typing.Literal[True],
+        request_options: typing.Optional[AnyRequestOptions] = ...,
+    ) -> typing.Iterator[ResultSet]: ...
+
+    def iter_sharded(
+        self,
+        *,
+        start_date: str,
+        end_date: str,
+        model_str_id: typing.Optional[str] = None,
+        shards: typing.Optional[int] = None,
+        max_workers: typing.Optional[int] = None,
+        page_size: typing.Optional[int] = None,
+        columnar: bool = False,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Iterator[typing.Any]:
+        """Like :meth:`iter_all` over ``[start_date, end_date]``, but fetch date shards in parallel.
+
+        The range is split into ``shards`` (default 16) sub-ranges that are paged
+        concurrently on ``max_workers`` (default 4) threads. Results come out newest
+        first, in the API's ``created_at`` order, without duplicates; with
+        ``columnar=True`` as one :class:`ResultSet` per page. Each running shard fetches
+        only a couple of pages ahead, so memory does not grow with the size of a shard.
+        Bare dates cover the whole day. See :mod:`conductorquantum.model_results.sharding`.
+        """
+        from .sharding import DEFAULT_SHARD_WORKERS, DEFAULT_SHARDS, date_shards, iter_shards
+
+        limit = DEFAULT_PAGE_SIZE if page_size is None else page_size
+        if limit <= 0:
+            raise ValueError("page_size must be positive.")
+        bounds = date_shards(start_date, end_date, DEFAULT_SHARDS if shards is None else shards)
+        decode_mode = self._client_wrapper.get_decode_mode(request_options)
+        for items in iter_shards(
+            lambda shard: self._iter_item_pages(
+                page_size=limit,
+                model_str_id=model_str_id,
+                start_date=shard[0],
+                end_date=shard[1],
+                request_options=request_options,
+            ),
+            bounds,
+            max_workers=DEFAULT_SHARD_WORKERS if max_workers is None else max_workers,
+        ):
+            if columnar:
+                yield _result_set(items)
+            else:
+                yield from typing.cast(
+                    typing.List[ModelResultPublicMasked],
+                    parse_obj_as(
+                        type_=typing.List[ModelResultPublicMasked],  # type: ignore
+                        object_=items,
+                        decode_mode=decode_mode,
+                    ),
+                )
+
+    def export(
+        self,
+        path: typing.Union[str, os.PathLike[str]],
+        *,
+        format: ExportFormat = "parquet",
+        output: ExportOutput = "columns",
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        page_size: typing.Optional[int] = None,
+        prefetch: typing.Optional[int] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> int:
+        """Write every matching result to ``path`` as Parquet, Arrow IPC or JSON Lines.
+
+        Pages of ``page_size`` results are fetched up to ``prefetch`` ahead and appended
+        to the file one at a time, so memory stays bounded however many results match.
+        ``"parquet"`` and ``"arrow"`` need pyarrow; they write one column per output field
+        unless ``output="json"``, which stores each output as a JSON string so results whose
+        output fields differ from page to page still fit one schema. If the export fails
+        partway, the partial file is removed and an existing file at ``path`` is left as it
+        was. Returns the number of results written.
+        """
+        from .export import DEFAULT_EXPORT_PAGE_SIZE, DEFAULT_EXPORT_PREFETCH, export_pages
+
+        limit = DEFAULT_EXPORT_PAGE_SIZE if page_size is None else page_size
+        return export_pages(
+            lambda skip: self._list_items(
+                skip=skip,
+                limit=limit,
+                model_str_id=model_str_id,
+                start_date=start_date,
+                end_date=end_date,
+                request_options=request_options,
+            ),
+            path,
+            format=format,
+            output=output,
+            page_size=limit,
+            prefetch=DEFAULT_EXPORT_PREFETCH if prefetch is None else prefetch,
+        )
+
+    def mirror(
+        self,
+        path: typing.Union[str, os.PathLike[str]],
+        *,
+        model_str_id: typing.Optional[str] = None,
+        page_size: typing.Optional[int] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> ResultsMirror:
+        """Open a local SQLite mirror of the results (of one model, with ``model_str_id``) at ``path``.
+
+        Call :meth:`~conductorquantum.model_results.mirror.ResultsMirror.sync` or
+        ``start()`` to pull new results, and query them with ``list()`` without a
+        network round trip. See :class:`~conductorquantum.model_results.mirror.ResultsMirror`.
+        """
+        from .mirror import DEFAULT_MIRROR_PAGE_SIZE, ResultsMirror
+
+        return ResultsMirror(
+            self,
+            path,
+            model_str_id=model_str_id,
+            page_size=page_size or DEFAULT_MIRROR_PAGE_SIZE,
+            request_options=request_options,
+        )
+
+
+class AsyncExtendedModelResultsClient(AsyncModelResultsClient):
+    """Async model results client with columnar listings and automatic paging."""
+
+    def __init__(self, *, client_wrapper: AsyncExtendedClientWrapper) -> None:
+        super().__init__(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
+
+    async def vote_on_model_result(
+        self,
+        result_id: str,
+        *,
+        vote: int,
+        feedback: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> VoteResponse:
+        response = await self._client_wrapper.httpx_client.request(
+            f"model-results/{jsonable_encoder(result_id)}/vote",
+            method="PUT",
+            json={"vote": vote, "feedback": feedback},
+            headers={"content-type": "application/json"},
+            request_options=request_options,
+            omit=OMIT,
+        )
+        return typing.cast(
+            VoteResponse,
+            _parse_response(response, VoteResponse, decode_mode=self._client_wrapper.get_decode_mode(request_options)),
+        )
+
+    async def remove_vote_on_model_result(
+        self, result_id: str, *, request_options: typing.Optional[AnyRequestOptions] = None
+    ) -> typing.Dict[str, str]:
+        response = await self._client_wrapper.httpx_client.request(
+            f"model-results/{jsonable_encoder(result_id)}/vote",
+            method="DELETE",
+            request_options=request_options,
+        )
+        return typing.cast(
+            typing.Dict[str, str],
+            _parse_response(
+                response,
+                typing.Dict[str, str],
+                decode_mode=self._client_wrapper.get_decode_mode(request_options),
+            ),
+        )
+
+    async def info(self, id: str, *, request_options: typing.Optional[AnyRequestOptions] = None) -> ModelResultPublic:
+        response = await self._client_wrapper.httpx_client.request(
+            f"model-results/{jsonable_encoder(id)}",
+            method="GET",
+            request_options=request_options,
+        )
+        return typing.cast(
+            ModelResultPublic,
+            _parse_response(
+                response, ModelResultPublic, decode_mode=self._client_wrapper.get_decode_mode(request_options)
+            ),
+        )
+
+    async def list(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.List[ModelResultPublicMasked]:
+        items = await self._list_items(
+            skip=skip,
+            limit=limit,
+            model_str_id=model_str_id,
+            start_date=start_date,
+            end_date=end_date,
+            request_options=request_options,
+        )
+        return typing.cast(
+            typing.List[ModelResultPublicMasked],
+            parse_obj_as(
+                type_=typing.List[ModelResultPublicMasked],  # type: ignore
+                object_=items,
+                decode_mode=self._client_wrapper.get_decode_mode(request_options),
+            ),
+        )
+
+    async def list_columnar(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> ResultSet:
+        """Like :meth:`list`, but decode the page into a columnar :class:`ResultSet`.
+
+        No pydantic model is built per result, so large listings take much less time
+        and memory. ``decode_mode`` does not apply.
+        """
+        return _result_set(
+            await self._list_items(
+                skip=skip,
+                limit=limit,
+                model_str_id=model_str_id,
+                start_date=start_date,
+                end_date=end_date,
+                request_options=request_options,
+            )
+        )
+
+    async def _list_items(
+        self,
+        *,
+        skip: typing.Optional[int],
+        limit: typing.Optional[int],
+        model_str_id: typing.Optional[str],
+        start_date: typing.Optional[str],
+        end_date: typing.Optional[str],
+        request_options: typing.Optional[AnyRequestOptions],
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        response = await self._client_wrapper.httpx_client.request(
+            "model-results",
+            method="GET",
+            params=_list_params(
+                skip=skip, limit=limit, model_str_id=model_str_id, start_date=start_date, end_date=end_date
+            ),
+            request_options=request_options,
+        )
+        return _parse_list_response(response)
+
+    @typing.overload
+    def iter_all(
+        self,
+        *,
+        page_size: typing.Optional[int] = ...,
+        model_str_id: typing.Optional[str] = ...,
+        start_date: typing.Optional[str] = ...,
+        end_date: typing.Optional[str] = ...,
+        columnar: typing.Literal[False] = ...,
+        request_options: typing.Optional[AnyRequestOptions] = ...,
+    ) -> typing.AsyncIterator[ModelResultPublicMasked]: ...
+
+    @typing.overload
+    def iter_all(
+        self,
+        *,
+        page_size: typing.Optional[int] = ...,
+        model_str_id: typing.Optional[str] = ...,
+        start_date: typing.Optional[str] = ...,
+        end_date: typing.Optional[str] = ...,
+        columnar: typing.Literal[True],
+        request_options: typing.Optional[AnyRequestOptions] = ...,
+    ) -> typing.AsyncIterator[ResultSet]: ...
+
+    async def iter_all(
+        self,
+        *,
+        page_size: typing.Optional[int] = None,
+        model_str_id: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+        columnar: bool = False,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """Page through every matching result with ``skip``/``limit``.
+
+        Yields each :class:`ModelResultPublicMasked`, or with ``columnar=True`` one
+        :class:`ResultSet` per page (join them with :meth:`ResultSet.concat`).
+        """
+        page_size = DEFAULT_PAGE_SIZE if page_size is None else page_size
+        if page_size <= 0:
+            raise ValueError("page_size must be positive.")
+        skip = 0
+        while True:
+            filters = dict(model_str_id=model_str_id, start_date=start_date, end_date=end_date)
+            page: typing.Sized
+            if columnar:
+                page = await self.list_columnar(skip=skip, limit=page_size, request_options=request_options, **filters)
+                yield page
+            else:
+                results = await self.list(skip=skip, limit=page_size, request_options=request_options, **filters)
+                for result in results:
+                    yield result
+                page = results
+            if len(page) < page_size:
+                return
+            skip += page_size
@@ -0,0 +1,211 @@
+"""A local SQLite mirror of model results, kept up to date incrementally.
+
+:class:`ResultsMirror` pulls results page by page and upserts them into a SQLite
+database indexed by model and creation time. :meth:`ResultsMirror.list` answers
+``model_results.list``-style queries from that database without a network round
+trip.
+
+Each :meth:`~ResultsMirror.sync` asks only for results created on or after the newest
+``created_at`` it has stored (the watermark), so after the first sync a refresh costs
+one or two small pages. The watermark only advances once a sync has finished, and
+results are keyed by ID, so an interrupted sync is simply repeated and the results
+that appear on both sides of a page boundary are stored once. :meth:`~ResultsMirror.start`
+runs ``sync`` on a background thread every ``interval`` seconds.
+
+Votes are not mirrored: listings return masked results without ``user_vote``, and a
+vote changes without changing ``created_at``, so incremental syncs could not see it.
+Use ``model_results.info`` for a result's current vote. Results deleted remotely stay
+in the mirror until they are removed with :meth:`ResultsMirror.forget`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import typing
+
+from ..core.decoding import parse_obj_as
+from ..core.extended_request_options import AnyRequestOptions
+from ..types.model_result_public_masked import ModelResultPublicMasked
+from .extended_client import prefetched_pages
+from .sharding import _utc_key
+
+if typing.TYPE_CHECKING:
+    from .extended_client import ExtendedModelResultsClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIRROR_PAGE_SIZE = 1000
+DEFAULT_SYNC_INTERVAL_SECONDS = 60.0
+_WATERMARK = "watermark"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "id TEXT PRIMARY KEY, model TEXT NOT NULL, created_at TEXT NOT NULL, item TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at)",
+    "CREATE INDEX IF NOT EXISTS results_model ON results (model, created_at)",
+    "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+
+class ResultsMirror:
+    """Local SQLite copy of the model results visible to a client; see the module docstring."""
+
+    def __init__(
+        self,
+        model_results: ExtendedModelResultsClient,
+        path: typing.Union[str, os.PathLike[str]],
+        *,
+        model_str_id: typing.Optional[str] = None,
+        page_size: int = DEFAULT_MIRROR_PAGE_SIZE,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> None:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive.")
+        self._model_results = model_results
+        self.path = path
+        self.model_str_id = model_str_id
+        self.page_size = page_size
+        self._request_options = request_options
+        # Shared by the caller's threads and the background sync; every use holds the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        with self._lock, self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    def __enter__(self) -> ResultsMirror:
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    @property
+    def watermark(self) -> typing.Optional[str]:
+        """``created_at`` of the newest mirrored result, as the API returned it."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM sync_state WHERE key = ?", (_WATERMARK,)).fetchone()
+        return row[0] if row else None
+
+    def sync(self) -> int:
+        """Fetch results created since the watermark into the mirror; return how many were fetched."""
+        watermark = self.watermark
+        newest = (_utc_key(watermark), watermark) if watermark else None
+        fetched = 0
+        for page in prefetched_pages(
+            lambda skip: self._model_results._list_items(
+                skip=skip,
+                limit=self.page_size,
+                model_str_id=self.model_str_id,
+                start_date=watermark,
+                end_date=None,
+                request_options=self._request_options,
+            ),
+            page_size=self.page_size,
+            prefetch=1,
+            size=len,
+        ):
+            rows = [(item["id"], item["model"], _utc_key(item["created_at"]), json.dumps(item)) for item in page]
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO results (id, model, created_at, item) VALUES (?, ?, ?, ?)", rows
+                )
+            for (_, _, created_at, _), item in zip(rows, page):
+                if newest is None or created_at > newest[0]:
+                    newest = (created_at, item["created_at"])
+            fetched += len(page)
+        if newest is not None:
+            with self._lock, self._connection:
+                self._connection.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (_WATERMARK, newest[1]))
+        return fetched
+
+    def list(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        model: typing.Optional[str] = None,
+        start_date: typing.Optional[str] = None,
+        end_date: typing.Optional[str] = None,
+    ) -> typing.List[ModelResultPublicMasked]:
+        """Query the mirror, newest first, like ``model_results.list``.
+
+        ``model`` matches the results' ``model`` field. A bare ``end_date`` includes the whole day.
+        """
+        clauses: typing.List[str] = []
+        parameters: typing.List[typing.Any] = []
+        if model is not None:
+            clauses.append("model = ?")
+            parameters.append(model)
+        if start_date is not None:
+            clauses.append("created_at >= ?")
+            parameters.append(_utc_key(start_date))
+        if end_date is not None:
+            is_date = len(end_date) == len("YYYY-MM-DD")
+            clauses.append("created_at < ?" if is_date else "created_at <= ?")
+            parameters.append(_utc_key(end_date, end_of_day=True))
+        query = "SELECT item FROM results"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        parameters.extend([-1 if limit is None else limit, skip or 0])
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return typing.cast(
+            typing.List[ModelResultPublicMasked],
+            parse_obj_as(
+                type_=typing.List[ModelResultPublicMasked],  # type: ignore
+                object_=[json.loads(row[0]) for row in rows],
+                decode_mode=self._model_results._client_wrapper.get_decode_mode(None),
+            ),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0])
+
+    def forget(self, result_id: str) -> None:
+        """Drop a result from the mirror, e.g. after deleting it remotely."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results WHERE id = ?", (result_id,))
+
+    def start(self, interval: float = DEFAULT_SYNC_INTERVAL_SECONDS) -> None:
+        """Sync now and then every ``interval`` seconds on a daemon thread, until :meth:`stop`.
+
+        Failed syncs are logged and retried at the next interval.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        if self._thread is not None:
+            raise RuntimeError("The mirror is already syncing in the background.")
+        self._stopping.clear()
+
+        def run() -> None:
+            while True:
+                try:
+                    fetched = self.sync()
+                    logger.debug("Mirror %s: fetched %d results", self.path, fetched)
+                except Exception as exc:
+                    logger.warning("Mirror %s: sync failed: %s", self.path, exc)
+                if self._stopping.wait(interval):
+                    return
+
+        self._thread = threading.Thread(target=run, name="conductorquantum-results-mirror", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background syncing, waiting for a sync in progress to finish."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop background syncing and close the database."""
+        self.stop()
+        self._connection.close()
@@ -0,0 +1,147 @@
+"""Parallel listing of model results over a date range split into shards.
+
+Walking a long history with ``skip``/``limit`` is serial and deep offsets get slow.
+:func:`date_shards` splits ``[start_date, end_date]`` into equal sub-ranges instead;
+each is paged on its own from ``skip=0``, up to ``max_workers`` at a time over the
+client's shared connection pool, so a full-history pull scales with concurrency
+rather than with the number of pages.
+
+The API's date filters are inclusive at both ends, so a result created exactly on a
+boundary is returned by both neighbouring shards; :func:`iter_shards` drops the second
+copy. The API returns each shard newest first and :func:`iter_shards` yields the shards
+newest first, page by page, so the merged stream is in the same ``created_at`` order as
+a plain listing and no shard is ever held in memory whole. Results are rarely spread
+evenly over time, so using several times more shards than workers keeps every worker
+busy.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import datetime as dt
+import queue
+import threading
+import typing
+
+DEFAULT_SHARDS = 16
+DEFAULT_SHARD_WORKERS = 4
+# Pages a running shard may fetch ahead of the consumer.
+DEFAULT_PAGES_AHEAD = 2
+
+Items = typing.List[typing.Dict[str, typing.Any]]
+ShardBounds = typing.Tuple[str, str]
+
+
+def _utc_key(value: str, *, end_of_day: bool = False) -> str:
+    """Normalise an ISO 8601 date or timestamp to a sortable naive UTC string.
+
+    A bare date is the start of that day, or with ``end_of_day`` the start of the next
+    day, so it can be used as an exclusive upper bound.
+    """
+    parsed = dt.datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    if end_of_day and len(value) == len("YYYY-MM-DD"):
+        parsed += dt.timedelta(days=1)
+    return parsed.isoformat(timespec="microseconds")
+
+
+def _utc_timestamp(value: dt.datetime) -> str:
+    return value.isoformat() + "Z"
+
+
+def date_shards(start_date: str, end_date: str, shards: int) -> typing.List[ShardBounds]:
+    """Split ``[start_date, end_date]`` into ``shards`` contiguous ``(start, end)`` ranges.
+
+    Every bound is a UTC timestamp ending in ``Z``. A bare ``start_date`` is the start of
+    that day and a bare ``end_date`` the last microsecond of that day, so the whole day is
+    included whatever the API makes of bare dates.
+    """
+    if shards <= 0:
+        raise ValueError("shards must be positive.")
+    start = dt.datetime.fromisoformat(_utc_key(start_date))
+    end = dt.datetime.fromisoformat(_utc_key(end_date, end_of_day=True))
+    if len(end_date) == len("YYYY-MM-DD"):
+        # _utc_key makes a bare end date exclusive; the API's end_date is inclusive.
+        end -= dt.timedelta(microseconds=1)
+    if end < start:
+        raise ValueError(f"end_date {end_date!r} is before start_date {start_date!r}.")
+    step = (end - start) / shards
+    # Equal boundaries (a range shorter than the number of shards) would repeat the same query.
+    bounds = list(dict.fromkeys(_utc_timestamp(start + step * index) for index in range(shards)))
+    bounds.append(_utc_timestamp(end))
+    if len(bounds) > 2 and bounds[-1] == bounds[-2]:
+        del bounds[-2]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+_DONE = object()
+
+
+def _put(feed: "queue.Queue[typing.Any]", item: typing.Any, stop: threading.Event) -> bool:
+    """Put ``item`` on ``feed``, waiting for room; return False if the consumer has gone away."""
+    while not stop.is_set():
+        try:
+            feed.put(item, timeout=0.05)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def iter_shards(
+    fetch_pages: typing.Callable[[ShardBounds], typing.Iterable[Items]],
+    bounds: typing.Sequence[ShardBounds],
+    *,
+    max_workers: int = DEFAULT_SHARD_WORKERS,
+    pages_ahead: int = DEFAULT_PAGES_AHEAD,
+) -> typing.Iterator[Items]:
+    """Yield the pages of every shard, newest shard first, paging up to ``max_workers`` shards at once.
+
+    ``fetch_pages`` yields a shard's pages in the API's order, newest first. A running
+    shard fetches at most ``pages_ahead`` pages ahead of the consumer, so at most
+    ``max_workers * (pages_ahead + 1)`` pages are held at a time. Results created exactly
+    on the boundary with the previous shard, which both shards return, are dropped the
+    second time; only their IDs are kept.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be positive.")
+    stop = threading.Event()
+
+    def run(shard: ShardBounds, feed: "queue.Queue[typing.Any]") -> None:
+        try:
+            for page in fetch_pages(shard):
+                if not _put(feed, page, stop):
+                    return
+        except BaseException as exc:  # handed to the consumer, which re-raises it
+            _put(feed, exc, stop)
+        else:
+            _put(feed, _DONE, stop)
+
+    pending = sorted(bounds, key=lambda shard: _utc_key(shard[0]), reverse=True)
+    feeds: typing.List[typing.Tuple[ShardBounds, "queue.Queue[typing.Any]"]] = []
+    boundary_ids: typing.Set[str] = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while pending or feeds:
+                while pending and len(feeds) < max_workers:
+                    feed: "queue.Queue[typing.Any]" = queue.Queue(maxsize=max(pages_ahead, 1))
+                    shard = pending.pop(0)
+                    executor.submit(run, shard, feed)
+                    feeds.append((shard, feed))
+                shard, feed = feeds.pop(0)
+                # The older neighbour repeats the results created exactly on this shard's start.
+                start = _utc_key(shard[0])
+                previous_ids, boundary_ids = boundary_ids, set()
+                while True:
+                    page = feed.get()
+                    if page is _DONE:
+                        break
+                    if isinstance(page, BaseException):
+                        raise page
+                    fresh = [item for item in page if item["id"] not in previous_ids]
+                    boundary_ids.update(item["id"] for item in fresh if _utc_key(item["created_at"]) == start)
+                    if fresh:
+                        yield fresh
+        finally:
+            stop.set()
@@ -0,0 +1,109 @@
+"""Batch inference over the axis-0 blocks of chunked, out-of-core arrays.
+
+Works with anything that slices like an array: Dask arrays (each block is
+``.compute()``-d when it is needed), Zarr and HDF5 datasets, memmaps and plain
+ndarrays. Block boundaries follow the array's own chunking along axis 0 (``chunks``
+as Dask or Zarr report it) unless ``block_size`` is given. Neither Dask nor Zarr is
+imported here; the array object does the work.
+
+:class:`BlockResults` runs blocks only as it is iterated, with at most
+``max_in_flight`` blocks loaded or uploading at once, and yields outputs in axis-0
+order. Each block's result is dropped once it has been yielded, so memory stays
+bounded however many blocks there are; iterating again reruns the model. Pass
+``cache=True`` to keep finished results so later iterations reuse them.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+import numpy as np
+from ..types.model_batch_result_public import ModelBatchResultPublic
+
+DEFAULT_BLOCKS_IN_FLIGHT = 2
+
+BlockBounds = typing.Tuple[int, int]
+
+
+def axis0_blocks(data: typing.Any, block_size: typing.Optional[int] = None) -> typing.List[BlockBounds]:
+    """Return ``(start, stop)`` bounds covering axis 0 of ``data``, one per block."""
+    length = int(data.shape[0])
+    if block_size is None:
+        chunks = getattr(data, "chunks", None)
+        first_axis = chunks[0] if chunks else None
+        if isinstance(first_axis, tuple):
+            # Dask: the size of every chunk along the axis.
+            bounds: typing.List[BlockBounds] = []
+            start = 0
+            for size in first_axis:
+                bounds.append((start, start + int(size)))
+                start += int(size)
+            return bounds
+        if not isinstance(first_axis, int):
+            raise ValueError("data has no chunking along axis 0; pass block_size.")
+        block_size = first_axis
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+    return [(start, min(start + block_size, length)) for start in range(0, length, block_size)]
+
+
+def load_block(data: typing.Any, bounds: BlockBounds) -> np.ndarray:
+    """Materialise ``data[start:stop]`` as an ndarray, computing it first if it is lazy."""
+    block = data[bounds[0] : bounds[1]]
+    compute = getattr(block, "compute", None)
+    return np.asarray(compute() if callable(compute) else block)
+
+
+class BlockResults:
+    """Lazily computed batch results for the axis-0 blocks of an array."""
+
+    def __init__(
+        self,
+        run_block: typing.Callable[[BlockBounds], ModelBatchResultPublic],
+        bounds: typing.Sequence[BlockBounds],
+        *,
+        max_in_flight: int = DEFAULT_BLOCKS_IN_FLIGHT,
+        cache: bool = False,
+    ) -> None:
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive.")
+        self._run_block = run_block
+        self.bounds = list(bounds)
+        self.max_in_flight = max_in_flight
+        self.cache = cache
+        self._results: typing.Dict[int, ModelBatchResultPublic] = {}
+
+    def __len__(self) -> int:
+        """Number of items along axis 0."""
+        return self.bounds[-1][1] - self.bounds[0][0] if self.bounds else 0
+
+    def blocks(self) -> typing.Iterator[typing.Tuple[BlockBounds, ModelBatchResultPublic]]:
+        """Yield ``((start, stop), result)`` per block in axis-0 order, running blocks as needed."""
+        pending = [index for index in range(len(self.bounds)) if index not in self._results]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            futures: typing.Dict[int, concurrent.futures.Future[ModelBatchResultPublic]] = {}
+            try:
+                for index, bounds in enumerate(self.bounds):
+                    # Keep up to max_in_flight blocks running ahead of the consumer.
+                    while pending and len(futures) < self.max_in_flight:
+                        ahead = pending.pop(0)
+                        futures[ahead] = executor.submit(self._run_block, self.bounds[ahead])
+                    if index in futures:
+                        result = futures.pop(index).result()
+                        if self.cache:
+                            self._results[index] = result
+                    else:
+                        result = self._results[index]
+                    yield bounds, result
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        """Yield each item's output in axis-0 order."""
+        for (start, stop), result in self.blocks():
+            outputs = result.output.get("outputs")
+            if not isinstance(outputs, list) or len(outputs) != stop - start:
+                raise ValueError(f"Expected {stop - start} per-item outputs for block {start}:{stop}.")
+            yield from outputs
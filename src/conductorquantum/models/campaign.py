@@ -0,0 +1,317 @@
+"""Checkpointed batch runs of a model over directories of ``.npy``/``.npz`` files.
+
+A :class:`Campaign` reads only the ``.npy`` header of each input (for ``.npz``
+archives, of each member) to pack inputs of the same shape and dtype into batch
+requests, and keeps up to ``max_workers`` requests in flight. Array data is loaded by
+the worker sending the batch, ``.npy`` files memory-mapped with
+``np.load(mmap_mode="r")``, so only the batches being sent are held in memory. An
+input that cannot be read is reported in :attr:`CampaignSummary.failed` like a
+failed request, and the rest of the campaign goes on. Each finished batch is recorded in a local journal, a SQLite database or, for paths
+ending in ``.jsonl``, an append-only JSON Lines file. Running the same campaign again
+skips every input the journal already holds, so an interrupted run resumes where it
+stopped.
+
+``python -m conductorquantum.models.campaign`` runs :func:`main`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import sys
+import time
+import typing
+import zipfile
+
+import numpy as np
+from ..core.extended_request_options import AnyRequestOptions
+from .extended_client import ExtendedModelsClient, _batch_outputs
+from .upload import UploadCompression
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAMPAIGN_BATCH_SIZE = 32
+DEFAULT_CAMPAIGN_WORKERS = 4
+_INPUT_SUFFIXES = (".npy", ".npz")
+_NPZ_SEPARATOR = "::"
+
+
+@dataclasses.dataclass(frozen=True)
+class CampaignSummary:
+    """Outcome of :meth:`Campaign.run`; ``failed`` lists inputs to retry on the next run."""
+
+    completed: int
+    skipped: int
+    failed: typing.List[str]
+
+
+class _Journal(typing.Protocol):
+    def completed(self, model: str) -> typing.Set[str]: ...
+
+    def record(self, model: str, result_id: str, outputs: typing.Sequence[typing.Tuple[str, typing.Any]]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _SqliteJournal:
+    def __init__(self, path: pathlib.Path) -> None:
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "model TEXT NOT NULL, input TEXT NOT NULL, result_id TEXT NOT NULL, "
+            "output TEXT NOT NULL, completed_at REAL NOT NULL, PRIMARY KEY (model, input))"
+        )
+        self._connection.commit()
+
+    def completed(self, model: str) -> typing.Set[str]:
+        return {row[0] for row in self._connection.execute("SELECT input FROM results WHERE model = ?", (model,))}
+
+    def record(self, model: str, result_id: str, outputs: typing.Sequence[typing.Tuple[str, typing.Any]]) -> None:
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                [(model, key, result_id, json.dumps(output), now) for key, output in outputs],
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class _JsonlJournal:
+    def __init__(self, path: pathlib.Path) -> None:
+        self._path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def completed(self, model: str) -> typing.Set[str]:
+        done: typing.Set[str] = set()
+        with open(self._path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by a crash; its input is simply run again.
+                    continue
+                if entry.get("model") == model:
+                    done.add(entry["input"])
+        return done
+
+    def record(self, model: str, result_id: str, outputs: typing.Sequence[typing.Tuple[str, typing.Any]]) -> None:
+        now = time.time()
+        for key, output in outputs:
+            entry = {"model": model, "input": key, "result_id": result_id, "output": output, "completed_at": now}
+            self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _open_journal(path: typing.Union[str, os.PathLike[str]]) -> _Journal:
+    path = pathlib.Path(path)
+    return _JsonlJournal(path) if path.suffix == ".jsonl" else _SqliteJournal(path)
+
+
+def discover_inputs(paths: typing.Iterable[typing.Union[str, os.PathLike[str]]]) -> typing.List[str]:
+    """Expand files and directories into sorted input keys.
+
+    A ``.npy`` file is one input, keyed by its absolute path; each array in a ``.npz``
+    archive is one input, keyed ``"<path>::<name>"``. Directories are searched recursively.
+    An archive that cannot be opened is keyed by its path alone, so it is reported as a
+    failed input when the campaign runs.
+    """
+    keys: typing.List[str] = []
+    for path in map(pathlib.Path, paths):
+        files = sorted(p for p in path.rglob("*") if p.suffix in _INPUT_SUFFIXES) if path.is_dir() else [path]
+        for file in files:
+            file = file.resolve()
+            if file.suffix != ".npz":
+                keys.append(str(file))
+                continue
+            try:
+                with zipfile.ZipFile(file) as archive:
+                    names = [name[: -len(".npy")] for name in archive.namelist() if name.endswith(".npy")]
+            except (OSError, zipfile.BadZipFile):
+                keys.append(str(file))
+                continue
+            keys.extend(f"{file}{_NPZ_SEPARATOR}{name}" for name in names)
+    return keys
+
+
+_InputSpec = typing.Tuple[typing.Tuple[int, ...], str]
+
+
+def _read_spec(file: typing.IO[bytes]) -> _InputSpec:
+    version = np.lib.format.read_magic(file)
+    read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+    shape, _, dtype = read_header(file)
+    return tuple(shape), dtype.str
+
+
+def _input_spec(key: str) -> _InputSpec:
+    """Read the shape and dtype of an input from its ``.npy`` header, without loading its data."""
+    path, separator, name = key.partition(_NPZ_SEPARATOR)
+    if separator:
+        with zipfile.ZipFile(path) as archive, archive.open(f"{name}.npy") as member:
+            return _read_spec(member)
+    with open(path, "rb") as file:
+        return _read_spec(file)
+
+
+def _load_input(key: str) -> np.ndarray:
+    path, separator, name = key.partition(_NPZ_SEPARATOR)
+    if separator:
+        with np.load(path) as archive:
+            return archive[name]
+    return np.load(path, mmap_mode="r")
+
+
+class Campaign:
+    """Runs ``model`` over many array files, journaling progress so reruns resume."""
+
+    def __init__(
+        self,
+        models_client: ExtendedModelsClient,
+        *,
+        model: str,
+        journal: typing.Union[str, os.PathLike[str]],
+        batch_size: int = DEFAULT_CAMPAIGN_BATCH_SIZE,
+        max_workers: int = DEFAULT_CAMPAIGN_WORKERS,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> None:
+        if batch_size <= 0 or max_workers <= 0:
+            raise ValueError("batch_size and max_workers must be positive.")
+        self._models_client = models_client
+        self.model = model
+        self.journal_path = journal
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._compression = compression
+        self._request_options = request_options
+
+    def _batches(self, keys: typing.Iterable[str], failed: typing.List[str]) -> typing.Iterator[typing.List[str]]:
+        """Group input keys of the same shape and dtype into batches of at most ``batch_size``.
+
+        Only headers are read here; inputs whose header cannot be read are appended to ``failed``.
+        """
+        groups: typing.Dict[_InputSpec, typing.List[str]] = collections.defaultdict(list)
+        for key in keys:
+            try:
+                spec = _input_spec(key)
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+                logger.warning("Campaign input %s cannot be read: %s", key, exc)
+                failed.append(key)
+                continue
+            group = groups[spec]
+            group.append(key)
+            if len(group) == self.batch_size:
+                yield list(group)
+                group.clear()
+        yield from (group for group in groups.values() if group)
+
+    def _run_batch(self, keys: typing.List[str]) -> typing.Tuple[str, typing.List[typing.Any]]:
+        # Inputs are loaded here, in the worker thread, so only batches being sent are in memory.
+        result = self._models_client.batch.run(
+            model=self.model,
+            data=np.stack([_load_input(key) for key in keys]),
+            compression=self._compression,
+            request_options=self._request_options,
+        )
+        return result.id, _batch_outputs(result, len(keys))
+
+    def run(self, paths: typing.Iterable[typing.Union[str, os.PathLike[str]]]) -> CampaignSummary:
+        """Run every input under ``paths`` that the journal does not already hold."""
+        journal = _open_journal(self.journal_path)
+        try:
+            keys = discover_inputs(paths)
+            done = journal.completed(self.model)
+            pending = [key for key in keys if key not in done]
+            logger.info("Campaign %s: %d inputs, %d already journaled", self.model, len(keys), len(keys) - len(pending))
+            completed = 0
+            failed: typing.List[str] = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                in_flight: typing.Dict[
+                    concurrent.futures.Future[typing.Tuple[str, typing.List[typing.Any]]], typing.List[str]
+                ]
+                in_flight = {}
+
+                def drain(return_when: str) -> None:
+                    nonlocal completed
+                    finished, _ = concurrent.futures.wait(in_flight, return_when=return_when)
+                    for future in finished:
+                        batch_keys = in_flight.pop(future)
+                        try:
+                            result_id, outputs = future.result()
+                        except Exception as exc:
+                            logger.warning("Campaign batch of %d inputs failed: %s", len(batch_keys), exc)
+                            failed.extend(batch_keys)
+                            continue
+                        # Journal from this thread only; sqlite3 connections are not shared across threads.
+                        journal.record(self.model, result_id, list(zip(batch_keys, outputs)))
+                        completed += len(batch_keys)
+
+                for batch in self._batches(pending, failed):
+                    # Keep at most one batch queued per running one, so results are journaled as they finish.
+                    while len(in_flight) >= 2 * self.max_workers:
+                        drain(concurrent.futures.FIRST_COMPLETED)
+                    in_flight[executor.submit(self._run_batch, batch)] = batch
+                while in_flight:
+                    drain(concurrent.futures.ALL_COMPLETED)
+            return CampaignSummary(completed=completed, skipped=len(keys) - len(pending), failed=failed)
+        finally:
+            journal.close()
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Command-line entry point: ``python -m conductorquantum.models.campaign MODEL PATH... --journal FILE``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m conductorquantum.models.campaign",
+        description="Run a model over .npy/.npz files in batches, resuming from a local journal.",
+    )
+    parser.add_argument("model", help="ID of the model to run.")
+    parser.add_argument("paths", nargs="+", help="Input files or directories, searched recursively.")
+    parser.add_argument(
+        "--journal", default="campaign.sqlite", help="SQLite database, or a .jsonl file (default: %(default)s)."
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_CAMPAIGN_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=DEFAULT_CAMPAIGN_WORKERS)
+    parser.add_argument("--compression", choices=typing.get_args(UploadCompression))
+    parser.add_argument("--base-url", help="Override the Control API base URL.")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("CONDUCTORQUANTUM_TOKEN"),
+        help="API token (default: $CONDUCTORQUANTUM_TOKEN).",
+    )
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error("provide --token or set CONDUCTORQUANTUM_TOKEN")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    from ..client import ConductorQuantum
+
+    client = ConductorQuantum(token=args.token, base_url=args.base_url)
+    campaign = client.control.models.campaign(
+        model=args.model,
+        journal=args.journal,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+        compression=args.compression,
+    )
+    summary = campaign.run(args.paths)
+    print(f"completed {summary.completed}, skipped {summary.skipped}, failed {len(summary.failed)}")
+    for key in summary.failed:
+        print(f"failed: {key}", file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import io
 import logging
 import os
+import sys
 import tempfile
 import typing
 import warnings
@@ -10,33 +13,97 @@ from json.decoder import JSONDecodeError
 from typing import Any, Union
 
 import httpx
-import numpy as np
 from ..core import File
 from ..core.api_error import ApiError
-from ..core.pydantic_utilities import parse_obj_as
-from ..core.request_options import RequestOptions
+from ..core.decoding import DecodeMode, parse_obj_as
+from ..core.extended_client_wrapper import AsyncExtendedClientWrapper, ExtendedSyncClientWrapper
+from ..core.extended_request_options import AnyRequestOptions, ExtendedRequestOptions
+from ..core.json_codec import response_json
+from ..core.jsonable_encoder import jsonable_encoder
 from ..errors.not_found_error import NotFoundError
 from ..errors.unprocessable_entity_error import UnprocessableEntityError
 from ..types.http_validation_error import HttpValidationError
 from ..types.model_batch_result_public import ModelBatchResultPublic
+from ..types.model_public import ModelPublic
 from ..types.model_result_public import ModelResultPublic
 from .client import AsyncModelsClient, ModelsClient
+from .preflight import AsyncModelCatalog, ModelCatalog, validate_input
+from .preprocess import PreprocessMode, nn_input_shape, to_nn_input
+from .streaming import BatchOutputsParser
+from .upload import (
+    AsyncCompressedUpload,
+    CompressedUpload,
+    NpyStream,
+    UploadCompression,
+    _is_ndarray,
+    array_view,
+    npy_bytes,
+)
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    from .blocks import BlockResults
+    from .campaign import Campaign
+    from .online import DropPolicy, OnlineRunner
+    from .tiling import TiledResult, Tiler, TileShape
 
 OMIT = typing.cast(Any, ...)
 
+
+class _SupportsArrayInterface(typing.Protocol):
+    @property
+    def __array_interface__(self) -> typing.Dict[str, typing.Any]: ...
+
+
+class _SupportsDLPack(typing.Protocol):
+    def __dlpack__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+
+
+# Model inputs: a file, the path of a ``.npy`` file, a NumPy array, or a CPU tensor or
+# buffer that can be viewed as one without copying.
+UploadData = typing.Union[File, "np.ndarray", "os.PathLike[str]", memoryview, _SupportsArrayInterface, _SupportsDLPack]
+
 logger = logging.getLogger(__name__)
 
+
+class RunMultiError(ExceptionGroup):
+    """Raised by ``run_multi`` when one or more of its model calls fail.
+
+    ``exceptions`` holds every failure in model order, so ``except*`` can match them by
+    type. ``failures`` maps each failed model to its error and ``results`` holds the
+    results of the calls that succeeded.
+    """
+
+    failures: typing.Dict[str, Exception]
+    results: typing.Dict[str, ModelResultPublic]
+
+    def __new__(
+        cls, failures: typing.Dict[str, Exception], results: typing.Dict[str, ModelResultPublic]
+    ) -> RunMultiError:
+        message = f"{len(failures)} of {len(failures) + len(results)} model calls failed: {', '.join(failures)}"
+        self = super().__new__(cls, message, list(failures.values()))
+        self.failures = failures
+        self.results = results
+        return self
+
+    def __init__(self, failures: typing.Dict[str, Exception], results: typing.Dict[str, ModelResultPublic]) -> None:
+        super().__init__(self.message, self.exceptions)
+
+
 DEFAULT_TIMEOUT_SECONDS = 120
 DEFAULT_RETRY_ATTEMPTS = 3
 _HTTP_CLIENT_RETRY_OFFSET = 2
 # HttpClient starts its retry counter at 2, so apply an offset to preserve real retry count.
 DEFAULT_HTTP_CLIENT_MAX_RETRIES = DEFAULT_RETRY_ATTEMPTS + _HTTP_CLIENT_RETRY_OFFSET
+# Arrays an async client serializes at once; bounds the memory and disk bandwidth
+# taken by many concurrent large uploads.
+DEFAULT_MAX_CONCURRENT_SERIALIZATIONS = 4
 
 
 def _merge_request_options(
-    request_options: typing.Optional[RequestOptions],
-) -> RequestOptions:
-    options: RequestOptions = typing.cast(RequestOptions, dict(request_options or {}))
+    request_options: typing.Optional[AnyRequestOptions],
+) -> ExtendedRequestOptions:
+    options: ExtendedRequestOptions = typing.cast(ExtendedRequestOptions, dict(request_options or {}))
     if options.get("timeout_in_seconds") is None:
         options["timeout_in_seconds"] = DEFAULT_TIMEOUT_SECONDS
     if options.get("max_retries") is None:
@@ -44,6 +111,70 @@ def _merge_request_options(
     return options
 
 
+def _as_array_input(data: UploadData) -> UploadData:
+    """Return tensors and buffers as zero-copy ``np.ndarray`` views; other inputs are unchanged."""
+    if _is_ndarray(data):
+        return data
+    view = array_view(data)
+    return data if view is None else view
+
+
+def _open_npy_path(data: typing.Any) -> typing.Any:
+    """Open ``data`` for reading if it is the path of an existing ``.npy`` file; otherwise return it unchanged.
+
+    Strings and ``os.PathLike`` objects are only treated as paths when they end in ``.npy``, so string
+    contents and other paths are still uploaded as before.
+    """
+    path = os.fspath(data) if isinstance(data, os.PathLike) else data
+    if isinstance(path, str) and path.endswith(".npy") and os.path.isfile(path):
+        return open(path, "rb")
+    return data
+
+
+def _memmap_stream(data: typing.Any) -> typing.Optional[NpyStream]:
+    """Return a stream that uploads a contiguous ``np.memmap`` page by page, or ``None`` for other data."""
+    if not _is_ndarray(data) or not isinstance(data, sys.modules["numpy"].memmap):
+        return None
+    if not (data.flags.c_contiguous or data.flags.f_contiguous) or data.dtype.hasobject:
+        return None
+    return NpyStream(data, name=os.path.basename(str(data.filename or "")) or "data.npy")
+
+
+def _shared_upload(data: UploadData) -> UploadData:
+    """Serialize ``data`` once into an immutable upload that several requests can send concurrently.
+
+    Arrays become a ``(name, bytes, content_type)`` file tuple and open files are read once.
+    Contiguous memmaps, ``.npy`` paths, bytes and file tuples are returned unchanged, since
+    every request can already stream or reopen them without serializing again.
+    """
+    data = _as_array_input(data)
+    if _is_ndarray(data):
+        if _memmap_stream(data) is not None:
+            return data
+        return ("data.npy", npy_bytes(data), "application/octet-stream")
+    if hasattr(data, "read") and not isinstance(data, os.PathLike):
+        name = os.path.basename(str(getattr(data, "name", "") or "")) or "data.npy"
+        return (name, typing.cast(typing.IO[bytes], data).read(), "application/octet-stream")
+    return data
+
+
+def _materialized_upload(data: UploadData) -> UploadData:
+    """Like :func:`_shared_upload`, but also reads memmaps, ``.npy`` paths and files inside file tuples into bytes.
+
+    The async clients send the result, so their requests never read a file on the event loop.
+    """
+    shared = _shared_upload(data)
+    if _is_ndarray(shared):
+        return ("data.npy", npy_bytes(shared), "application/octet-stream")
+    source = _open_npy_path(shared)
+    if source is not shared:
+        with source:
+            return (os.path.basename(source.name), source.read(), "application/octet-stream")
+    if isinstance(shared, tuple) and hasattr(shared[1], "read"):
+        return typing.cast(File, (shared[0], shared[1].read(), *shared[2:]))
+    return shared
+
+
 def _reset_file_pointer(file_obj: File) -> None:
     """Reset a file-like upload before a retry when possible."""
     if hasattr(file_obj, "seekable") and callable(getattr(file_obj, "seekable", None)):
@@ -65,10 +196,75 @@ def _close_and_cleanup_upload(file_obj: File, temp_path: typing.Optional[str]) -
             logger.warning(f"Failed to remove temporary file {temp_path}: {err}")
 
 
-def _parse_model_batch_response(response: httpx.Response) -> ModelBatchResultPublic:
+async def _close_and_cleanup_upload_async(file_obj: File, temp_path: typing.Optional[str]) -> None:
+    """Async variant of :func:`_close_and_cleanup_upload` that removes temporary files off the event loop."""
+    if temp_path is None:
+        _close_and_cleanup_upload(file_obj, temp_path)
+        return
+    # Shielded so cancelling the request still removes the temporary file.
+    await asyncio.shield(asyncio.to_thread(_close_and_cleanup_upload, file_obj, temp_path))
+
+
+def _cleanup_abandoned_conversion(conversion: "asyncio.Future[tuple[File, typing.Optional[str]]]") -> None:
+    if not conversion.cancelled() and conversion.exception() is None:
+        _close_and_cleanup_upload(*conversion.result())
+
+
+def _collect_results(calls: typing.Mapping[str, typing.Any]) -> typing.Dict[str, ModelResultPublic]:
+    """Return the results of finished ``run_multi`` calls, or raise :class:`RunMultiError` if any failed.
+
+    ``calls`` maps models to their futures or tasks; cancelled calls count as neither.
+    """
+    finished = {model: call for model, call in calls.items() if call.done() and not call.cancelled()}
+    failures = {model: call.exception() for model, call in finished.items() if call.exception() is not None}
+    for error in failures.values():
+        if not isinstance(error, Exception):
+            raise error
+    results = {model: call.result() for model, call in finished.items() if model not in failures}
+    if failures:
+        raise RunMultiError(failures, results)
+    return results
+
+
+def _parse_response(response: httpx.Response, type_: typing.Any, *, decode_mode: DecodeMode) -> typing.Any:
+    """Decode a response as ``type_`` or raise the generated SDK errors, as the generated client does."""
+    try:
+        if 200 <= response.status_code < 300:
+            return parse_obj_as(type_=type_, object_=response_json(response), decode_mode=decode_mode)
+        if response.status_code == 404:
+            raise NotFoundError(
+                headers=dict(response.headers),
+                body=typing.cast(
+                    typing.Optional[typing.Any],
+                    parse_obj_as(
+                        type_=typing.Optional[typing.Any],  # type: ignore
+                        object_=response_json(response),
+                    ),
+                ),
+            )
+        if response.status_code == 422:
+            raise UnprocessableEntityError(
+                headers=dict(response.headers),
+                body=typing.cast(
+                    HttpValidationError,
+                    parse_obj_as(
+                        type_=HttpValidationError,  # type: ignore
+                        object_=response_json(response),
+                    ),
+                ),
+            )
+        _response_json = response_json(response)
+    except JSONDecodeError:
+        raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=response.text)
+    raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=_response_json)
+
+
+def _parse_model_batch_response(
+    response: httpx.Response, *, decode_mode: DecodeMode = "validate"
+) -> ModelBatchResultPublic:
     """Parse the batch model response or raise the generated SDK errors."""
     try:
-        response_json: typing.Any = response.json()
+        _response_json: typing.Any = response_json(response)
     except JSONDecodeError as err:
         # Preserve typed errors for known status codes even when the body is not JSON,
         # so callers catching NotFoundError / UnprocessableEntityError are not bypassed.
@@ -81,7 +277,8 @@ def _parse_model_batch_response(response: httpx.Response) -> ModelBatchResultPub
             ModelBatchResultPublic,
             parse_obj_as(
                 type_=ModelBatchResultPublic,  # type: ignore
-                object_=response_json,
+                object_=_response_json,
+                decode_mode=decode_mode,
             ),
         )
     if response.status_code == 404:
@@ -90,7 +287,7 @@ def _parse_model_batch_response(response: httpx.Response) -> ModelBatchResultPub
                 typing.Optional[typing.Any],
                 parse_obj_as(
                     type_=typing.Optional[typing.Any],  # type: ignore
-                    object_=response_json,
+                    object_=_response_json,
                 ),
             )
         )
@@ -100,25 +297,87 @@ def _parse_model_batch_response(response: httpx.Response) -> ModelBatchResultPub
                 HttpValidationError,
                 parse_obj_as(
                     type_=HttpValidationError,  # type: ignore
-                    object_=response_json,
+                    object_=_response_json,
                 ),
             )
         )
-    raise ApiError(status_code=response.status_code, body=response_json)
+    raise ApiError(status_code=response.status_code, body=_response_json)
+
+
+def _batch_outputs(result: ModelBatchResultPublic, expected: int) -> typing.List[typing.Any]:
+    """Return the per-item ``outputs`` of a batch result, checking there is one per uploaded item."""
+    outputs = result.output.get("outputs")
+    if not isinstance(outputs, list) or len(outputs) != expected:
+        raise ApiError(
+            status_code=None,
+            body=f"Expected {expected} per-item outputs in the batch result, got {outputs!r:.200}.",
+        )
+    return outputs
+
+
+def _finish_streamed_batch(
+    response: httpx.Response, parser: BatchOutputsParser, *, decode_mode: DecodeMode = "validate"
+) -> None:
+    """Validate the envelope of a streamed batch response once its outputs have all been yielded."""
+    try:
+        envelope = parser.close()
+    except (JSONDecodeError, ValueError) as err:
+        raise ApiError(status_code=response.status_code, body=f"Malformed batch response: {err}") from err
+    result = typing.cast(
+        ModelBatchResultPublic,
+        parse_obj_as(type_=ModelBatchResultPublic, object_=envelope, decode_mode=decode_mode),  # type: ignore
+    )
+    if result.batch_size != parser.count:
+        raise ApiError(
+            status_code=response.status_code,
+            body=f"Expected {result.batch_size} per-item outputs in the batch result, got {parser.count}.",
+        )
 
 
 class ExtendedModelsClient(ModelsClient):
     """Extended models client that adds support for numpy arrays."""
 
-    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
-        super().__init__(*args, **kwargs)
+    def __init__(self, *, client_wrapper: ExtendedSyncClientWrapper) -> None:
+        super().__init__(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
         self._batch = ModelsBatchClient(self)
+        self._catalog = ModelCatalog(self)
 
     @property
     def batch(self) -> "ModelsBatchClient":
         """Batch model execution APIs."""
         return self._batch
 
+    def campaign(
+        self,
+        *,
+        model: str,
+        journal: typing.Union[str, os.PathLike[str]],
+        batch_size: typing.Optional[int] = None,
+        max_workers: typing.Optional[int] = None,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> Campaign:
+        """
+        Create a resumable run of ``model`` over directories of ``.npy``/``.npz`` files.
+
+        Inputs are memory-mapped, packed ``batch_size`` (default 32) to a batch request and
+        run on ``max_workers`` (default 4) threads. Progress is journaled to ``journal``, a
+        SQLite database or a ``.jsonl`` file, so a rerun skips inputs that already finished.
+        See :class:`~conductorquantum.models.campaign.Campaign`.
+        """
+        from .campaign import DEFAULT_CAMPAIGN_BATCH_SIZE, DEFAULT_CAMPAIGN_WORKERS, Campaign
+
+        return Campaign(
+            self,
+            model=model,
+            journal=journal,
+            batch_size=batch_size or DEFAULT_CAMPAIGN_BATCH_SIZE,
+            max_workers=max_workers or DEFAULT_CAMPAIGN_WORKERS,
+            compression=compression,
+            request_options=request_options,
+        )
+
     def _convert_to_file(self, data: Union[File, np.ndarray]) -> tuple[File, typing.Optional[str]]:
         """
         Convert input data to a File object if necessary.
@@ -134,7 +393,13 @@ class ExtendedModelsClient(ModelsClient):
             A file object containing the data and path to cleanup if temporary file was created
         """
         logger.info("Converting data to file in ExtendedModelsClient")
-        if isinstance(data, np.ndarray):
+        stream = _memmap_stream(data)
+        if stream is not None:
+            # Memory-mapped arrays are read from their pages during the upload instead of copied.
+            return typing.cast(File, stream), None
+        if _is_ndarray(data):
+            import numpy as np
+
             # Create a temporary file and save the numpy array
             temp_file = tempfile.NamedTemporaryFile(suffix=".npy", delete=False)
             temp_path = temp_file.name
@@ -151,20 +416,99 @@ class ExtendedModelsClient(ModelsClient):
             # Open in binary read mode for upload
             file_handle = open(temp_path, "rb")
             return file_handle, temp_path
-        return data, None
+        return typing.cast(File, data), None
+
+    def _prepare_upload(
+        self,
+        data: UploadData,
+        fields: typing.Dict[str, typing.Any],
+        compression: typing.Optional[UploadCompression],
+    ) -> tuple[File, typing.Optional[str], typing.Dict[str, typing.Any]]:
+        """
+        Build the request arguments for an upload.
+
+        Returns the file object and temporary path to clean up afterwards, and the keyword
+        arguments for ``HttpClient.request``: a plain multipart form, or a streamed body
+        compressed with ``compression``.
+        """
+        source: Union[File, np.ndarray] = _open_npy_path(data)
+        if compression is None:
+            file_obj, temp_path = self._convert_to_file(source)
+            return file_obj, temp_path, {"data": fields, "files": {"data": file_obj}}
+        body = CompressedUpload(fields=fields, file_field="data", data=source, compression=compression)
+        return typing.cast(File, source), None, {"content": body, "headers": body.headers}
+
+    def _preflight(self, model: str, data: UploadData, *, batched: bool) -> None:
+        """Check an array against the cached catalog entry for ``model``; files and unlisted models pass."""
+        if not _is_ndarray(data):
+            return
+        entry = self._catalog.get(model)
+        if entry is not None:
+            validate_input(entry, data, batched=batched)
+
+    def _preprocess(self, model: str, data: UploadData, mode: PreprocessMode, *, batched: bool) -> UploadData:
+        """Map an array to the model's declared NN input shape; other inputs are returned as-is."""
+        if not _is_ndarray(data):
+            return data
+        entry = self._catalog.get(model)
+        shape = nn_input_shape(entry, data.ndim - batched) if entry is not None else None
+        if shape is None:
+            logger.warning("Model %s declares no NN input shape for this input; uploading it unchanged", model)
+            return data
+        return to_nn_input(data, shape, mode=mode, batched=batched)
+
+    def _tiler(
+        self, model: str, data: np.ndarray, tile: typing.Optional[TileShape], stride: typing.Optional[TileShape]
+    ) -> Tiler:
+        """Build the tiler for ``data``; without ``tile`` the model's declared 2D input size is used."""
+        from .tiling import Tiler, tile_shape_for
+
+        if tile is None:
+            entry = self._catalog.get(model)
+            tile = tile_shape_for(entry) if entry is not None else None
+            if tile is None:
+                raise ValueError(f"Model {model!r} does not declare a fixed 2D input size; pass tile=(height, width).")
+        return Tiler(data.shape, tile, stride)
 
     def run(
         self,
         *,
         model: str,
-        data: typing.Union[File, np.ndarray],
+        data: UploadData,
         plot: typing.Optional[bool] = OMIT,
         dark_mode: typing.Optional[bool] = OMIT,
-        request_options: typing.Optional[RequestOptions] = None,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        preprocess: typing.Optional[PreprocessMode] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> ModelResultPublic:
-        """Run a model with the provided data."""
+        """Run a model with the provided data.
+
+        Pass ``compression="gzip"`` or ``"zstd"`` to stream the request body compressed with
+        that ``Content-Encoding`` instead of writing an uncompressed ``.npy`` file first.
+        ``"zstd"`` requires the ``zstandard`` package.
+
+        ``data`` may also be a CPU tensor or buffer (``__array_interface__``, ``__dlpack__`` or
+        the buffer protocol, e.g. a PyTorch CPU tensor); it is viewed as an ndarray without copying.
+
+        Pass ``preflight=True`` to check an array's shape and dtype against the model's
+        ``input_shape_requirements`` before uploading; a mismatch raises
+        :class:`~conductorquantum.models.preflight.InputShapeError`. The model catalog is
+        fetched on first use and cached for an hour.
+
+        Pass ``preprocess="resample"`` or ``"crop"`` to shrink an array to the model's
+        ``nn_input_shape_requirements`` locally before uploading; see
+        :func:`~conductorquantum.models.preprocess.to_nn_input`.
+        """
         logger.info(f"Running model {model} in ExtendedModelsClient")
-        file_obj, temp_path = self._convert_to_file(data)
+        data = _as_array_input(data)
+        if preprocess is not None:
+            data = self._preprocess(model, data, preprocess, batched=False)
+        if preflight:
+            self._preflight(model, data, batched=False)
+        file_obj, temp_path, upload = self._prepare_upload(
+            data, {"model": model, "plot": plot, "dark_mode": dark_mode}, compression
+        )
         effective_request_options = _merge_request_options(request_options)
         response: typing.Optional[httpx.Response] = None
         try:
@@ -173,14 +517,7 @@ class ExtendedModelsClient(ModelsClient):
                     response = self._raw_client._client_wrapper.httpx_client.request(  # pylint: disable=protected-access
                         "models",
                         method="POST",
-                        data={
-                            "model": model,
-                            "plot": plot,
-                            "dark_mode": dark_mode,
-                        },
-                        files={
-                            "data": file_obj,
-                        },
+                        **upload,
                         request_options=effective_request_options,
                         omit=OMIT,
                     )
@@ -209,7 +546,8 @@ class ExtendedModelsClient(ModelsClient):
                     ModelResultPublic,
                     parse_obj_as(
                         type_=ModelResultPublic,  # type: ignore
-                        object_=response.json(),
+                        object_=response_json(response),
+                        decode_mode=self._client_wrapper.get_decode_mode(effective_request_options),
                     ),
                 )
             if response.status_code == 404:
@@ -218,7 +556,7 @@ class ExtendedModelsClient(ModelsClient):
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=response.json(),
+                            object_=response_json(response),
                         ),
                     )
                 )
@@ -228,11 +566,11 @@ class ExtendedModelsClient(ModelsClient):
                         HttpValidationError,
                         parse_obj_as(
                             type_=HttpValidationError,  # type: ignore
-                            object_=response.json(),
+                            object_=response_json(response),
                         ),
                     )
                 )
-            _response_json = response.json()
+            _response_json = response_json(response)
         except JSONDecodeError as err:
             raise ApiError(
                 status_code=response.status_code if response is not None else 0,
@@ -243,14 +581,93 @@ class ExtendedModelsClient(ModelsClient):
         assert response is not None
         raise ApiError(status_code=response.status_code, body=_response_json)
 
+    def run_multi(
+        self,
+        *,
+        models: typing.Sequence[str],
+        data: UploadData,
+        plot: typing.Optional[bool] = OMIT,
+        dark_mode: typing.Optional[bool] = OMIT,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Dict[str, ModelResultPublic]:
+        """Run several models on the same input and return their results keyed by model.
+
+        ``data`` is serialized to ``.npy`` once and the same immutable bytes are uploaded to
+        every model concurrently, one thread per model, instead of writing a temporary file
+        per call. Every call runs to completion; if any fail, :class:`RunMultiError` is raised
+        with all of their errors and the results of the calls that succeeded. See :meth:`run`
+        for the other arguments; ``preflight`` checks the input against each model's
+        requirements.
+        """
+        models = list(dict.fromkeys(models))
+        if not models:
+            return {}
+        array = _as_array_input(data)
+        if preflight:
+            for model in models:
+                self._preflight(model, array, batched=False)
+        shared = _shared_upload(array)
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(models)) as executor:
+            futures = {
+                model: executor.submit(
+                    self.run,
+                    model=model,
+                    data=shared,
+                    plot=plot,
+                    dark_mode=dark_mode,
+                    compression=compression,
+                    request_options=request_options,
+                )
+                for model in models
+            }
+            concurrent.futures.wait(futures.values())
+        return _collect_results(futures)
+
+    def info(self, model: str, *, request_options: typing.Optional[AnyRequestOptions] = None) -> ModelPublic:
+        response = self._client_wrapper.httpx_client.request(
+            f"models/{jsonable_encoder(model)}",
+            method="GET",
+            request_options=request_options,
+        )
+        return typing.cast(
+            ModelPublic,
+            _parse_response(response, ModelPublic, decode_mode=self._client_wrapper.get_decode_mode(request_options)),
+        )
+
+    def list(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.List[ModelPublic]:
+        response = self._client_wrapper.httpx_client.request(
+            "models",
+            method="GET",
+            params={"skip": skip, "limit": limit},
+            request_options=request_options,
+        )
+        return typing.cast(
+            typing.List[ModelPublic],
+            _parse_response(
+                response,
+                typing.List[ModelPublic],
+                decode_mode=self._client_wrapper.get_decode_mode(request_options),
+            ),
+        )
+
     def execute(
         self,
         *,
         model: str,
-        data: typing.Union[File, np.ndarray],
+        data: UploadData,
         plot: typing.Optional[bool] = OMIT,
         dark_mode: typing.Optional[bool] = OMIT,
-        request_options: typing.Optional[RequestOptions] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> ModelResultPublic:
         # TODO(v2): Remove deprecated .execute() alias; use .run()
         warnings.warn(
@@ -271,17 +688,30 @@ class ModelsBatchClient:
         self,
         *,
         model: str,
-        data: typing.Union[File, np.ndarray],
-        request_options: typing.Optional[RequestOptions] = None,
+        data: UploadData,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        preprocess: typing.Optional[PreprocessMode] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> ModelBatchResultPublic:
         """
         Run a model batch with a single uploaded file.
 
         The batch endpoint currently expects a 2D numpy array or file where axis 0 is
-        the batch dimension, for example ``(batch_size, trace_length)``.
+        the batch dimension, for example ``(batch_size, trace_length)``. ``compression``
+        streams the upload compressed, ``preflight`` checks each batch item before uploading
+        and ``preprocess`` maps the whole batch to the NN input shape in one vectorized pass,
+        as in :meth:`ExtendedModelsClient.run`.
         """
         logger.info(f"Running model batch {model} in ModelsBatchClient")
-        file_obj, temp_path = self._models_client._convert_to_file(data)  # pylint: disable=protected-access
+        data = _as_array_input(data)
+        if preprocess is not None:
+            data = self._models_client._preprocess(model, data, preprocess, batched=True)  # pylint: disable=protected-access
+        if preflight:
+            self._models_client._preflight(model, data, batched=True)  # pylint: disable=protected-access
+        file_obj, temp_path, upload = self._models_client._prepare_upload(  # pylint: disable=protected-access
+            data, {"model": model}, compression
+        )
         effective_request_options = _merge_request_options(request_options)
         response: typing.Optional[httpx.Response] = None
         try:
@@ -290,8 +720,7 @@ class ModelsBatchClient:
                     response = self._models_client._raw_client._client_wrapper.httpx_client.request(  # pylint: disable=protected-access
                         "models/batch",
                         method="POST",
-                        data={"model": model},
-                        files={"data": file_obj},
+                        **upload,
                         request_options=effective_request_options,
                         omit=OMIT,
                     )
@@ -309,7 +738,170 @@ class ModelsBatchClient:
                     _reset_file_pointer(file_obj)
             if response is None:
                 raise ApiError(status_code=0, body="Request failed without response.")
-            return _parse_model_batch_response(response)
+            return _parse_model_batch_response(
+                response,
+                decode_mode=self._models_client._client_wrapper.get_decode_mode(effective_request_options),
+            )
+        finally:
+            _close_and_cleanup_upload(file_obj, temp_path)
+
+    def run_tiled(
+        self,
+        *,
+        model: str,
+        data: np.ndarray,
+        tile: typing.Optional[TileShape] = None,
+        stride: typing.Optional[TileShape] = None,
+        max_batch_size: typing.Optional[int] = None,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> TiledResult:
+        """
+        Run a model over a 2D array larger than its input by tiling it into batches.
+
+        ``data`` is cut into ``tile``-sized windows every ``stride`` pixels (half a tile by
+        default), and the tiles are uploaded ``max_batch_size`` (default 64) at a time.
+        ``tile`` defaults to the fixed 2D input size the model declares. Output fields with
+        one value per tile pixel are stitched into full-resolution maps, averaged where
+        tiles overlap; see :class:`~conductorquantum.models.tiling.TiledResult`.
+        """
+        from .tiling import DEFAULT_TILE_BATCH_SIZE
+
+        tiler = self._models_client._tiler(model, data, tile, stride)  # pylint: disable=protected-access
+        results = [
+            self.run(model=model, data=batch, compression=compression, request_options=request_options)
+            for batch in tiler.batches(data, max_batch_size or DEFAULT_TILE_BATCH_SIZE)
+        ]
+        return tiler.stitch(results)
+
+    def map_blocks(
+        self,
+        *,
+        model: str,
+        data: typing.Any,
+        block_size: typing.Optional[int] = None,
+        max_in_flight: typing.Optional[int] = None,
+        cache: bool = False,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> BlockResults:
+        """
+        Run a model batch over each axis-0 block of a chunked, possibly out-of-core array.
+
+        ``data`` is a Dask or Zarr array, HDF5 dataset, memmap or ndarray. Blocks follow its
+        chunking along axis 0, or are ``block_size`` items long. Nothing runs until the
+        returned :class:`~conductorquantum.models.blocks.BlockResults` is iterated; then each
+        block is loaded (computed, for Dask) and uploaded with at most ``max_in_flight``
+        (default 2) blocks in memory, and outputs are yielded in axis-0 order. Block results
+        are dropped once yielded unless ``cache=True``, in which case iterating again reuses
+        them instead of rerunning the model.
+        """
+        from .blocks import DEFAULT_BLOCKS_IN_FLIGHT, BlockResults, axis0_blocks, load_block
+
+        def run_block(bounds: typing.Tuple[int, int]) -> ModelBatchResultPublic:
+            block = load_block(data, bounds)
+            return self.run(model=model, data=block, compression=compression, request_options=request_options)
+
+        return BlockResults(
+            run_block,
+            axis0_blocks(data, block_size),
+            max_in_flight=max_in_flight or DEFAULT_BLOCKS_IN_FLIGHT,
+            cache=cache,
+        )
+
+    def run_windows(
+        self,
+        *,
+        model: str,
+        trace: np.ndarray,
+        window: int,
+        stride: int,
+        max_batch_size: typing.Optional[int] = None,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """
+        Run a model over sliding windows of a long 1D trace, yielding ``(start, output)`` pairs.
+
+        Windows of ``window`` samples every ``stride`` samples are viewed out of ``trace``
+        without copying and uploaded ``max_batch_size`` (default 256) at a time. Each
+        batch is requested only when the previous one's outputs have been consumed, so
+        memory use is bounded by the batch size however long the trace is; a
+        ``np.memmap`` trace is never read into memory as a whole.
+        """
+        from .tiling import DEFAULT_WINDOW_BATCH_SIZE, window_batches
+
+        for starts, windows in window_batches(trace, window, stride, max_batch_size or DEFAULT_WINDOW_BATCH_SIZE):
+            result = self.run(model=model, data=windows, compression=compression, request_options=request_options)
+            yield from zip(starts, _batch_outputs(result, len(starts)))
+
+    def run_streaming(
+        self,
+        *,
+        model: str,
+        data: UploadData,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        preprocess: typing.Optional[PreprocessMode] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """
+        Run a model batch like :meth:`run`, yielding ``(index, output)`` pairs as the response arrives.
+
+        ``output.outputs`` is decoded element by element from the response stream (see
+        :class:`~conductorquantum.models.streaming.BatchOutputsParser`), so the first
+        outputs are available before the whole body has been received and the full
+        response is never held in memory. The rest of the response is validated once the
+        stream ends; a malformed body or an output count that differs from ``batch_size``
+        raises :class:`ApiError` at that point. Error responses raise before anything is yielded.
+        """
+        logger.info(f"Streaming model batch {model} in ModelsBatchClient")
+        models_client = self._models_client
+        data = _as_array_input(data)
+        if preprocess is not None:
+            data = models_client._preprocess(model, data, preprocess, batched=True)  # pylint: disable=protected-access
+        if preflight:
+            models_client._preflight(model, data, batched=True)  # pylint: disable=protected-access
+        file_obj, temp_path, upload = models_client._prepare_upload(data, {"model": model}, compression)  # pylint: disable=protected-access
+        effective_request_options = _merge_request_options(request_options)
+        client_wrapper = models_client._client_wrapper  # pylint: disable=protected-access
+        try:
+            with contextlib.ExitStack() as stack:
+                for attempt in range(DEFAULT_RETRY_ATTEMPTS + 1):
+                    try:
+                        response = stack.enter_context(
+                            client_wrapper.httpx_client.stream(
+                                "models/batch",
+                                method="POST",
+                                **upload,
+                                request_options=effective_request_options,
+                                omit=OMIT,
+                            )
+                        )
+                        break
+                    except httpx.TimeoutException as exc:
+                        logger.warning(
+                            "Model batch execution timed out for %s (attempt %d/%d): %s",
+                            model,
+                            attempt + 1,
+                            DEFAULT_RETRY_ATTEMPTS + 1,
+                            exc,
+                        )
+                        if attempt == DEFAULT_RETRY_ATTEMPTS:
+                            raise
+                        _reset_file_pointer(file_obj)
+                if not 200 <= response.status_code < 300:
+                    response.read()
+                    _parse_model_batch_response(response)
+                parser = BatchOutputsParser()
+                try:
+                    for chunk in response.iter_bytes():
+                        yield from parser.feed(chunk)
+                except JSONDecodeError as err:
+                    raise ApiError(status_code=response.status_code, body=f"Malformed batch response: {err}") from err
+                _finish_streamed_batch(
+                    response, parser, decode_mode=client_wrapper.get_decode_mode(effective_request_options)
+                )
         finally:
             _close_and_cleanup_upload(file_obj, temp_path)
 
@@ -317,15 +909,49 @@ class ModelsBatchClient:
 class AsyncExtendedModelsClient(AsyncModelsClient):
     """Async version of ExtendedModelsClient with support for numpy arrays."""
 
-    def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
-        super().__init__(*args, **kwargs)
+    def __init__(self, *, client_wrapper: AsyncExtendedClientWrapper) -> None:
+        super().__init__(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
         self._batch = AsyncModelsBatchClient(self)
+        self._serialization_slots = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_SERIALIZATIONS)
+        self._catalog = AsyncModelCatalog(self)
 
     @property
     def batch(self) -> "AsyncModelsBatchClient":
         """Batch model execution APIs."""
         return self._batch
 
+    def online(
+        self,
+        *,
+        model: str,
+        buffer_size: typing.Optional[int] = None,
+        max_in_flight: typing.Optional[int] = None,
+        policy: DropPolicy = "drop_oldest",
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> OnlineRunner:
+        """
+        Create a runner that applies ``model`` continuously to arrays from an instrument feed.
+
+        Arrays are held in a ring buffer of ``buffer_size`` (default 32) and up to
+        ``max_in_flight`` (default 2) calls run at once. ``policy="drop_oldest"`` runs each
+        array on its own and lets the buffer evict the oldest when the API falls behind;
+        ``"coalesce"`` sends everything buffered as one batch request. See
+        :class:`~conductorquantum.models.online.OnlineRunner`.
+        """
+        from .online import DEFAULT_BUFFER_SIZE, DEFAULT_MAX_IN_FLIGHT, OnlineRunner
+
+        return OnlineRunner(
+            self,
+            model=model,
+            buffer_size=buffer_size or DEFAULT_BUFFER_SIZE,
+            max_in_flight=max_in_flight or DEFAULT_MAX_IN_FLIGHT,
+            policy=policy,
+            compression=compression,
+            request_options=request_options,
+        )
+
     def _convert_to_file(self, data: Union[File, np.ndarray]) -> tuple[File, typing.Optional[str]]:
         """
         Convert input data to a File object if necessary.
@@ -341,7 +967,13 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
             A file object containing the data and path to cleanup if temporary file was created
         """
         logger.info("Converting data to file in ExtendedModelsClient")
-        if isinstance(data, np.ndarray):
+        stream = _memmap_stream(data)
+        if stream is not None:
+            # Memory-mapped arrays are read from their pages during the upload instead of copied.
+            return typing.cast(File, stream), None
+        if _is_ndarray(data):
+            import numpy as np
+
             # Create a temporary file and save the numpy array
             temp_file = tempfile.NamedTemporaryFile(suffix=".npy", delete=False)
             temp_path = temp_file.name
@@ -358,14 +990,80 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
             # Open in binary read mode for upload
             file_handle = open(temp_path, "rb")
             return file_handle, temp_path
-        return data, None
+        return typing.cast(File, data), None
+
+    async def _convert_to_file_async(self, data: Union[File, np.ndarray]) -> tuple[File, typing.Optional[str]]:
+        """
+        Run :meth:`_convert_to_file` in a worker thread so large arrays do not block the event loop.
+
+        At most ``DEFAULT_MAX_CONCURRENT_SERIALIZATIONS`` arrays are serialized at once per client.
+        """
+        if not _is_ndarray(data) or isinstance(data, sys.modules["numpy"].memmap):
+            return self._convert_to_file(data)
+        async with self._serialization_slots:
+            conversion = asyncio.ensure_future(asyncio.to_thread(self._convert_to_file, data))
+            try:
+                return await asyncio.shield(conversion)
+            except asyncio.CancelledError:
+                # The worker thread cannot be interrupted; remove its temporary file once it finishes.
+                conversion.add_done_callback(_cleanup_abandoned_conversion)
+                raise
+
+    async def _prepare_upload_async(
+        self,
+        data: UploadData,
+        fields: typing.Dict[str, typing.Any],
+        compression: typing.Optional[UploadCompression],
+    ) -> tuple[File, typing.Optional[str], typing.Dict[str, typing.Any]]:
+        """Async variant of :meth:`ExtendedModelsClient._prepare_upload`; compression runs in a worker thread."""
+        source: Union[File, np.ndarray] = _open_npy_path(data)
+        if compression is None:
+            file_obj, temp_path = await self._convert_to_file_async(source)
+            return file_obj, temp_path, {"data": fields, "files": {"data": file_obj}}
+        body = AsyncCompressedUpload(fields=fields, file_field="data", data=source, compression=compression)
+        return typing.cast(File, source), None, {"content": body, "headers": body.headers}
+
+    async def _preflight(self, model: str, data: UploadData, *, batched: bool) -> None:
+        """Async variant of :meth:`ExtendedModelsClient._preflight`."""
+        if not _is_ndarray(data):
+            return
+        entry = await self._catalog.get(model)
+        if entry is not None:
+            validate_input(entry, data, batched=batched)
+
+    async def _preprocess(self, model: str, data: UploadData, mode: PreprocessMode, *, batched: bool) -> UploadData:
+        """Async variant of :meth:`ExtendedModelsClient._preprocess`; the array work runs in a worker thread."""
+        if not _is_ndarray(data):
+            return data
+        entry = await self._catalog.get(model)
+        shape = nn_input_shape(entry, data.ndim - batched) if entry is not None else None
+        if shape is None:
+            logger.warning("Model %s declares no NN input shape for this input; uploading it unchanged", model)
+            return data
+        return await asyncio.to_thread(to_nn_input, data, shape, mode=mode, batched=batched)
+
+    async def _tiler(
+        self, model: str, data: np.ndarray, tile: typing.Optional[TileShape], stride: typing.Optional[TileShape]
+    ) -> Tiler:
+        """Async variant of :meth:`ExtendedModelsClient._tiler`."""
+        from .tiling import Tiler, tile_shape_for
+
+        if tile is None:
+            entry = await self._catalog.get(model)
+            tile = tile_shape_for(entry) if entry is not None else None
+            if tile is None:
+                raise ValueError(f"Model {model!r} does not declare a fixed 2D input size; pass tile=(height, width).")
+        return Tiler(data.shape, tile, stride)
 
     async def run(
         self,
         *,
         model: str,
-        data: typing.Union[File, np.ndarray],
-        request_options: typing.Optional[RequestOptions] = None,
+        data: UploadData,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        preprocess: typing.Optional[PreprocessMode] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> ModelResultPublic:
         """Run a model with the provided data.
 
@@ -374,12 +1072,26 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
         model : str
             The model to run.
 
-        data : Union[File, np.ndarray]
+        data : UploadData
             The input data. Can be:
             - File: A file object (used as-is)
-            - np.ndarray: A numpy array (automatically converted to .npy file)
+            - os.PathLike or str ending in ".npy": an existing .npy file (uploaded as-is)
+            - np.ndarray: A numpy array (automatically converted to .npy file; memmaps are streamed)
+            - A CPU tensor or buffer exposing ``__array_interface__``, ``__dlpack__`` or the
+              buffer protocol, viewed as an ndarray without copying
+
+        compression : typing.Optional[UploadCompression]
+            Stream the request body compressed with this ``Content-Encoding`` ("gzip" or "zstd").
 
-        request_options : typing.Optional[RequestOptions]
+        preflight : bool
+            Check an array's shape and dtype against the model's ``input_shape_requirements``
+            (from the cached model catalog) before uploading.
+
+        preprocess : typing.Optional[PreprocessMode]
+            Resample ("resample") or centre-crop ("crop") an array to the model's
+            ``nn_input_shape_requirements`` before uploading.
+
+        request_options : typing.Optional[AnyRequestOptions]
             Request-specific configuration.
 
         Returns
@@ -395,9 +1107,16 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
             If the request is invalid.
         ApiError
             If there is an error processing the request.
+        InputShapeError
+            If ``preflight`` is set and the array does not match the model's input requirements.
         """
         logger.info(f"Running model {model} in AsyncExtendedModelsClient")
-        file_obj, temp_path = self._convert_to_file(data)
+        data = _as_array_input(data)
+        if preprocess is not None:
+            data = await self._preprocess(model, data, preprocess, batched=False)
+        if preflight:
+            await self._preflight(model, data, batched=False)
+        file_obj, temp_path, upload = await self._prepare_upload_async(data, {"model": model}, compression)
         effective_request_options = _merge_request_options(request_options)
         response: typing.Optional[httpx.Response] = None
         try:
@@ -406,12 +1125,7 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
                     response = await self._raw_client._client_wrapper.httpx_client.request(  # pylint: disable=protected-access
                         "models",
                         method="POST",
-                        data={
-                            "model": model,
-                        },
-                        files={
-                            "data": file_obj,
-                        },
+                        **upload,
                         request_options=effective_request_options,
                         omit=OMIT,
                     )
@@ -440,7 +1154,8 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
                     ModelResultPublic,
                     parse_obj_as(
                         type_=ModelResultPublic,  # type: ignore
-                        object_=response.json(),
+                        object_=response_json(response),
+                        decode_mode=self._client_wrapper.get_decode_mode(effective_request_options),
                     ),
                 )
             if response.status_code == 404:
@@ -449,7 +1164,7 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=response.json(),
+                            object_=response_json(response),
                         ),
                     )
                 )
@@ -459,27 +1174,101 @@ class AsyncExtendedModelsClient(AsyncModelsClient):
                         HttpValidationError,
                         parse_obj_as(
                             type_=HttpValidationError,  # type: ignore
-                            object_=response.json(),
+                            object_=response_json(response),
                         ),
                     )
                 )
-            _response_json = response.json()
+            _response_json = response_json(response)
         except JSONDecodeError as err:
             raise ApiError(
                 status_code=response.status_code if response is not None else 0,
                 body=response.text if response is not None else "Unable to decode response.",
             ) from err
         finally:
-            _close_and_cleanup_upload(file_obj, temp_path)
+            await _close_and_cleanup_upload_async(file_obj, temp_path)
         assert response is not None
         raise ApiError(status_code=response.status_code, body=_response_json)
 
+    async def run_multi(
+        self,
+        *,
+        models: typing.Sequence[str],
+        data: UploadData,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.Dict[str, ModelResultPublic]:
+        """Async variant of :meth:`ExtendedModelsClient.run_multi`; the uploads run concurrently on the event loop.
+
+        The input is serialized once, in a worker thread and within the client's serialization
+        limit, and every call sends the resulting bytes, so no file is read on the event loop.
+        If any call fails, the other calls still running are cancelled and
+        :class:`RunMultiError` is raised with every failure and the results of the calls that
+        had already succeeded; cancelled calls appear in neither.
+        """
+        models = list(dict.fromkeys(models))
+        if not models:
+            return {}
+        array = _as_array_input(data)
+        if preflight:
+            for model in models:
+                await self._preflight(model, array, batched=False)
+        async with self._serialization_slots:
+            shared = await asyncio.to_thread(_materialized_upload, array)
+        tasks = {
+            model: asyncio.ensure_future(
+                self.run(model=model, data=shared, compression=compression, request_options=request_options)
+            )
+            for model in models
+        }
+        try:
+            await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            pending = [task for task in tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return _collect_results(tasks)
+
+    async def info(self, model: str, *, request_options: typing.Optional[AnyRequestOptions] = None) -> ModelPublic:
+        response = await self._client_wrapper.httpx_client.request(
+            f"models/{jsonable_encoder(model)}",
+            method="GET",
+            request_options=request_options,
+        )
+        return typing.cast(
+            ModelPublic,
+            _parse_response(response, ModelPublic, decode_mode=self._client_wrapper.get_decode_mode(request_options)),
+        )
+
+    async def list(
+        self,
+        *,
+        skip: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.List[ModelPublic]:
+        response = await self._client_wrapper.httpx_client.request(
+            "models",
+            method="GET",
+            params={"skip": skip, "limit": limit},
+            request_options=request_options,
+        )
+        return typing.cast(
+            typing.List[ModelPublic],
+            _parse_response(
+                response,
+                typing.List[ModelPublic],
+                decode_mode=self._client_wrapper.get_decode_mode(request_options),
+            ),
+        )
+
     async def execute(
         self,
         *,
         model: str,
-        data: typing.Union[File, np.ndarray],
-        request_options: typing.Optional[RequestOptions] = None,
+        data: UploadData,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> ModelResultPublic:
         # TODO(v2): Remove deprecated .execute() alias; use .run()
         warnings.warn(
@@ -500,17 +1289,30 @@ class AsyncModelsBatchClient:
         self,
         *,
         model: str,
-        data: typing.Union[File, np.ndarray],
-        request_options: typing.Optional[RequestOptions] = None,
+        data: UploadData,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        preprocess: typing.Optional[PreprocessMode] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
     ) -> ModelBatchResultPublic:
         """
         Run a model batch with a single uploaded file.
 
         The batch endpoint currently expects a 2D numpy array or file where axis 0 is
-        the batch dimension, for example ``(batch_size, trace_length)``.
+        the batch dimension, for example ``(batch_size, trace_length)``. ``compression``
+        streams the upload compressed, ``preflight`` checks each batch item before uploading
+        and ``preprocess`` maps the whole batch to the NN input shape in one vectorized pass,
+        as in :meth:`AsyncExtendedModelsClient.run`.
         """
         logger.info(f"Running model batch {model} in AsyncModelsBatchClient")
-        file_obj, temp_path = self._models_client._convert_to_file(data)  # pylint: disable=protected-access
+        data = _as_array_input(data)
+        if preprocess is not None:
+            data = await self._models_client._preprocess(model, data, preprocess, batched=True)  # pylint: disable=protected-access
+        if preflight:
+            await self._models_client._preflight(model, data, batched=True)  # pylint: disable=protected-access
+        file_obj, temp_path, upload = await self._models_client._prepare_upload_async(  # pylint: disable=protected-access
+            data, {"model": model}, compression
+        )
         effective_request_options = _merge_request_options(request_options)
         response: typing.Optional[httpx.Response] = None
         try:
@@ -519,8 +1321,7 @@ class AsyncModelsBatchClient:
                     response = await self._models_client._raw_client._client_wrapper.httpx_client.request(  # pylint: disable=protected-access
                         "models/batch",
                         method="POST",
-                        data={"model": model},
-                        files={"data": file_obj},
+                        **upload,
                         request_options=effective_request_options,
                         omit=OMIT,
                     )
@@ -538,6 +1339,126 @@ class AsyncModelsBatchClient:
                     _reset_file_pointer(file_obj)
             if response is None:
                 raise ApiError(status_code=0, body="Request failed without response.")
-            return _parse_model_batch_response(response)
+            return _parse_model_batch_response(
+                response,
+                decode_mode=self._models_client._client_wrapper.get_decode_mode(effective_request_options),
+            )
         finally:
-            _close_and_cleanup_upload(file_obj, temp_path)
+            await _close_and_cleanup_upload_async(file_obj, temp_path)
+
+    async def run_tiled(
+        self,
+        *,
+        model: str,
+        data: np.ndarray,
+        tile: typing.Optional[TileShape] = None,
+        stride: typing.Optional[TileShape] = None,
+        max_batch_size: typing.Optional[int] = None,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> TiledResult:
+        """
+        Run a model over a 2D array larger than its input by tiling it into batches.
+
+        See :meth:`ModelsBatchClient.run_tiled`. Batches are uploaded one after another,
+        so at most ``max_batch_size`` tiles are copied out of ``data`` at a time.
+        """
+        from .tiling import DEFAULT_TILE_BATCH_SIZE
+
+        tiler = await self._models_client._tiler(model, data, tile, stride)  # pylint: disable=protected-access
+        results = [
+            await self.run(model=model, data=batch, compression=compression, request_options=request_options)
+            for batch in tiler.batches(data, max_batch_size or DEFAULT_TILE_BATCH_SIZE)
+        ]
+        return tiler.stitch(results)
+
+    async def run_windows(
+        self,
+        *,
+        model: str,
+        trace: np.ndarray,
+        window: int,
+        stride: int,
+        max_batch_size: typing.Optional[int] = None,
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.AsyncIterator[typing.Tuple[int, typing.Any]]:
+        """
+        Run a model over sliding windows of a long 1D trace, yielding ``(start, output)`` pairs.
+
+        See :meth:`ModelsBatchClient.run_windows`.
+        """
+        from .tiling import DEFAULT_WINDOW_BATCH_SIZE, window_batches
+
+        for starts, windows in window_batches(trace, window, stride, max_batch_size or DEFAULT_WINDOW_BATCH_SIZE):
+            result = await self.run(model=model, data=windows, compression=compression, request_options=request_options)
+            for item in zip(starts, _batch_outputs(result, len(starts))):
+                yield item
+
+    async def run_streaming(
+        self,
+        *,
+        model: str,
+        data: UploadData,
+        compression: typing.Optional[UploadCompression] = None,
+        preflight: bool = False,
+        preprocess: typing.Optional[PreprocessMode] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> typing.AsyncIterator[typing.Tuple[int, typing.Any]]:
+        """
+        Run a model batch, yielding ``(index, output)`` pairs as the response arrives.
+
+        See :meth:`ModelsBatchClient.run_streaming`.
+        """
+        logger.info(f"Streaming model batch {model} in AsyncModelsBatchClient")
+        models_client = self._models_client
+        data = _as_array_input(data)
+        if preprocess is not None:
+            data = await models_client._preprocess(model, data, preprocess, batched=True)  # pylint: disable=protected-access
+        if preflight:
+            await models_client._preflight(model, data, batched=True)  # pylint: disable=protected-access
+        file_obj, temp_path, upload = await models_client._prepare_upload_async(  # pylint: disable=protected-access
+            data, {"model": model}, compression
+        )
+        effective_request_options = _merge_request_options(request_options)
+        client_wrapper = models_client._client_wrapper  # pylint: disable=protected-access
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                for attempt in range(DEFAULT_RETRY_ATTEMPTS + 1):
+                    try:
+                        response = await stack.enter_async_context(
+                            client_wrapper.httpx_client.stream(
+                                "models/batch",
+                                method="POST",
+                                **upload,
+                                request_options=effective_request_options,
+                                omit=OMIT,
+                            )
+                        )
+                        break
+                    except httpx.TimeoutException as exc:
+                        logger.warning(
+                            "Model batch execution timed out for %s (attempt %d/%d): %s",
+                            model,
+                            attempt + 1,
+                            DEFAULT_RETRY_ATTEMPTS + 1,
+                            exc,
+                        )
+                        if attempt == DEFAULT_RETRY_ATTEMPTS:
+                            raise
+                        _reset_file_pointer(file_obj)
+                if not 200 <= response.status_code < 300:
+                    await response.aread()
+                    _parse_model_batch_response(response)
+                parser = BatchOutputsParser()
+                try:
+                    async for chunk in response.aiter_bytes():
+                        for item in parser.feed(chunk):
+                            yield item
+                except JSONDecodeError as err:
+                    raise ApiError(status_code=response.status_code, body=f"Malformed batch response: {err}") from err
+                _finish_streamed_batch(
+                    response, parser, decode_mode=client_wrapper.get_decode_mode(effective_request_options)
+                )
+        finally:
+            await _close_and_cleanup_upload_async(file_obj, temp_path)
@@ -0,0 +1,205 @@
+"""Continuous inference on arrays streaming off an instrument.
+
+:class:`OnlineRunner` reads arrays from a producer into a fixed-size ring buffer and
+keeps up to ``max_in_flight`` model calls running on the async client. When arrays
+arrive faster than the API answers, the buffer evicts the oldest array, so the
+runner always works on recent data and its memory use stays bounded. Results wait in a
+queue of the same size; when the consumer stops reading, the model calls pause and
+arriving arrays meet the same policy as when the API falls behind. With the
+``"coalesce"`` policy each call instead takes everything buffered and sends it as
+one batch request, which keeps up with bursts at the cost of larger uploads.
+
+Every result carries the end-to-end latency from the moment its array entered the
+buffer; :class:`OnlineStats` keeps counters and latency percentiles for the run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import time
+import typing
+
+from ..core.extended_request_options import AnyRequestOptions
+from ..types.model_batch_result_public import ModelBatchResultPublic
+from ..types.model_result_public import ModelResultPublic
+from .upload import UploadCompression
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    from .extended_client import AsyncExtendedModelsClient
+
+DEFAULT_BUFFER_SIZE = 32
+DEFAULT_MAX_IN_FLIGHT = 2
+_LATENCY_WINDOW = 1024
+
+DropPolicy = typing.Literal["drop_oldest", "coalesce"]
+
+
+@dataclasses.dataclass(frozen=True)
+class OnlineResult:
+    """One model call made by :class:`OnlineRunner`.
+
+    ``result`` is a :class:`ModelResultPublic` for a single array, or a
+    :class:`ModelBatchResultPublic` when the ``"coalesce"`` policy sent several arrays
+    (``size`` of them, oldest first). ``latency`` is the time in seconds from the oldest
+    of those arrays entering the buffer to the result arriving.
+    """
+
+    result: typing.Union[ModelResultPublic, ModelBatchResultPublic]
+    size: int
+    latency: float
+
+
+@dataclasses.dataclass
+class OnlineStats:
+    """Counters for an :class:`OnlineRunner`, and latencies of the most recent arrays."""
+
+    received: int = 0
+    dropped: int = 0
+    completed: int = 0
+    calls: int = 0
+    latencies: typing.Deque[float] = dataclasses.field(
+        default_factory=lambda: collections.deque(maxlen=_LATENCY_WINDOW)
+    )
+
+    def latency_percentile(self, percentile: float) -> typing.Optional[float]:
+        """Return the given percentile (0-100) of recent end-to-end latencies, in seconds."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(percentile / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+async def _iterate(
+    source: typing.Union[typing.AsyncIterable[np.ndarray], asyncio.Queue[typing.Optional[np.ndarray]]],
+) -> typing.AsyncIterator[np.ndarray]:
+    if isinstance(source, asyncio.Queue):
+        while True:
+            item = await source.get()
+            if item is None:
+                return
+            yield item
+    else:
+        async for item in source:
+            yield item
+
+
+class OnlineRunner:
+    """Runs ``model`` continuously on arrays from a producer; see the module docstring."""
+
+    def __init__(
+        self,
+        models_client: AsyncExtendedModelsClient,
+        *,
+        model: str,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        policy: DropPolicy = "drop_oldest",
+        compression: typing.Optional[UploadCompression] = None,
+        request_options: typing.Optional[AnyRequestOptions] = None,
+    ) -> None:
+        if buffer_size <= 0 or max_in_flight <= 0:
+            raise ValueError("buffer_size and max_in_flight must be positive.")
+        if policy not in typing.get_args(DropPolicy):
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {typing.get_args(DropPolicy)}.")
+        self._models_client = models_client
+        self.model = model
+        self.buffer_size = buffer_size
+        self.max_in_flight = max_in_flight
+        self.policy = policy
+        self._compression = compression
+        self._request_options = request_options
+        self.stats = OnlineStats()
+
+    async def _call(self, arrays: typing.List[np.ndarray]) -> typing.Union[ModelResultPublic, ModelBatchResultPublic]:
+        if self.policy == "drop_oldest":
+            return await self._models_client.run(
+                model=self.model,
+                data=arrays[0],
+                compression=self._compression,
+                request_options=self._request_options,
+            )
+        import numpy as np
+
+        return await self._models_client.batch.run(
+            model=self.model,
+            data=np.stack(arrays),
+            compression=self._compression,
+            request_options=self._request_options,
+        )
+
+    async def run(
+        self,
+        source: typing.Union[typing.AsyncIterable[np.ndarray], asyncio.Queue[typing.Optional[np.ndarray]]],
+    ) -> typing.AsyncIterator[OnlineResult]:
+        """Yield results, in completion order, until ``source`` is exhausted and the buffer drained.
+
+        ``source`` is an async iterable of arrays, or an :class:`asyncio.Queue` that is
+        closed by putting ``None``. With ``"coalesce"`` all arrays must have the same
+        shape. An error from a model call stops the run and is raised here. At most
+        ``buffer_size`` results wait to be read; while they do, no new calls start.
+        """
+        buffer: typing.Deque[typing.Tuple[float, np.ndarray]] = collections.deque(maxlen=self.buffer_size)
+        changed = asyncio.Condition()
+        finished = False
+        results: asyncio.Queue[typing.Union[OnlineResult, Exception, None]] = asyncio.Queue(maxsize=self.buffer_size)
+
+        async def produce() -> None:
+            nonlocal finished
+            try:
+                async for array in _iterate(source):
+                    async with changed:
+                        if len(buffer) == buffer.maxlen:
+                            self.stats.dropped += 1
+                        buffer.append((time.monotonic(), array))
+                        self.stats.received += 1
+                        changed.notify()
+            finally:
+                async with changed:
+                    finished = True
+                    changed.notify_all()
+
+        async def work() -> None:
+            while True:
+                async with changed:
+                    await changed.wait_for(lambda: bool(buffer) or finished)
+                    if not buffer:
+                        return
+                    take = 1 if self.policy == "drop_oldest" else len(buffer)
+                    items = [buffer.popleft() for _ in range(take)]
+                result = await self._call([array for _, array in items])
+                now = time.monotonic()
+                self.stats.calls += 1
+                self.stats.completed += len(items)
+                self.stats.latencies.extend(now - acquired for acquired, _ in items)
+                await results.put(OnlineResult(result=result, size=len(items), latency=now - items[0][0]))
+
+        async def supervise() -> None:
+            tasks = [asyncio.create_task(produce())]
+            tasks.extend(asyncio.create_task(work()) for _ in range(self.max_in_flight))
+            try:
+                await asyncio.gather(*tasks)
+            except Exception as exc:
+                await results.put(exc)
+            else:
+                await results.put(None)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        supervisor = asyncio.create_task(supervise())
+        try:
+            while True:
+                item = await results.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            supervisor.cancel()
+            await asyncio.gather(supervisor, return_exceptions=True)
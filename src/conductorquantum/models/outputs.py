@@ -0,0 +1,73 @@
+"""Convert model outputs from nested JSON lists into NumPy arrays.
+
+Model outputs arrive as plain ``dict``/``list`` trees. These helpers turn every
+numeric list in that tree into a contiguous array and, for batch results, stack
+the per-item outputs along axis 0 so ``outputs[field][i]`` is item ``i``.
+Non-numeric and ragged values are returned unchanged.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+_NUMERIC_KINDS = frozenset("biufc")
+
+
+def _numeric_array(value: typing.List[typing.Any]) -> typing.Optional[np.ndarray]:
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        # Ragged nesting, e.g. per-peak lists of different lengths.
+        return None
+    return array if array.dtype.kind in _NUMERIC_KINDS else None
+
+
+def _convert(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return output_as_arrays(value)
+    if isinstance(value, list) and value:
+        array = _numeric_array(value)
+        if array is not None:
+            return array
+        return [_convert(item) for item in value]
+    return value
+
+
+def output_as_arrays(output: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Return a copy of ``output`` with every numeric list replaced by an ``np.ndarray``.
+
+    Empty lists are kept as lists because their dtype cannot be inferred.
+    """
+    return {key: _convert(value) for key, value in output.items()}
+
+
+def _stack(values: typing.List[typing.Any]) -> typing.Any:
+    if values and all(isinstance(value, dict) for value in values):
+        fields: typing.Dict[str, None] = {}
+        for value in values:
+            fields.update(dict.fromkeys(value))
+        return {
+            field: _stack([value[field] for value in values])
+            if all(field in value for value in values)
+            else [_convert(value.get(field)) for value in values]
+            for field in fields
+        }
+    array = _numeric_array(values) if values else None
+    if array is not None:
+        return array
+    return [_convert(value) for value in values]
+
+
+def batch_output_as_arrays(output: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Like :func:`output_as_arrays`, but stacks the ``outputs`` list along axis 0.
+
+    When each item in ``outputs`` is a dict, the result maps each field to an array of
+    shape ``(batch_size, ...)``. Fields that are missing from some items, non-numeric or
+    ragged across items are returned as a list with one converted value per item.
+    """
+    return {
+        key: _stack(list(value)) if key == "outputs" and isinstance(value, list) else _convert(value)
+        for key, value in output.items()
+    }
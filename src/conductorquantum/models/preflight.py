@@ -0,0 +1,142 @@
+"""Local pre-flight checks of array inputs against the model catalog.
+
+``ModelPublic.input_shape_requirements`` is free text written for people, for
+example ``"2D array of shape (128, 128)"`` or ``"(N,) trace"``. This module reads
+the shapes it can recognise out of that text:
+
+* parenthesised tuples such as ``(N, 128)`` or ``(N,)``, where names, ``*`` and ``?`` match any size;
+* ``128x128`` products;
+* ``1D``/``2D``/``3D`` dimensionality hints.
+
+Requirements with none of these are not enforced. The catalog is fetched once
+per client and refreshed after ``DEFAULT_CATALOG_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import typing
+
+from ..types.model_public import ModelPublic
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    from .client import AsyncModelsClient, ModelsClient
+
+DEFAULT_CATALOG_TTL_SECONDS = 3600.0
+_CATALOG_PAGE_SIZE = 100
+
+ShapeSpec = typing.Tuple[typing.Optional[int], ...]
+
+_DIM = r"(?:\d+|[A-Za-z_]\w*|\*|\?)"
+_TUPLE = re.compile(r"\(\s*(" + _DIM + r"(?:\s*,\s*" + _DIM + r")*)\s*,?\s*\)")
+_PRODUCT = re.compile(r"\b\d+(?:\s*[x×]\s*\d+)+\b")
+_NDIM = re.compile(r"\b([1-9])\s*-?\s*D\b", re.IGNORECASE)
+_REAL_NUMERIC_KINDS = frozenset("biuf")
+
+
+class InputShapeError(ValueError):
+    """Raised before upload when an array cannot satisfy the model's input requirements."""
+
+
+def parse_shape_requirements(text: str) -> typing.List[ShapeSpec]:
+    """Return the shapes described by ``text``; ``None`` entries match any size.
+
+    An empty list means the text did not describe a shape this parser recognises.
+    """
+    tuples = [
+        tuple(int(dim) if dim.isdigit() else None for dim in (part.strip() for part in match.group(1).split(",")))
+        for match in _TUPLE.finditer(text)
+        # A lone word in parentheses is prose, e.g. "(optional)", not a 1D shape.
+        if "," in match.group(0) or match.group(1).strip().isdigit()
+    ]
+    if tuples:
+        return tuples
+    products = [tuple(int(dim) for dim in re.split(r"\s*[x×]\s*", match.group(0))) for match in _PRODUCT.finditer(text)]
+    if products:
+        return typing.cast(typing.List[ShapeSpec], products)
+    return [(None,) * int(match.group(1)) for match in _NDIM.finditer(text)]
+
+
+def _matches(shape: typing.Tuple[int, ...], spec: ShapeSpec) -> bool:
+    return len(shape) == len(spec) and all(want is None or want == have for have, want in zip(shape, spec))
+
+
+def validate_input(model: ModelPublic, data: np.ndarray, *, batched: bool = False) -> None:
+    """Raise :class:`InputShapeError` if ``data`` cannot be a valid input for ``model``.
+
+    With ``batched=True`` axis 0 is the batch dimension, so each item ``data[i]`` is
+    checked; a requirement that already includes the batch axis is accepted too.
+    """
+    if data.dtype.kind not in _REAL_NUMERIC_KINDS:
+        raise InputShapeError(f"Model {model.id!r} expects a real numeric array, got dtype {data.dtype}.")
+    specs = parse_shape_requirements(model.input_shape_requirements)
+    if not specs:
+        return
+    candidates = [data.shape[1:], data.shape] if batched and data.ndim > 0 else [data.shape]
+    if any(_matches(shape, spec) for shape in candidates for spec in specs):
+        return
+    described = "batch items of shape" if batched else "shape"
+    raise InputShapeError(
+        f"Model {model.id!r} requires {model.input_shape_requirements!r}; "
+        f"got {described} {tuple(candidates[0])}. Nothing was uploaded."
+    )
+
+
+class _ModelCatalog:
+    def __init__(self, *, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._models: typing.Dict[str, ModelPublic] = {}
+        self._fetched_at: typing.Optional[float] = None
+
+    def _is_fresh(self) -> bool:
+        return self._fetched_at is not None and time.monotonic() - self._fetched_at < self.ttl_seconds
+
+    def _store(self, models: typing.List[ModelPublic]) -> None:
+        self._models = {model.id: model for model in models}
+        self._fetched_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Drop the cached catalog so the next lookup fetches it again."""
+        self._fetched_at = None
+
+
+class ModelCatalog(_ModelCatalog):
+    """The model catalog, fetched on first use and cached for ``ttl_seconds``."""
+
+    def __init__(self, models_client: ModelsClient, *, ttl_seconds: float = DEFAULT_CATALOG_TTL_SECONDS) -> None:
+        super().__init__(ttl_seconds=ttl_seconds)
+        self._models_client = models_client
+
+    def get(self, model: str) -> typing.Optional[ModelPublic]:
+        """Return the catalog entry for ``model``, or ``None`` if the catalog does not list it."""
+        if not self._is_fresh():
+            models: typing.List[ModelPublic] = []
+            while True:
+                page = self._models_client.list(skip=len(models), limit=_CATALOG_PAGE_SIZE)
+                models.extend(page)
+                if len(page) < _CATALOG_PAGE_SIZE:
+                    break
+            self._store(models)
+        return self._models.get(model)
+
+
+class AsyncModelCatalog(_ModelCatalog):
+    """Async variant of :class:`ModelCatalog`."""
+
+    def __init__(self, models_client: AsyncModelsClient, *, ttl_seconds: float = DEFAULT_CATALOG_TTL_SECONDS) -> None:
+        super().__init__(ttl_seconds=ttl_seconds)
+        self._models_client = models_client
+
+    async def get(self, model: str) -> typing.Optional[ModelPublic]:
+        """Return the catalog entry for ``model``, or ``None`` if the catalog does not list it."""
+        if not self._is_fresh():
+            models: typing.List[ModelPublic] = []
+            while True:
+                page = await self._models_client.list(skip=len(models), limit=_CATALOG_PAGE_SIZE)
+                models.extend(page)
+                if len(page) < _CATALOG_PAGE_SIZE:
+                    break
+            self._store(models)
+        return self._models.get(model)
@@ -0,0 +1,105 @@
+"""Local preprocessing of arrays to a model's NN input shape.
+
+Many inputs are much larger than the network consumes. :func:`to_nn_input`
+resamples or crops them to a target shape before upload, applying each step to the
+whole batch in one vectorized NumPy call rather than looping over items.
+
+The target comes from ``ModelPublic.nn_input_shape_requirements``; sizes the
+requirement leaves open (names, ``*``) keep the input's size on that axis.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from ..types.model_public import ModelPublic
+from .preflight import InputShapeError, ShapeSpec, parse_shape_requirements
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+PreprocessMode = typing.Literal["resample", "crop"]
+
+
+def nn_input_shape(model: ModelPublic, item_ndim: int) -> typing.Optional[ShapeSpec]:
+    """Return the first NN input shape of ``model`` with ``item_ndim`` axes, if one is declared."""
+    for requirement in model.nn_input_shape_requirements or ():
+        for spec in parse_shape_requirements(requirement):
+            if len(spec) == item_ndim:
+                return spec
+    return None
+
+
+def _resample_axis(data: np.ndarray, axis: int, size: int) -> np.ndarray:
+    import numpy as np
+
+    length = data.shape[axis]
+    if length == size:
+        return data
+    if length % size == 0:
+        # Whole-factor downsampling: average each block, which also suppresses aliasing.
+        factor = length // size
+        blocks = data.shape[:axis] + (size, factor) + data.shape[axis + 1 :]
+        return data.reshape(blocks).mean(axis=axis + 1)
+    positions = np.linspace(0.0, length - 1, size)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, length - 1)
+    weight_shape = [1] * data.ndim
+    weight_shape[axis] = size
+    weight = (positions - lower).astype(data.dtype).reshape(weight_shape)
+    return np.take(data, lower, axis=axis) * (1.0 - weight) + np.take(data, upper, axis=axis) * weight
+
+
+def _as_float(data: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    return data if data.dtype.kind == "f" else data.astype(np.float32)
+
+
+def _crop_axis(data: np.ndarray, axis: int, size: int) -> np.ndarray:
+    length = data.shape[axis]
+    if length < size:
+        raise InputShapeError(f"Cannot crop axis of length {length} to {size}.")
+    start = (length - size) // 2
+    index = [slice(None)] * data.ndim
+    index[axis] = slice(start, start + size)
+    return data[tuple(index)]
+
+
+def to_nn_input(
+    data: np.ndarray,
+    shape: ShapeSpec,
+    *,
+    mode: PreprocessMode = "resample",
+    normalize: bool = False,
+    batched: bool = False,
+) -> np.ndarray:
+    """Resample or centre-crop ``data`` to ``shape``; ``None`` entries leave that axis unchanged.
+
+    ``"resample"`` averages blocks when an axis shrinks by a whole factor and otherwise
+    interpolates linearly; ``"crop"`` keeps the centre of each axis. With ``batched=True``
+    ``shape`` describes each item ``data[i]``. ``normalize`` rescales each item to zero mean
+    and unit variance.
+
+    Float input keeps its dtype. Integer input is converted to ``float32`` when resampling
+    or normalizing, which holds 16-bit samples exactly without growing the upload fourfold
+    as ``float64`` would; cropping alone leaves it unchanged.
+    """
+    import numpy as np
+
+    offset = 1 if batched else 0
+    if data.ndim - offset != len(shape):
+        raise InputShapeError(f"Cannot map items of shape {data.shape[offset:]} to NN input shape {shape}.")
+    if mode == "resample":
+        data = _as_float(data)
+    for axis, size in enumerate(shape, start=offset):
+        if size is None:
+            continue
+        data = _resample_axis(data, axis, size) if mode == "resample" else _crop_axis(data, axis, size)
+    if normalize:
+        data = _as_float(data)
+        item_axes = tuple(range(offset, data.ndim))
+        mean = data.mean(axis=item_axes, keepdims=True)
+        std = data.std(axis=item_axes, keepdims=True)
+        data = (data - mean) / np.where(std == 0, 1, std)
+    return data
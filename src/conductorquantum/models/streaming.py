@@ -0,0 +1,246 @@
+"""Incremental decoding of the per-item ``outputs`` of a batch response.
+
+:class:`BatchOutputsParser` is fed the response body chunk by chunk as it arrives.
+Elements of ``output.outputs`` are decoded (with the active codec from
+:mod:`conductorquantum.core.json_codec`) as soon as the comma after them has been
+received, so callers can start on the first items while the rest of the body is still
+in flight. Only the undecoded tail of the body is buffered, and the object tree for
+the whole document is never built.
+
+Inside the outputs array the parser first tries to decode everything up to the last
+``},`` or ``],`` of a chunk in one codec call; that succeeds only when the comma
+separates two outputs. Otherwise it falls back to scanning brackets, strings and
+top-level commas. Either way each run of complete outputs is decoded in one call, so
+the per-byte work stays in C.
+
+The rest of the document, i.e. everything except the output elements, is kept in
+compact form and decoded by :meth:`BatchOutputsParser.close`, so the envelope fields
+(``id``, ``model``, ``batch_size``, ...) can still be validated.
+"""
+
+from __future__ import annotations
+
+import re
+import typing
+
+from ..core.json_codec import _resolve_codec, loads
+
+_OUTPUTS_PATH = ("output", "outputs")
+_WHITESPACE = b" \t\r\n"
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+# A whole string (group 1 is None while its closing quote has not arrived) or a bracket;
+# at the top level of the outputs array, commas as well.
+_NESTED_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*(")?|[{}\[\]]', re.DOTALL)
+_TOP_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*(")?|[{}\[\],]', re.DOTALL)
+_QUOTE, _COMMA = ord('"'), ord(",")
+_BOUNDARY = re.compile(rb"[}\]]\s*,")
+_OUTPUT_HEAD = re.compile(rb"[^:,\]}]{2,16}")
+_BOUNDARY_ATTEMPTS = 3
+_BOUNDARY_WINDOW = 4096
+_OPENERS = (ord("{"), ord("["))
+
+Decoded = typing.List[typing.Tuple[int, typing.Any]]
+
+
+class BatchOutputsParser:
+    """Push parser that returns ``(index, output)`` pairs for ``output.outputs`` as bytes arrive."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # Outside the outputs array: the next unread byte. Inside it: the start of the
+        # elements not decoded yet.
+        self._position = 0
+        self._envelope = bytearray()
+        # One [kind, key] frame per open container outside the outputs array.
+        self._stack: typing.List[typing.List[typing.Any]] = []
+        self._expect_key = False
+        self._in_outputs = False
+        self._found_outputs = False
+        self._count = 0
+        # Where the scan of the outputs array resumes, and its bracket depth there.
+        self._scan = 0
+        self._depth = 0
+        self._separator: typing.Optional[typing.Pattern[bytes]] = None
+
+    @property
+    def count(self) -> int:
+        """Number of outputs decoded so far."""
+        return self._count
+
+    def feed(self, chunk: bytes) -> Decoded:
+        """Add ``chunk`` to the body and return the outputs it completed, in order."""
+        self._buffer += chunk
+        decoded: Decoded = []
+        while self._scan_outputs(decoded) if self._in_outputs else self._envelope_token(final=False):
+            pass
+        if self._position:
+            del self._buffer[: self._position]
+            self._scan -= self._position
+            self._position = 0
+        return decoded
+
+    def close(self) -> typing.Any:
+        """Finish the body and return the decoded document with ``output.outputs`` left empty.
+
+        Raises :class:`json.JSONDecodeError` if the body is malformed and :class:`ValueError`
+        if it is truncated or has no ``output.outputs`` array.
+        """
+        while not self._in_outputs and self._envelope_token(final=True):
+            pass
+        rest = bytes(self._buffer[self._position :])
+        if self._in_outputs or self._stack or rest.strip():
+            raise ValueError(f"Batch response body is truncated or has trailing data: {rest[:80]!r}")
+        if not self._found_outputs:
+            raise ValueError("Batch response has no output.outputs array.")
+        return loads(bytes(self._envelope))
+
+    def _string_end(self, start: int) -> typing.Optional[int]:
+        """Index just past the string starting at ``start``, or ``None`` if it is incomplete."""
+        position = start + 1
+        while True:
+            match = _STRING_SPECIAL.search(self._buffer, position)
+            if match is None:
+                return None
+            if match.group() == b'"':
+                return match.end()
+            position = match.end() + 1
+            if position > len(self._buffer):
+                return None
+
+    def _envelope_token(self, *, final: bool) -> bool:
+        """Copy one token outside the outputs array to the envelope; ``False`` when more bytes are needed."""
+        buffer = self._buffer
+        start = self._position
+        while start < len(buffer) and buffer[start] in _WHITESPACE:
+            start += 1
+        self._position = start
+        if start == len(buffer):
+            return False
+        byte = buffer[start : start + 1]
+        if byte in (b"{", b"["):
+            path = tuple(frame[1] for frame in self._stack)
+            if byte == b"[" and path == _OUTPUTS_PATH and all(frame[0] == b"{" for frame in self._stack):
+                self._envelope += b"[]"
+                self._in_outputs = True
+                self._found_outputs = True
+                self._position = self._scan = start + 1
+                self._depth = 0
+                return True
+            self._stack.append([byte, None])
+            self._expect_key = byte == b"{"
+            end = start + 1
+        elif byte in (b"}", b"]"):
+            if self._stack:
+                self._stack.pop()
+            self._expect_key = False
+            end = start + 1
+        elif byte == b",":
+            self._expect_key = bool(self._stack) and self._stack[-1][0] == b"{"
+            end = start + 1
+        elif byte == b":":
+            end = start + 1
+        elif byte == b'"':
+            string_end = self._string_end(start)
+            if string_end is None:
+                return False
+            if self._expect_key and self._stack:
+                self._stack[-1][1] = loads(bytes(buffer[start:string_end]))
+                self._expect_key = False
+            end = string_end
+        else:
+            match = _SCALAR_END.search(buffer, start)
+            if match is None and not final:
+                return False
+            end = match.start() if match is not None else len(buffer)
+        self._envelope += buffer[start:end]
+        self._position = end
+        return True
+
+    def _boundary_candidates(self, start: int, end: int) -> typing.Iterator[int]:
+        """Commas in ``buffer[start:end]`` that may separate two outputs, most likely and latest first."""
+        if self._separator is not None:
+            match = None
+            for match in self._separator.finditer(self._buffer, start, end):
+                pass
+            if match is not None:
+                yield match.start()
+        yield from reversed([match.end() - 1 for match in _BOUNDARY.finditer(self._buffer, start, end)])
+
+    def _decode_to_last_boundary(self, decoded: Decoded) -> None:
+        """Decode up to the last comma that ends an output, without scanning the bytes before it.
+
+        ``[`` + the undecoded bytes up to a comma + ``]`` is valid JSON exactly when that
+        comma is at the top level of the outputs array, so a successful decode proves the
+        boundary. Inside nested data the attempt fails and the regular scan takes over.
+        """
+        # The codec itself, without the standard-library retry loads() does on failure: a
+        # failed attempt is expected here and the scan decodes whatever is left.
+        decoder = _resolve_codec()[1]
+        start = max(self._scan, len(self._buffer) - _BOUNDARY_WINDOW)
+        tried: typing.Set[int] = set()
+        for comma in self._boundary_candidates(start, len(self._buffer)):
+            if comma in tried:
+                continue
+            if len(tried) == _BOUNDARY_ATTEMPTS:
+                return
+            tried.add(comma)
+            try:
+                values = decoder(b"[" + bytes(self._buffer[self._position : comma]) + b"]")
+            except Exception:
+                continue
+            self._record(decoded, values)
+            self._position = self._scan = comma + 1
+            self._depth = 0
+            return
+
+    def _scan_outputs(self, decoded: Decoded) -> bool:
+        """Decode the complete elements received so far; ``True`` once the outputs array has closed."""
+        self._decode_to_last_boundary(decoded)
+        buffer = self._buffer
+        scan = self._scan
+        depth = self._depth
+        complete = None
+        while True:
+            match = (_NESTED_TOKEN if depth else _TOP_TOKEN).search(buffer, scan)
+            if match is None:
+                scan = len(buffer)
+                break
+            byte = buffer[match.start()]
+            if byte == _QUOTE:
+                if match.group(1) is None:
+                    # The string continues in a later chunk; rescan it from its opening quote.
+                    scan = match.start()
+                    break
+            elif byte in _OPENERS:
+                depth += 1
+            elif byte == _COMMA:
+                complete = match.start()
+            elif depth:
+                depth -= 1
+            else:
+                # The closing bracket of the outputs array.
+                self._decode(decoded, match.start())
+                self._in_outputs = False
+                self._position = match.end()
+                return True
+            scan = match.end()
+        self._scan = scan
+        self._depth = depth
+        if complete is not None:
+            self._decode(decoded, complete)
+            self._position = complete + 1
+        return False
+
+    def _decode(self, decoded: Decoded, end: int) -> None:
+        self._record(decoded, loads(b"[" + bytes(self._buffer[self._position : end]) + b"]"))
+
+    def _record(self, decoded: Decoded, values: typing.List[typing.Any]) -> None:
+        if values and self._separator is None:
+            # Outputs usually share their leading bytes (``{"peaks"``, say); a comma followed
+            # by them is the best guess for the next boundary.
+            head = _OUTPUT_HEAD.match(bytes(self._buffer[self._position : self._position + 64]).lstrip())
+            if head is not None:
+                self._separator = re.compile(rb",\s*" + re.escape(head.group()))
+        decoded.extend(enumerate(values, self._count))
+        self._count += len(values)
@@ -0,0 +1,141 @@
+"""Tiling of oversized 2D scans and long 1D traces into model-sized batches.
+
+:class:`Tiler` lays a grid of overlapping tiles over a 2D array. Tiles are read from a
+``sliding_window_view`` of the scan, so nothing is copied until a batch of at most
+``max_batch_size`` tiles is gathered for upload. The last row and column of tiles are
+aligned to the far edges so the whole scan is covered.
+
+Per-tile output fields whose trailing axes match the tile size are stitched back into
+full-resolution maps, averaging where tiles overlap. Other fields are kept per tile.
+
+:func:`window_batches` does the same for sliding windows over a 1D trace, so memory
+use depends on the batch size rather than on the length of the trace.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+import numpy as np
+from ..types.model_batch_result_public import ModelBatchResultPublic
+from ..types.model_public import ModelPublic
+from .outputs import output_as_arrays
+from .preflight import parse_shape_requirements
+from .preprocess import nn_input_shape
+
+DEFAULT_TILE_BATCH_SIZE = 64
+DEFAULT_WINDOW_BATCH_SIZE = 256
+
+TileShape = typing.Tuple[int, int]
+
+
+@dataclasses.dataclass(frozen=True)
+class TiledResult:
+    """Outputs of a tiled run.
+
+    ``maps`` holds the stitched full-resolution fields. ``tiles`` holds every tile's
+    output, converted with :func:`~conductorquantum.models.outputs.output_as_arrays`,
+    in the same order as ``origins``, the top-left corner of each tile.
+    """
+
+    maps: typing.Dict[str, np.ndarray]
+    tiles: typing.List[typing.Dict[str, typing.Any]]
+    origins: typing.List[TileShape]
+    results: typing.List[ModelBatchResultPublic]
+
+
+def tile_shape_for(model: ModelPublic) -> typing.Optional[TileShape]:
+    """Return the fixed 2D input size ``model`` declares, preferring its NN input shape."""
+    candidates = [nn_input_shape(model, 2), *parse_shape_requirements(model.input_shape_requirements)]
+    for spec in candidates:
+        if spec is not None and len(spec) == 2 and spec[0] is not None and spec[1] is not None:
+            return (spec[0], spec[1])
+    return None
+
+
+def _axis_origins(length: int, tile: int, stride: int) -> typing.List[int]:
+    origins = list(range(0, length - tile + 1, stride))
+    if origins[-1] != length - tile:
+        origins.append(length - tile)
+    return origins
+
+
+class Tiler:
+    """Cuts a 2D array of ``shape`` into ``tile``-sized windows every ``stride`` pixels."""
+
+    def __init__(
+        self, shape: typing.Tuple[int, ...], tile: TileShape, stride: typing.Optional[TileShape] = None
+    ) -> None:
+        if len(shape) != 2:
+            raise ValueError(f"Tiling needs a 2D array, got shape {shape}.")
+        stride = stride or (max(tile[0] // 2, 1), max(tile[1] // 2, 1))
+        if any(size <= 0 for size in (*tile, *stride)):
+            raise ValueError(f"Tile {tile} and stride {stride} must be positive.")
+        if tile[0] > shape[0] or tile[1] > shape[1]:
+            raise ValueError(f"Tile {tile} is larger than the array {shape}.")
+        self.shape = (shape[0], shape[1])
+        self.tile: TileShape = (int(tile[0]), int(tile[1]))
+        self.stride: TileShape = (int(stride[0]), int(stride[1]))
+        rows = _axis_origins(shape[0], self.tile[0], self.stride[0])
+        cols = _axis_origins(shape[1], self.tile[1], self.stride[1])
+        self.origins: typing.List[TileShape] = [(row, col) for row in rows for col in cols]
+
+    def batches(self, data: np.ndarray, max_batch_size: int = DEFAULT_TILE_BATCH_SIZE) -> typing.Iterator[np.ndarray]:
+        """Yield arrays of shape ``(n, *tile)`` with ``n <= max_batch_size``, in ``origins`` order."""
+        if data.shape != self.shape:
+            raise ValueError(f"Expected an array of shape {self.shape}, got {data.shape}.")
+        windows = np.lib.stride_tricks.sliding_window_view(data, self.tile)
+        for start in range(0, len(self.origins), max_batch_size):
+            rows, cols = zip(*self.origins[start : start + max_batch_size])
+            yield windows[list(rows), list(cols)]
+
+    def stitch(self, results: typing.Sequence[ModelBatchResultPublic]) -> TiledResult:
+        """Combine the batch results for :meth:`batches` into a :class:`TiledResult`."""
+        tiles: typing.List[typing.Dict[str, typing.Any]] = []
+        for result in results:
+            outputs = result.output.get("outputs")
+            if not isinstance(outputs, list):
+                raise ValueError("Batch result has no per-item 'outputs' list to stitch.")
+            tiles.extend(
+                output_as_arrays(output) if isinstance(output, dict) else {"output": output} for output in outputs
+            )
+        if len(tiles) != len(self.origins):
+            raise ValueError(f"Expected {len(self.origins)} tile outputs, got {len(tiles)}.")
+
+        maps: typing.Dict[str, np.ndarray] = {}
+        coverage = np.zeros(self.shape)
+        for row, col in self.origins:
+            coverage[row : row + self.tile[0], col : col + self.tile[1]] += 1
+        for field in tiles[0] if tiles else ():
+            values = [tile.get(field) for tile in tiles]
+            arrays = [value for value in values if isinstance(value, np.ndarray) and value.shape[-2:] == self.tile]
+            leading = arrays[0].shape[:-2] if arrays else ()
+            if len(arrays) != len(tiles) or any(array.shape[:-2] != leading for array in arrays):
+                continue
+            total = np.zeros(leading + self.shape)
+            for (row, col), array in zip(self.origins, arrays):
+                total[..., row : row + self.tile[0], col : col + self.tile[1]] += array
+            maps[field] = total / coverage
+        return TiledResult(maps=maps, tiles=tiles, origins=list(self.origins), results=list(results))
+
+
+def window_batches(
+    trace: np.ndarray, window: int, stride: int, max_batch_size: int = DEFAULT_WINDOW_BATCH_SIZE
+) -> typing.Iterator[typing.Tuple[range, np.ndarray]]:
+    """Yield ``(starts, windows)`` for the sliding windows over a 1D ``trace``.
+
+    ``windows`` has shape ``(len(starts), window)`` and is a strided view into ``trace``;
+    window ``i`` covers ``trace[starts[i] : starts[i] + window]``. As with
+    ``sliding_window_view``, samples after the last whole window are not covered.
+    """
+    if trace.ndim != 1:
+        raise ValueError(f"Sliding windows need a 1D trace, got shape {trace.shape}.")
+    if window <= 0 or stride <= 0 or max_batch_size <= 0:
+        raise ValueError("window, stride and max_batch_size must be positive.")
+    if window > len(trace):
+        raise ValueError(f"Window of {window} samples is longer than the trace ({len(trace)}).")
+    windows = np.lib.stride_tricks.sliding_window_view(trace, window)[::stride]
+    starts = range(0, len(trace) - window + 1, stride)
+    for first in range(0, len(windows), max_batch_size):
+        yield starts[first : first + max_batch_size], windows[first : first + max_batch_size]
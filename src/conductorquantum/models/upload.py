@@ -0,0 +1,297 @@
+"""Compressed ``multipart/form-data`` bodies for model uploads.
+
+The whole request body is compressed as it is sent and labelled with a standard
+``Content-Encoding`` header, so the server (or the proxy in front of it) decodes it
+before parsing the form. Arrays are streamed straight from their memory as ``.npy``
+bytes, so no temporary file is written and contiguous arrays are never copied.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import io
+import os
+import sys
+import typing
+
+import httpx
+from ..core import File
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+UploadCompression = typing.Literal["gzip", "zstd"]
+UPLOAD_COMPRESSIONS: typing.Tuple[UploadCompression, ...] = ("gzip", "zstd")
+
+_CHUNK_SIZE = 1 << 20
+_DEFAULT_FILE_NAME = "data.npy"
+
+
+class _Compressor(typing.Protocol):
+    def compress(self, data: typing.Any, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+def _compressor_factory(compression: UploadCompression) -> typing.Callable[[], _Compressor]:
+    if compression == "gzip":
+        import zlib
+
+        return lambda: zlib.compressobj(1, zlib.DEFLATED, 31)
+    if compression == "zstd":
+        try:
+            # Optional dependency, imported by name so type checkers do not require it.
+            zstandard = importlib.import_module("zstandard")
+        except ImportError as err:
+            raise ImportError(
+                "compression='zstd' requires the zstandard package; install it with `pip install zstandard`."
+            ) from err
+        compressor = zstandard.ZstdCompressor(level=3)
+        return lambda: typing.cast(_Compressor, compressor.compressobj())
+    raise ValueError(f"Unknown upload compression {compression!r}; expected one of {', '.join(UPLOAD_COMPRESSIONS)}.")
+
+
+def _npy_header(array: np.ndarray) -> typing.Tuple[bytes, bool]:
+    """Return the ``.npy`` header :func:`numpy.save` writes for ``array``, and whether it is Fortran-ordered."""
+    import numpy as np
+
+    header = io.BytesIO()
+    header_data = np.lib.format.header_data_from_array_1_0(array)
+    try:
+        np.lib.format.write_array_header_1_0(header, header_data)
+    except ValueError:
+        header = io.BytesIO()
+        np.lib.format.write_array_header_2_0(header, header_data)
+    return header.getvalue(), bool(header_data["fortran_order"])
+
+
+def _npy_payload(array: np.ndarray, fortran_order: bool) -> memoryview:
+    import numpy as np
+
+    # np.save writes Fortran-ordered arrays column-major, which is array.T in C order.
+    ordered = array.T if fortran_order else array
+    return np.ascontiguousarray(ordered).reshape(-1).view(np.uint8).data
+
+
+def _npy_chunks(array: np.ndarray) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+    """Yield ``array`` in ``.npy`` format, byte-identical to :func:`numpy.save`, without copying it."""
+    header, fortran_order = _npy_header(array)
+    yield header
+    flat = _npy_payload(array, fortran_order)
+    for start in range(0, len(flat), _CHUNK_SIZE):
+        yield flat[start : start + _CHUNK_SIZE]
+
+
+class NpyStream(io.RawIOBase):
+    """A seekable, read-only file of ``array`` in ``.npy`` format, byte-identical to :func:`numpy.save`.
+
+    Bytes are read from the array only as the upload requests them, so for a contiguous
+    ``np.memmap`` pages are faulted in from disk on demand and nothing is copied to a
+    temporary file.
+    """
+
+    def __init__(self, array: np.ndarray, name: str = _DEFAULT_FILE_NAME) -> None:
+        super().__init__()
+        if not (array.flags.c_contiguous or array.flags.f_contiguous) or array.dtype.hasobject:
+            raise ValueError("NpyStream needs a contiguous array without object dtype.")
+        self.name = name
+        self._header, fortran_order = _npy_header(array)
+        self._payload = _npy_payload(array, fortran_order)
+        self._size = len(self._header) + len(self._payload)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self._size}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def readinto(self, buffer: typing.Any) -> int:
+        target = memoryview(buffer).cast("B")
+        written = 0
+        header_size = len(self._header)
+        while written < len(target) and self._position < self._size:
+            if self._position < header_size:
+                source: typing.Union[bytes, memoryview] = self._header[self._position :]
+            else:
+                source = self._payload[self._position - header_size :]
+            count = min(len(target) - written, len(source))
+            target[written : written + count] = source[:count]
+            written += count
+            self._position += count
+        return written
+
+
+def npy_bytes(array: np.ndarray) -> bytes:
+    """Return ``array`` in ``.npy`` format as one immutable ``bytes`` object, byte-identical to :func:`numpy.save`."""
+    if array.dtype.hasobject:
+        import numpy as np
+
+        buffer = io.BytesIO()
+        np.save(buffer, array)
+        return buffer.getvalue()
+    header, fortran_order = _npy_header(array)
+    return b"".join((header, _npy_payload(array, fortran_order)))
+
+
+_DLPACK_CPU = 1
+
+
+def array_view(data: typing.Any) -> typing.Optional[np.ndarray]:
+    """View a CPU tensor or buffer as an ``np.ndarray`` without copying, or return ``None``.
+
+    Accepts objects exposing ``__array_interface__`` (e.g. Arrow-backed NumPy views),
+    ``__dlpack__`` on the CPU (PyTorch, JAX and other DLPack producers) or the buffer
+    protocol (``memoryview``, ``array.array``). ``bytes``, ``bytearray``, strings and file
+    objects are left alone because they are uploaded as file contents.
+    """
+    if isinstance(data, (bytes, bytearray, str, tuple, os.PathLike)) or hasattr(data, "read"):
+        return None
+    if hasattr(data, "__array_interface__"):
+        import numpy as np
+
+        return np.asarray(data)
+    if hasattr(data, "__dlpack__"):
+        import numpy as np
+
+        device = data.__dlpack_device__()[0] if hasattr(data, "__dlpack_device__") else _DLPACK_CPU
+        if device != _DLPACK_CPU:
+            raise ValueError("Only CPU tensors can be uploaded; move the tensor to host memory first.")
+        return np.from_dlpack(data)
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    import numpy as np
+
+    return np.asarray(view)
+
+
+def _is_ndarray(data: typing.Any) -> typing.TypeGuard[np.ndarray]:
+    """Return whether ``data`` is a numpy array without importing numpy.
+
+    numpy is only needed once a caller hands us an array, and a caller can only
+    hold an array if numpy is already imported, so checking ``sys.modules`` keeps
+    ``import conductorquantum`` free of the numpy import cost.
+    """
+    numpy_module = sys.modules.get("numpy")
+    return numpy_module is not None and isinstance(data, numpy_module.ndarray)
+
+
+def _content_chunks(content: typing.Any) -> typing.Callable[[], typing.Iterator[typing.Union[bytes, memoryview]]]:
+    """Return a factory that yields ``content`` in chunks, once per attempt at sending it.
+
+    Seekable files are rewound for every attempt. A non-seekable stream can only be sent
+    once: replaying it for a retry raises :class:`httpx.StreamConsumed` instead of
+    silently uploading an empty file.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return lambda: iter((content,))
+    if isinstance(content, str):
+        return lambda: iter((content.encode("utf-8"),))
+    seekable = callable(getattr(content, "seekable", None)) and content.seekable()
+    sent = False
+
+    def chunks() -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        nonlocal sent
+        if seekable:
+            content.seek(0)
+        elif sent:
+            raise httpx.StreamConsumed()
+        sent = True
+        while chunk := content.read(_CHUNK_SIZE):
+            yield chunk
+
+    return chunks
+
+
+def _file_parts(data: typing.Any) -> typing.Tuple[str, str, typing.Callable[[], typing.Iterator[typing.Any]]]:
+    """Split ``data`` into the file name, content type and a chunk iterator factory."""
+    if _is_ndarray(data):
+        if data.dtype.hasobject:
+            raise ValueError("Compressed uploads do not support arrays with object dtype.")
+        return _DEFAULT_FILE_NAME, "application/octet-stream", lambda: _npy_chunks(data)
+    if isinstance(data, tuple):
+        file_name, content = data[0], data[1]
+        content_type = data[2] if len(data) > 2 and data[2] else "application/octet-stream"
+        return file_name or _DEFAULT_FILE_NAME, content_type, _content_chunks(content)
+    file_name = os.path.basename(getattr(data, "name", "") or "") or _DEFAULT_FILE_NAME
+    return file_name, "application/octet-stream", _content_chunks(data)
+
+
+def _form_value(value: typing.Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class _CompressedMultipart:
+    def __init__(
+        self,
+        *,
+        fields: typing.Mapping[str, typing.Any],
+        file_field: str,
+        data: typing.Union[File, np.ndarray],
+        compression: UploadCompression,
+    ) -> None:
+        self._new_compressor = _compressor_factory(compression)
+        self._fields = {
+            name: _form_value(value) for name, value in fields.items() if value is not None and value is not ...
+        }
+        self._file_field = file_field
+        self._file_name, self._content_type, self._file_chunks = _file_parts(data)
+        self._boundary = os.urandom(16).hex()
+        self.headers: typing.Dict[str, str] = {
+            "Content-Type": f"multipart/form-data; boundary={self._boundary}",
+            "Content-Encoding": compression,
+        }
+
+    def _raw_chunks(self) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        preamble = "".join(
+            f'--{self._boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in self._fields.items()
+        )
+        preamble += (
+            f"--{self._boundary}\r\n"
+            f'Content-Disposition: form-data; name="{self._file_field}"; filename="{self._file_name}"\r\n'
+            f"Content-Type: {self._content_type}\r\n\r\n"
+        )
+        yield preamble.encode("utf-8")
+        yield from self._file_chunks()
+        yield f"\r\n--{self._boundary}--\r\n".encode("utf-8")
+
+    def _compressed_chunks(self) -> typing.Iterator[bytes]:
+        compressor = self._new_compressor()
+        for chunk in self._raw_chunks():
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+class CompressedUpload(_CompressedMultipart):
+    """A compressed multipart body for the sync client.
+
+    Iterating again restarts the body, so the request can be retried.
+    """
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return self._compressed_chunks()
+
+
+class AsyncCompressedUpload(_CompressedMultipart):
+    """A compressed multipart body for the async client; chunks are compressed in a worker thread."""
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        chunks = self._compressed_chunks()
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
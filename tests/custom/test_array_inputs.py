@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import array
+import gzip
+import io
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.models.upload import array_view
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+class _InterfaceOnly:
+    """Exposes only ``__array_interface__``, like Arrow- or image-library-backed buffers."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        self._data = data
+        self.__array_interface__ = data.__array_interface__
+
+
+class _DLPackOnly:
+    """Exposes only the DLPack protocol, like a PyTorch CPU tensor."""
+
+    def __init__(self, data: np.ndarray, device: int = 1) -> None:
+        self._data = data
+        self._device = device
+
+    def __dlpack__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return self._data.__dlpack__(*args, **kwargs)
+
+    def __dlpack_device__(self) -> typing.Tuple[int, int]:
+        return (self._device, 0)
+
+
+def test_array_view_shares_memory() -> None:
+    source = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    for wrapped in (_InterfaceOnly(source), _DLPackOnly(source), memoryview(source.data)):
+        view = array_view(wrapped)
+        assert view is not None
+        assert np.shares_memory(view, source)
+        np.testing.assert_array_equal(view, source)
+
+    buffer = array.array("d", [1.0, 2.0, 3.0])
+    view = array_view(buffer)
+    assert view is not None and view.dtype == np.float64 and np.shares_memory(view, np.frombuffer(buffer))
+
+
+def test_array_view_leaves_file_contents_alone() -> None:
+    for content in (b"raw", bytearray(b"raw"), "text", io.BytesIO(b"raw"), ("a.npy", b"raw")):
+        assert array_view(content) is None
+
+
+def test_non_cpu_dlpack_is_rejected() -> None:
+    with pytest.raises(ValueError, match="CPU"):
+        array_view(_DLPackOnly(np.zeros(3), device=2))
+
+
+def test_run_accepts_dlpack_tensors() -> None:
+    uploads: typing.List[np.ndarray] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        if request.headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        uploads.append(np.load(io.BytesIO(body[body.index(b"\x93NUMPY") :])))
+        return httpx.Response(
+            200,
+            json={
+                "id": "batch-result-id",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "model": MODEL,
+                "batch_size": 2,
+                "output": {"outputs": [{}, {}]},
+            },
+        )
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    source = np.arange(10, dtype=np.int16).reshape(2, 5)
+
+    client.control.models.batch.run(model=MODEL, data=_DLPackOnly(source))
+    client.control.models.batch.run(model=MODEL, data=_InterfaceOnly(source), compression="gzip")
+
+    for uploaded in uploads:
+        np.testing.assert_array_equal(uploaded, source)
+        assert uploaded.dtype == np.int16
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum
+from conductorquantum.models.extended_client import AsyncExtendedModelsClient
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+SLOW_SAVE_SECONDS = 0.2
+
+
+def _batch_response() -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "batch.npy",
+        "model": MODEL,
+        "batch_size": 2,
+        "output": {"outputs": [{"peak_indices": [1]}, {"peak_indices": [2]}]},
+    }
+
+
+def _client() -> AsyncConductorQuantum:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return httpx.Response(200, json=_batch_response())
+
+    return AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.fixture
+def slow_save(monkeypatch: pytest.MonkeyPatch) -> typing.List[str]:
+    """Make np.save block like a large array would, recording the temp paths it writes."""
+    saved: typing.List[str] = []
+    real_save = np.save
+
+    def save(path: str, array: np.ndarray) -> None:
+        time.sleep(SLOW_SAVE_SECONDS)
+        real_save(path, array)
+        saved.append(path)
+
+    monkeypatch.setattr(np, "save", save)
+    return saved
+
+
+async def test_serialization_does_not_block_event_loop(slow_save: typing.List[str]) -> None:
+    client = _client()
+    ticks = 0
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    try:
+        await client.control.models.batch.run(model=MODEL, data=np.zeros((2, 16), dtype=np.float32))
+    finally:
+        beat.cancel()
+
+    assert ticks >= 5
+    assert slow_save and not os.path.exists(slow_save[0])
+
+
+async def test_concurrent_serializations_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client()
+    models = typing.cast(AsyncExtendedModelsClient, client.control.models)
+    models._serialization_slots = asyncio.Semaphore(2)
+    active = peak = 0
+    lock = threading.Lock()
+    real_convert = models._convert_to_file
+
+    def convert(data: typing.Any) -> typing.Any:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return real_convert(data)
+
+    monkeypatch.setattr(models, "_convert_to_file", convert)
+
+    await asyncio.gather(*(models.batch.run(model=MODEL, data=np.zeros((2, 16), dtype=np.float32)) for _ in range(6)))
+
+    assert peak == 2
+
+
+async def test_cancelled_upload_removes_temporary_file(slow_save: typing.List[str]) -> None:
+    client = _client()
+
+    task = asyncio.create_task(client.control.models.batch.run(model=MODEL, data=np.zeros((2, 16), dtype=np.float32)))
+    await asyncio.sleep(SLOW_SAVE_SECONDS / 4)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    deadline = time.monotonic() + 5
+    while not slow_save and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    assert slow_save and not os.path.exists(slow_save[0])
+
+
+async def test_file_inputs_are_not_offloaded(monkeypatch: pytest.MonkeyPatch, tmp_path: typing.Any) -> None:
+    client = _client()
+    path = tmp_path / "trace.npy"
+    np.save(path, np.zeros(16, dtype=np.float32))
+
+    def fail(*args: typing.Any, **kwargs: typing.Any) -> None:
+        raise AssertionError("file inputs should not be sent to a worker thread")
+
+    monkeypatch.setattr(asyncio, "to_thread", fail)
+
+    with open(path, "rb") as handle:
+        await client.control.models.batch.run(model=MODEL, data=handle)
+
+    assert handle.closed
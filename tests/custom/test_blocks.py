@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import threading
+import time
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.models.blocks import axis0_blocks
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+class _LazyBlock:
+    def __init__(self, owner: "_DaskLike", data: np.ndarray) -> None:
+        self._owner = owner
+        self._data = data
+
+    def compute(self) -> np.ndarray:
+        with self._owner.lock:
+            self._owner.computed += 1
+            self._owner.live += 1
+            self._owner.peak = max(self._owner.peak, self._owner.live)
+        time.sleep(0.01)
+        return self._data
+
+
+class _DaskLike:
+    """Chunked lazy array in the shape of a Dask array: ``chunks`` lists every chunk size."""
+
+    def __init__(self, data: np.ndarray, chunks: typing.Tuple[int, ...]) -> None:
+        self._data = data
+        self.shape = data.shape
+        self.chunks = (chunks, (data.shape[1],))
+        self.computed = 0
+        self.live = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __getitem__(self, index: slice) -> _LazyBlock:
+        return _LazyBlock(self, self._data[index])
+
+    def release(self) -> None:
+        with self.lock:
+            self.live -= 1
+
+
+def _client(source: typing.Optional[_DaskLike] = None) -> ConductorQuantum:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        batch = np.load(io.BytesIO(body[body.index(b"\x93NUMPY") :]))
+        if source is not None:
+            source.release()
+        return httpx.Response(
+            200,
+            json={
+                "id": "batch-result-id",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "model": MODEL,
+                "batch_size": len(batch),
+                "output": {"outputs": [{"row": int(item[0])} for item in batch]},
+            },
+        )
+
+    return ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def _rows(count: int) -> np.ndarray:
+    return np.repeat(np.arange(count, dtype=np.int64)[:, None], 3, axis=1)
+
+
+def test_axis0_blocks_follow_chunking() -> None:
+    assert axis0_blocks(_DaskLike(_rows(10), (4, 4, 2))) == [(0, 4), (4, 8), (8, 10)]
+    zarr_like = type("ZarrLike", (), {"shape": (7, 3), "chunks": (3, 3)})()
+    assert axis0_blocks(zarr_like) == [(0, 3), (3, 6), (6, 7)]
+    assert axis0_blocks(_rows(5), block_size=2) == [(0, 2), (2, 4), (4, 5)]
+    with pytest.raises(ValueError):
+        axis0_blocks(_rows(5))
+
+
+def test_map_blocks_is_lazy_bounded_and_ordered() -> None:
+    source = _DaskLike(_rows(40), (5,) * 8)
+    results = _client(source).control.models.batch.map_blocks(model=MODEL, data=source, max_in_flight=3)
+
+    assert source.computed == 0
+    assert len(results) == 40
+    assert [output["row"] for output in results] == list(range(40))
+    assert source.computed == 8
+    assert source.peak <= 3
+
+    # Results are not kept, so iterating again reruns every block.
+    assert [output["row"] for output in results][-1] == 39
+    assert source.computed == 16
+
+
+def test_map_blocks_cache_reuses_finished_blocks() -> None:
+    source = _DaskLike(_rows(20), (5,) * 4)
+    results = _client(source).control.models.batch.map_blocks(model=MODEL, data=source, cache=True)
+
+    assert [output["row"] for output in results] == list(range(20))
+    assert [output["row"] for output in results] == list(range(20))
+    assert source.computed == 4
+
+
+def test_map_blocks_over_memmap_with_block_size(tmp_path: typing.Any) -> None:
+    path = tmp_path / "sweep.npy"
+    np.save(path, _rows(11))
+
+    results = _client().control.models.batch.map_blocks(model=MODEL, data=np.load(path, mmap_mode="r"), block_size=4)
+
+    assert [bounds for bounds, _ in results.blocks()] == [(0, 4), (4, 8), (8, 11)]
+    assert [output["row"] for output in results] == list(range(11))
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import io
+import json
+import pathlib
+import sqlite3
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.models import campaign as campaign_module
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+class _Server:
+    """Stand-in batch endpoint returning each item's first value; fails while ``failing``."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: typing.List[int] = []
+        self.failing = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.failing:
+            return httpx.Response(500, json={"detail": "unavailable"})
+        body = request.read()
+        batch = np.load(io.BytesIO(body[body.index(b"\x93NUMPY") :]))
+        self.batch_sizes.append(len(batch))
+        return httpx.Response(
+            200,
+            json={
+                "id": f"batch-{len(self.batch_sizes)}",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "model": MODEL,
+                "batch_size": len(batch),
+                "output": {"outputs": [{"first": float(item.flat[0])} for item in batch]},
+            },
+        )
+
+
+def _client(server: _Server) -> ConductorQuantum:
+    return ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server)),
+    )
+
+
+@pytest.fixture
+def inputs(tmp_path: pathlib.Path) -> pathlib.Path:
+    root = tmp_path / "scans"
+    (root / "night-1").mkdir(parents=True)
+    for index in range(5):
+        np.save(root / "night-1" / f"trace-{index}.npy", np.full(16, index, dtype=np.float32))
+    for index in range(2):
+        np.save(root / f"diagram-{index}.npy", np.full((4, 4), 10 + index, dtype=np.float64))
+    np.savez(root / "bundle.npz", a=np.full(16, 20, dtype=np.float32), b=np.full(16, 21, dtype=np.float32))
+    (root / "notes.txt").write_text("not an input")
+    return root
+
+
+def test_discover_inputs_expands_directories_and_npz_members(inputs: pathlib.Path) -> None:
+    keys = campaign_module.discover_inputs([inputs])
+
+    assert len(keys) == 9
+    assert f"{inputs / 'bundle.npz'}::a" in keys
+    assert all(not key.endswith(".txt") for key in keys)
+
+
+def test_campaign_batches_by_shape_and_journals_to_sqlite(inputs: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    server = _Server()
+    journal = tmp_path / "journal.sqlite"
+    campaign = _client(server).control.models.campaign(model=MODEL, journal=journal, batch_size=4, max_workers=2)
+
+    summary = campaign.run([inputs])
+
+    assert summary == campaign_module.CampaignSummary(completed=9, skipped=0, failed=[])
+    # Seven float32 traces in batches of at most four, plus one batch of two diagrams.
+    assert sorted(server.batch_sizes) == [2, 3, 4]
+    with sqlite3.connect(journal) as connection:
+        rows = dict(connection.execute("SELECT input, output FROM results WHERE model = ?", (MODEL,)))
+    assert json.loads(rows[str(inputs / "night-1" / "trace-3.npy")]) == {"first": 3.0}
+    assert json.loads(rows[f"{inputs / 'bundle.npz'}::b"]) == {"first": 21.0}
+
+    assert campaign.run([inputs]) == campaign_module.CampaignSummary(completed=0, skipped=9, failed=[])
+    assert len(server.batch_sizes) == 3
+
+
+def test_campaign_resumes_after_failures_with_jsonl_journal(inputs: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    server = _Server()
+    journal = tmp_path / "journal.jsonl"
+    client = _client(server)
+    options: typing.Any = {"max_retries": 0}
+    campaign = client.control.models.campaign(model=MODEL, journal=journal, batch_size=4, request_options=options)
+
+    first = campaign.run([inputs / "night-1"])
+    server.failing = True
+    second = campaign.run([inputs])
+    server.failing = False
+    # A crash mid-write leaves a partial line, which is ignored on resume.
+    with open(journal, "a") as file:
+        file.write('{"model": "coulomb')
+    third = campaign.run([inputs])
+
+    assert first.completed == 5
+    assert second.completed == 0 and second.skipped == 5 and len(second.failed) == 4
+    assert third.completed == 4 and third.skipped == 5 and not third.failed
+
+
+def test_unreadable_inputs_are_reported_without_stopping_the_campaign(
+    inputs: pathlib.Path, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (inputs / "night-1" / "truncated.npy").write_bytes(b"\x93NUMPY\x01")
+    (inputs / "broken.npz").write_bytes(b"not a zip archive")
+    loaded: typing.List[str] = []
+    load_input = campaign_module._load_input
+
+    def recording_load(key: str) -> np.ndarray:
+        loaded.append(key)
+        return load_input(key)
+
+    monkeypatch.setattr(campaign_module, "_load_input", recording_load)
+    server = _Server()
+    campaign = _client(server).control.models.campaign(model=MODEL, journal=tmp_path / "journal.sqlite", batch_size=4)
+
+    summary = campaign.run([inputs])
+
+    assert summary.completed == 9
+    assert sorted(summary.failed) == [str(inputs / "broken.npz"), str(inputs / "night-1" / "truncated.npy")]
+    # Array data is only loaded for inputs that are sent, each exactly once.
+    assert len(loaded) == len(set(loaded)) == 9
+    assert not set(summary.failed) & set(loaded)
+
+
+def test_console_entry_point(
+    inputs: pathlib.Path, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    server = _Server()
+    # The CLI builds its own client; route its default transport to the stand-in server.
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", lambda self, request: server(request))
+    journal = tmp_path / "cli.sqlite"
+
+    code = campaign_module.main([MODEL, str(inputs), "--journal", str(journal), "--token", "t", "--base-url", BASE_URL])
+
+    assert code == 0
+    assert "completed 9, skipped 0, failed 0" in capsys.readouterr().out
+
+
+def test_console_entry_point_requires_a_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("CONDUCTORQUANTUM_TOKEN", raising=False)
+
+    with pytest.raises(SystemExit):
+        campaign_module.main([MODEL, "."])
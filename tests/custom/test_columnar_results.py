@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.core.api_error import ApiError
+from conductorquantum.errors.unprocessable_entity_error import UnprocessableEntityError
+from conductorquantum.model_results.columnar import ResultSet
+from conductorquantum.types.model_result_public_masked import ModelResultPublicMasked
+
+TOKEN = "test-token"
+BASE_URL = "https://api.example.test/v0/control"
+
+
+def _item(index: int, model: str = "coulomb-diamonds") -> typing.Dict[str, typing.Any]:
+    return {
+        "id": f"result-{index}",
+        "model": model,
+        "created_at": f"2025-01-0{index % 9 + 1}T12:00:00Z",
+        "output": {"score": index / 10, "peaks": [index, index + 1], "fit": {"width": index, "label": f"l{index}"}},
+    }
+
+
+ITEMS = [_item(index, "coulomb-diamonds" if index % 2 else "charge-stability") for index in range(7)]
+
+
+def _handler(requests: typing.List[httpx.Request]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        skip = int(request.url.params.get("skip", 0))
+        limit = int(request.url.params.get("limit", len(ITEMS)))
+        return httpx.Response(200, json=ITEMS[skip : skip + limit])
+
+    return handler
+
+
+def _client(requests: typing.List[httpx.Request]) -> ConductorQuantum:
+    return ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(requests)))
+    )
+
+
+def test_from_json_builds_columns() -> None:
+    results = ResultSet.from_json(ITEMS)
+
+    assert len(results) == 7
+    assert results.models == ("charge-stability", "coulomb-diamonds")
+    assert results.model_codes.dtype == np.int32
+    assert list(results.model) == [item["model"] for item in ITEMS]
+    assert results.created_at.dtype == np.dtype("datetime64[us]")
+    assert results.created_at[0] == np.datetime64("2025-01-01T12:00:00")
+    np.testing.assert_array_equal(results.output["score"], [index / 10 for index in range(7)])
+    peaks = results.output["peaks"]
+    assert isinstance(peaks, np.ndarray)
+    assert peaks.shape == (7, 2)
+    np.testing.assert_array_equal(results.output["fit.width"], np.arange(7))
+    assert results.output["fit.label"][3] == "l3"
+
+
+def test_timestamps_with_offsets_are_converted_to_utc() -> None:
+    items = [{**ITEMS[0], "created_at": "2025-01-01T14:00:00+02:00"}, {**ITEMS[1], "created_at": "2025-01-01T12:00:00"}]
+
+    results = ResultSet.from_json(items)
+
+    np.testing.assert_array_equal(results.created_at, np.array(["2025-01-01T12:00:00"] * 2, dtype="datetime64[us]"))
+
+
+def test_filtering_and_concat() -> None:
+    results = ResultSet.from_json(ITEMS)
+
+    diamonds = results[results.model == "coulomb-diamonds"]
+    assert list(diamonds.id) == ["result-1", "result-3", "result-5"]
+    assert diamonds.output["fit.label"] == ["l1", "l3", "l5"]
+    assert len(results[2:4]) == 2
+
+    joined = ResultSet.concat([ResultSet.from_json(ITEMS[:3]), ResultSet.from_json([]), ResultSet.from_json(ITEMS[3:])])
+    assert list(joined.model) == list(results.model)
+    peaks = joined.output["peaks"]
+    assert isinstance(peaks, np.ndarray)
+    assert peaks.shape == (7, 2)
+    assert len(ResultSet.concat([])) == 0
+
+
+def test_missing_fields_become_lists() -> None:
+    items = [ITEMS[0], {**ITEMS[1], "output": {"score": 0.5}}]
+
+    results = ResultSet.from_json(items)
+
+    assert results.output["peaks"][1] is None
+    np.testing.assert_array_equal(results.output["score"], [0.0, 0.5])
+
+
+def test_list_columnar_sends_filters() -> None:
+    requests: typing.List[httpx.Request] = []
+
+    results = _client(requests).control.model_results.list_columnar(limit=3, model_str_id="coulomb-diamonds")
+
+    assert len(results) == 3
+    assert requests[0].url.params["model_str_id"] == "coulomb-diamonds"
+    assert requests[0].url.params["limit"] == "3"
+
+
+def test_list_columnar_raises_sdk_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(422, json={"detail": [{"loc": ["query", "limit"], "msg": "bad", "type": "value_error"}]})
+
+    client = ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    with pytest.raises(UnprocessableEntityError):
+        client.control.model_results.list_columnar(limit=-1)
+
+
+def test_list_columnar_raises_api_error_for_non_json() -> None:
+    client = ConductorQuantum(
+        token=TOKEN,
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(500, text="oops"))),
+    )
+
+    with pytest.raises(ApiError) as info:
+        client.control.model_results.list_columnar()
+    assert info.value.body == "oops"
+
+
+def test_iter_all_pages() -> None:
+    requests: typing.List[httpx.Request] = []
+    model_results = _client(requests).control.model_results
+
+    items = list(model_results.iter_all(page_size=3))
+    assert [item.id for item in items] == [item["id"] for item in ITEMS]
+    assert all(isinstance(item, ModelResultPublicMasked) for item in items)
+    assert [request.url.params["skip"] for request in requests] == ["0", "3", "6"]
+
+    pages = list(model_results.iter_all(page_size=3, columnar=True))
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert list(ResultSet.concat(pages).id) == [item["id"] for item in ITEMS]
+
+
+def test_iter_all_rejects_bad_page_size() -> None:
+    with pytest.raises(ValueError, match="page_size"):
+        next(_client([]).control.model_results.iter_all(page_size=0))
+
+
+async def test_async_iter_all_columnar() -> None:
+    requests: typing.List[httpx.Request] = []
+    handler = _handler(requests)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+    )
+
+    pages = [page async for page in client.control.model_results.iter_all(page_size=4, columnar=True)]
+    items = [item async for item in client.control.model_results.iter_all(page_size=4)]
+
+    assert [len(page) for page in pages] == [4, 3]
+    assert [item.id for item in items] == [item["id"] for item in ITEMS]
+
+
+def test_to_pandas() -> None:
+    pytest.importorskip("pandas")
+
+    frame = ResultSet.from_json(ITEMS).to_pandas()
+
+    assert list(frame.columns[:3]) == ["id", "model", "created_at"]
+    assert str(frame["model"].dtype) == "category"
+    assert frame["output.fit.width"].tolist() == list(range(7))
+
+
+def test_to_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    table = ResultSet.from_json(ITEMS).to_arrow()
+
+    assert table.num_rows == 7
+    assert pa.types.is_dictionary(table.schema.field("model").type)
+    assert table.column("output.peaks").to_pylist()[2] == [2, 3]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import io
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+HAS_ZSTANDARD = importlib.util.find_spec("zstandard") is not None
+
+
+def _batch_response() -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "data.npy",
+        "model": MODEL,
+        "batch_size": 2,
+        "output": {"outputs": [{"peak_indices": [1]}, {"peak_indices": [2]}]},
+    }
+
+
+def _result_response() -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "data.npy",
+        "input_file_size": 1024,
+        "model": MODEL,
+        "output": {"peak_indices": [1]},
+    }
+
+
+def _parse_form(request: httpx.Request, body: bytes) -> typing.Dict[str, typing.Tuple[typing.Dict[str, str], bytes]]:
+    """Decompress and split a multipart body into ``{name: (part headers, content)}``."""
+    assert request.headers["content-encoding"] == "gzip"
+    boundary = request.headers["content-type"].split("boundary=")[1].encode()
+    raw = gzip.decompress(body)
+    assert raw.endswith(b"--" + boundary + b"--\r\n")
+    parts: typing.Dict[str, typing.Tuple[typing.Dict[str, str], bytes]] = {}
+    for part in raw.split(b"--" + boundary)[1:-1]:
+        head, _, content = part[2:].partition(b"\r\n\r\n")
+        headers = dict(line.split(": ", 1) for line in head.decode().split("\r\n"))
+        name = headers["Content-Disposition"].split('name="')[1].split('"')[0]
+        parts[name] = (headers, content[: -len(b"\r\n")])
+    return parts
+
+
+def _npy_bytes(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(24, dtype=np.float32).reshape(2, 12),
+        np.asfortranarray(np.arange(12, dtype=np.int16).reshape(3, 4)),
+        np.arange(40, dtype=">f8").reshape(4, 10)[:, ::3],
+        np.zeros((0, 8), dtype=np.float64),
+    ],
+)
+def test_batch_run_streams_gzip_npy_identical_to_np_save(array: np.ndarray) -> None:
+    captured: typing.List[typing.Dict[str, typing.Tuple[typing.Dict[str, str], bytes]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(_parse_form(request, request.read()))
+        return httpx.Response(200, json=_batch_response())
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    client.control.models.batch.run(model=MODEL, data=array, compression="gzip")
+
+    (form,) = captured
+    assert form["model"][1] == MODEL.encode()
+    headers, content = form["data"]
+    assert 'filename="data.npy"' in headers["Content-Disposition"]
+    assert content == _npy_bytes(array)
+
+
+def test_run_sends_form_fields_and_retries_with_fresh_body() -> None:
+    bodies: typing.List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        if len(bodies) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        form = _parse_form(request, bodies[-1])
+        assert form["plot"][1] == b"true"
+        assert "dark_mode" not in form
+        return httpx.Response(200, json=_result_response())
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    client.control.models.run(model=MODEL, data=np.ones(64), plot=True, compression="gzip")
+
+    assert len(bodies) == 2
+    assert gzip.decompress(bodies[0]) == gzip.decompress(bodies[1])
+
+
+def test_compressed_upload_accepts_file_objects(tmp_path: typing.Any) -> None:
+    path = tmp_path / "trace.npy"
+    np.save(path, np.arange(32, dtype=np.float32))
+    captured: typing.List[typing.Dict[str, typing.Tuple[typing.Dict[str, str], bytes]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(_parse_form(request, request.read()))
+        return httpx.Response(200, json=_batch_response())
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    with open(path, "rb") as handle:
+        client.control.models.batch.run(model=MODEL, data=handle, compression="gzip")
+
+    assert 'filename="trace.npy"' in captured[0]["data"][0]["Content-Disposition"]
+    assert captured[0]["data"][1] == path.read_bytes()
+
+
+class _Pipe(io.RawIOBase):
+    """A readable, non-seekable stream, like a pipe or socket."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__()
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        return self._data.readinto(buffer)
+
+
+def test_retrying_a_non_seekable_stream_raises_instead_of_sending_nothing() -> None:
+    forms: typing.List[typing.Dict[str, typing.Tuple[typing.Dict[str, str], bytes]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        forms.append(_parse_form(request, request.read()))
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(httpx.StreamConsumed):
+        client.control.models.batch.run(model=MODEL, data=io.BufferedReader(_Pipe(b"\x93NUMPY")), compression="gzip")
+
+    assert [form["data"][1] for form in forms] == [b"\x93NUMPY"]
+
+
+async def test_async_batch_run_streams_compressed_body() -> None:
+    array = np.linspace(0, 1, 4096, dtype=np.float32).reshape(2, 2048)
+    captured: typing.List[typing.Dict[str, typing.Tuple[typing.Dict[str, str], bytes]]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(_parse_form(request, await request.aread()))
+        return httpx.Response(200, json=_batch_response())
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    await client.control.models.batch.run(model=MODEL, data=array, compression="gzip")
+
+    assert captured[0]["data"][1] == _npy_bytes(array)
+
+
+@pytest.mark.skipif(HAS_ZSTANDARD, reason="zstandard is installed")
+def test_zstd_without_zstandard_raises_helpful_error() -> None:
+    client = ConductorQuantum(token="test-token", base_url=BASE_URL)
+
+    with pytest.raises(ImportError, match="pip install zstandard"):
+        client.control.models.batch.run(model=MODEL, data=np.zeros((2, 4)), compression="zstd")
+
+
+def test_object_arrays_are_rejected() -> None:
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(500))),
+    )
+
+    with pytest.raises(ValueError, match="object dtype"):
+        client.control.models.batch.run(model=MODEL, data=np.array([{"a": 1}], dtype=object), compression="gzip")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing
+
+import httpx
+import numpy as np
+import pydantic
+import pytest
+
+from conductorquantum import (
+    AsyncConductorQuantum,
+    ConductorQuantum,
+    ModelBatchResultPublic,
+    ModelResultPublic,
+    ModelResultPublicMasked,
+)
+from conductorquantum.core.decoding import parse_obj_as
+
+BASE_URL = "https://api.example.test/v0/control"
+TOKEN = "test-token"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _masked_result(index: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "id": f"result-{index}",
+        "model": MODEL,
+        "created_at": "2026-05-13T19:00:00Z",
+        "output": {"peak_indices": [index, index + 2], "score": None},
+    }
+
+
+def _result() -> typing.Dict[str, typing.Any]:
+    return {
+        **_masked_result(0),
+        "input_file_name": "data.npy",
+        "input_file_size": 1024,
+        "user_vote": 1,
+        "server_extra": {"trace": "abc"},
+    }
+
+
+def _batch_result() -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "batch.npy",
+        "model": MODEL,
+        "batch_size": 2,
+        "output": {"outputs": [{"peak_indices": [1, 3]}, {"peak_indices": [2, 4]}]},
+    }
+
+
+@pytest.mark.parametrize(
+    "type_, payload",
+    [
+        (ModelResultPublic, _result()),
+        (typing.List[ModelResultPublicMasked], [_masked_result(i) for i in range(3)]),
+        (ModelBatchResultPublic, _batch_result()),
+        (typing.Dict[str, str], {"detail": "Vote removed"}),
+    ],
+)
+def test_trusted_decode_matches_validated_decode(type_: typing.Any, payload: typing.Any) -> None:
+    validated = parse_obj_as(type_, payload)
+    trusted = parse_obj_as(type_, payload, decode_mode="trusted")
+
+    assert trusted == validated
+
+
+def test_trusted_decode_parses_datetimes_and_keeps_extras() -> None:
+    result = parse_obj_as(ModelResultPublic, _result(), decode_mode="trusted")
+
+    assert result.created_at == dt.datetime(2026, 5, 13, 19, 0, tzinfo=dt.timezone.utc)
+    assert result.dict()["server_extra"] == {"trace": "abc"}
+
+
+def test_trusted_decode_skips_validation() -> None:
+    payload = {**_masked_result(0), "output": "not-a-dict"}
+
+    result = parse_obj_as(ModelResultPublicMasked, payload, decode_mode="trusted")
+
+    assert result.output == "not-a-dict"
+
+
+def _listing_client(captured: typing.List[httpx.Request], **client_kwargs: typing.Any) -> ConductorQuantum:
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(200, json=[{**_masked_result(0), "output": "not-a-dict"}])
+
+    return ConductorQuantum(
+        token=TOKEN,
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **client_kwargs,
+    )
+
+
+def test_client_decode_mode_applies_to_generated_endpoints() -> None:
+    captured: typing.List[httpx.Request] = []
+    client = _listing_client(captured, decode_mode="trusted")
+
+    results = client.control.model_results.list(limit=1)
+
+    assert results[0].output == "not-a-dict"
+    assert len(captured) == 1
+
+
+def test_request_option_overrides_client_decode_mode() -> None:
+    captured: typing.List[httpx.Request] = []
+    client = _listing_client(captured, decode_mode="trusted")
+
+    with pytest.raises(pydantic.ValidationError, match="output"):
+        client.control.model_results.list(limit=1, request_options={"decode_mode": "validate"})
+
+
+async def test_async_batch_run_honours_request_decode_mode() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_batch_result())
+
+    client = AsyncConductorQuantum(
+        token=TOKEN,
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    result = await client.control.models.batch.run(
+        model=MODEL,
+        data=np.zeros((2, 128), dtype=np.float32),
+        request_options={"decode_mode": "trusted"},
+    )
+
+    assert isinstance(result, ModelBatchResultPublic)
+    assert result.created_at == dt.datetime(2026, 5, 13, 19, 0, tzinfo=dt.timezone.utc)
+    assert result.output["outputs"][1] == {"peak_indices": [2, 4]}
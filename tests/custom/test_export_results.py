@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import threading
+import typing
+
+import httpx
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.errors.not_found_error import NotFoundError
+from conductorquantum.model_results.extended_client import prefetched_pages
+
+TOKEN = "test-token"
+BASE_URL = "https://api.example.test/v0/control"
+
+
+def _items(count: int) -> typing.List[typing.Dict[str, typing.Any]]:
+    return [
+        {
+            "id": f"result-{index}",
+            "model": f"model-{index % 2}",
+            "created_at": "2026-05-13T19:00:00Z",
+            "output": {"score": float(index), "peaks": [index, index + 1]},
+        }
+        for index in range(count)
+    ]
+
+
+def _client(items: typing.List[typing.Dict[str, typing.Any]], requests: typing.List[httpx.Request]) -> ConductorQuantum:
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            requests.append(request)
+        skip = int(request.url.params["skip"])
+        limit = int(request.url.params["limit"])
+        return httpx.Response(200, json=items[skip : skip + limit])
+
+    return ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+
+def test_prefetched_pages_stops_at_short_page() -> None:
+    fetched: typing.List[int] = []
+
+    def fetch(skip: int) -> typing.List[int]:
+        fetched.append(skip)
+        return list(range(skip, min(skip + 10, 25)))
+
+    pages = list(prefetched_pages(fetch, page_size=10, prefetch=3, size=len))
+
+    assert [page[0] for page in pages] == [0, 10, 20]
+    assert sorted(fetched)[:3] == [0, 10, 20]
+
+
+def test_prefetched_pages_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError, match="prefetch"):
+        next(prefetched_pages(lambda skip: [], page_size=10, prefetch=0, size=len))
+
+
+def test_export_jsonl(tmp_path: pathlib.Path) -> None:
+    items = _items(23)
+    requests: typing.List[httpx.Request] = []
+    path = tmp_path / "results.jsonl"
+
+    written = _client(items, requests).control.model_results.export(
+        path, format="jsonl", page_size=5, model_str_id="model-1"
+    )
+
+    assert written == 23
+    assert [json.loads(line) for line in path.read_text().splitlines()] == items
+    assert all(request.url.params["model_str_id"] == "model-1" for request in requests)
+
+
+def test_export_exact_multiple_of_page_size(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "results.jsonl"
+
+    written = _client(_items(10), []).control.model_results.export(path, format="jsonl", page_size=5, prefetch=1)
+
+    assert written == 10
+    assert len(path.read_text().splitlines()) == 10
+
+
+def test_export_raises_sdk_errors(tmp_path: pathlib.Path) -> None:
+    client = ConductorQuantum(
+        token=TOKEN,
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404, json={"detail": "Not Found"}))
+        ),
+    )
+
+    with pytest.raises(NotFoundError):
+        client.control.model_results.export(tmp_path / "results.jsonl", format="jsonl")
+
+
+def test_export_rejects_unknown_format(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match="Unknown export format"):
+        _client([], []).control.model_results.export(tmp_path / "results.csv", format="csv")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_export_arrow_formats(tmp_path: pathlib.Path, format: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    items = _items(12)
+    # The last page leaves an output field out; it is written as nulls.
+    for item in items[10:]:
+        del item["output"]["peaks"]
+    path = tmp_path / f"results.{format}"
+
+    written = _client(items, []).control.model_results.export(path, format=format, page_size=5)  # type: ignore[arg-type]
+
+    if format == "parquet":
+        table = pytest.importorskip("pyarrow.parquet").read_table(path)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    assert written == table.num_rows == 12
+    assert table.column("id").to_pylist() == [item["id"] for item in items]
+    assert table.column("output.peaks").to_pylist()[9:] == [[9, 10], None, None]
+
+
+def test_failed_export_removes_the_partial_file(tmp_path: pathlib.Path) -> None:
+    items = _items(12)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        skip = int(request.url.params["skip"])
+        if skip >= 10:
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json=items[skip : skip + 5])
+
+    client = ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    path = tmp_path / "results.jsonl"
+
+    with pytest.raises(NotFoundError):
+        client.control.model_results.export(path, format="jsonl", page_size=5, prefetch=1)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("format", "output"),
+    [("jsonl", "columns"), ("parquet", "columns"), ("parquet", "json"), ("arrow", "columns"), ("arrow", "json")],
+)
+def test_failed_export_leaves_an_existing_file_alone(tmp_path: pathlib.Path, format: str, output: str) -> None:
+    if format != "jsonl":
+        pytest.importorskip("pyarrow")
+    items = _items(12)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        skip = int(request.url.params["skip"])
+        if skip >= 10:
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json=items[skip : skip + 5])
+
+    client = ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    path = tmp_path / f"results.{format}"
+    path.write_bytes(b"previous export")
+
+    with pytest.raises(NotFoundError):
+        client.control.model_results.export(
+            path,
+            format=format,  # type: ignore[arg-type]
+            output=output,  # type: ignore[arg-type]
+            page_size=5,
+            prefetch=1,
+        )
+    assert list(tmp_path.iterdir()) == [path]
+    assert path.read_bytes() == b"previous export"
+
+
+def test_export_replaces_an_existing_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "results.jsonl"
+    path.write_text("previous export\n")
+
+    written = _client(_items(7), []).control.model_results.export(path, format="jsonl", page_size=5)
+
+    assert written == 7
+    assert [json.loads(line)["id"] for line in path.read_text().splitlines()] == [f"result-{i}" for i in range(7)]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_arrow_export_with_a_new_output_field_removes_the_partial_file(tmp_path: pathlib.Path) -> None:
+    pytest.importorskip("pyarrow")
+    items = _items(12)
+    for item in items[10:]:
+        item["output"]["width"] = 1.0
+    path = tmp_path / "results.parquet"
+
+    with pytest.raises(ValueError, match="output='json'"):
+        _client(items, []).control.model_results.export(path, page_size=5)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_arrow_export_stores_varying_outputs_as_json(tmp_path: pathlib.Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    items = _items(12)
+    for item in items[10:]:
+        item["output"] = {"label": "none"}
+    path = tmp_path / "results.parquet"
+
+    written = _client(items, []).control.model_results.export(path, output="json", page_size=5)
+
+    table = pq.read_table(path)
+    assert written == table.num_rows == 12
+    assert table.column_names == ["id", "model", "created_at", "output"]
+    assert [json.loads(value) for value in table.column("output").to_pylist()] == [item["output"] for item in items]
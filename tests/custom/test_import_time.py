@@ -0,0 +1,115 @@
+"""Import-time budget for ``import conductorquantum`` plus client construction.
+
+Serverless callers pay the import cost on every cold start, so these tests run
+``python -X importtime`` in a fresh interpreter and check two things:
+
+* heavy optional stacks (numpy, the Coda client) are not imported until used;
+* the SDK's own modules stay within a self-time budget.
+
+The budget only counts ``conductorquantum.*`` self time, which is stable across
+machines, rather than wall-clock time dominated by third-party packages.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import typing
+
+import pytest
+
+# Ceiling on the summed self time of conductorquantum.* modules: measured locally at
+# roughly 40 ms, with 2.5x headroom for slow CI runners.
+SDK_SELF_IMPORT_BUDGET_US = 100_000
+
+LAZY_MODULES = (
+    "numpy",
+    "conductorquantum.coda",
+    "conductorquantum.coda.client",
+)
+
+_COLD_START = "import conductorquantum; conductorquantum.ConductorQuantum(token='test-token')"
+
+
+def _import_times(code: str) -> typing.Dict[str, int]:
+    """Run ``code`` under ``-X importtime`` and return self time (us) per module."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: typing.Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative_us, module = line[len("import time:") :].split("|")
+        timings[module.strip()] = int(self_us)
+    return timings
+
+
+@pytest.fixture(scope="module")
+def cold_start_timings() -> typing.Dict[str, int]:
+    return _import_times(_COLD_START)
+
+
+def test_cold_start_does_not_import_heavy_modules(cold_start_timings: typing.Dict[str, int]) -> None:
+    eager = [module for module in LAZY_MODULES if module in cold_start_timings]
+    assert eager == [], f"modules imported eagerly on cold start: {eager}"
+
+
+def test_cold_start_sdk_import_budget(cold_start_timings: typing.Dict[str, int]) -> None:
+    sdk_self_us = sum(us for module, us in cold_start_timings.items() if module.startswith("conductorquantum"))
+    assert sdk_self_us < SDK_SELF_IMPORT_BUDGET_US, (
+        f"conductorquantum modules took {sdk_self_us} us to import (budget {SDK_SELF_IMPORT_BUDGET_US} us)"
+    )
+
+
+def test_coda_stack_loads_on_first_access() -> None:
+    timings = _import_times("import conductorquantum; conductorquantum.ConductorQuantum(token='coda_test-token').coda")
+    assert "conductorquantum.coda.client" in timings
+
+
+def test_coda_environment_is_read_on_first_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+
+    import conductorquantum
+
+    monkeypatch.delenv("CODA_BASE_URL", raising=False)
+    monkeypatch.setenv("CODA_API_BASE_URL", "http://coda.example.test:port")
+    client = conductorquantum.ConductorQuantum(token="coda_test-token")
+
+    # A malformed URL no longer fails construction; it is reported when Coda is first used.
+    with pytest.raises(httpx.InvalidURL):
+        client.coda
+    monkeypatch.setenv("CODA_API_BASE_URL", "https://coda.example.test/v0/coda")
+    assert str(client.coda._client.base_url) == "https://coda.example.test/v0/coda/"
+
+
+def test_coda_client_is_built_once_under_concurrent_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+    import time
+
+    import conductorquantum
+    from conductorquantum.coda.client import CodaClient
+
+    built: typing.List[CodaClient] = []
+    original_init = CodaClient.__init__
+
+    def slow_init(self: CodaClient, **kwargs: typing.Any) -> None:
+        # Widen the window in which a second thread could start building its own client.
+        time.sleep(0.05)
+        original_init(self, **kwargs)
+        built.append(self)
+
+    monkeypatch.setattr(CodaClient, "__init__", slow_init)
+    client = conductorquantum.ConductorQuantum(token="coda_test-token")
+    seen: typing.List[CodaClient] = []
+    threads = [threading.Thread(target=lambda: seen.append(client.coda)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(coda is built[0] for coda in seen)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import typing
+
+import httpx
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.coda._http import parse_json
+from conductorquantum.coda.errors import CodaAPIError
+from conductorquantum.core import json_codec
+
+BASE_URL = "https://api.example.test/v0/control"
+INSTALLED_CODECS = [name for name in json_codec.JSON_CODECS if json_codec._load_decoder(name) is not None]
+
+
+@pytest.fixture(params=INSTALLED_CODECS)
+def codec(request: pytest.FixtureRequest) -> typing.Iterator[str]:
+    json_codec.set_json_codec(request.param)
+    yield request.param
+    json_codec.set_json_codec(None)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"outputs": [{"peak_indices": [1, 2]}, {"score": 0.25, "label": "\\u00e9"}]}',
+        '{"detail": "Vote removed"}',
+        bytearray(b"[1, 2.5, null, true]"),
+        memoryview(b'{"nested": {"empty": []}}'),
+    ],
+)
+def test_loads_matches_stdlib(codec: str, document: typing.Any) -> None:
+    assert json_codec.loads(document) == json.loads(bytes(document) if isinstance(document, memoryview) else document)
+
+
+@pytest.mark.parametrize("document", ['{"value": NaN}', '{"value": -Infinity}'])
+def test_loads_accepts_non_finite_numbers(codec: str, document: str) -> None:
+    assert repr(json_codec.loads(document)) == repr(json.loads(document))
+
+
+def test_loads_raises_stdlib_decode_error(codec: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b'{"unterminated": ')
+
+
+def test_response_json_honours_non_utf8_charset(codec: str) -> None:
+    response = httpx.Response(
+        200,
+        content='{"name": "réseau"}'.encode("latin-1"),
+        headers={"content-type": "application/json; charset=latin-1"},
+    )
+
+    assert json_codec.response_json(response) == {"name": "réseau"}
+
+
+def test_codec_can_be_pinned_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(json_codec.JSON_CODEC_ENV_VAR, "json")
+    json_codec.set_json_codec(None)
+    try:
+        assert json_codec.get_json_codec() == "json"
+    finally:
+        monkeypatch.delenv(json_codec.JSON_CODEC_ENV_VAR)
+        json_codec.set_json_codec(None)
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        json_codec.set_json_codec("yaml")
+
+
+def test_generated_endpoints_decode_with_active_codec(codec: str) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"detail": "Vote removed"})
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    assert client.control.model_results.remove_vote_on_model_result("result-id") == {"detail": "Vote removed"}
+
+
+def test_coda_parse_json_keeps_decode_error_message(codec: str) -> None:
+    request = httpx.Request("POST", "https://api.example.test/v0/coda/simulate")
+    response = httpx.Response(200, content=b"<html>", request=request)
+
+    with pytest.raises(CodaAPIError, match="Response body is not JSON .* at char 0"):
+        parse_json(response)
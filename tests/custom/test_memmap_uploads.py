@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import gzip
+import io
+import pathlib
+import tempfile
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.models.extended_client import _open_npy_path
+from conductorquantum.models.upload import NpyStream
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _npy_bytes(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+def _uploaded_file(request: httpx.Request) -> bytes:
+    body = request.read()
+    if request.headers.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+    boundary = request.headers["content-type"].split("boundary=")[1].encode()
+    for part in body.split(b"--" + boundary):
+        head, _, content = part.partition(b"\r\n\r\n")
+        if b'name="data"; filename=' in head:
+            return content[: -len(b"\r\n")]
+    raise AssertionError("no file part in upload")
+
+
+def _batch_response() -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "data.npy",
+        "model": MODEL,
+        "batch_size": 2,
+        "output": {"outputs": [{}, {}]},
+    }
+
+
+@pytest.fixture
+def no_temp_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        raise AssertionError("a temporary file was written")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail)
+
+
+def _client(requests: typing.List[httpx.Request]) -> ConductorQuantum:
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, json=_batch_response())
+
+    return ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_npy_stream_matches_np_save(order: typing.Literal["C", "F"]) -> None:
+    array = np.asarray(np.arange(24, dtype=np.float32).reshape(4, 6), order=order)
+    stream = NpyStream(array)
+
+    assert stream.read() == _npy_bytes(array)
+    assert stream.seek(0, io.SEEK_END) == len(_npy_bytes(array))
+    stream.seek(3)
+    assert stream.read(10) == _npy_bytes(array)[3:13]
+
+
+def test_memmap_is_streamed_from_its_pages(tmp_path: pathlib.Path, no_temp_files: None) -> None:
+    path = tmp_path / "scan.npy"
+    np.save(path, np.random.default_rng(0).standard_normal((2, 5000)))
+    array = np.load(path, mmap_mode="r")
+    requests: typing.List[httpx.Request] = []
+
+    _client(requests).control.models.batch.run(model=MODEL, data=array)
+
+    assert _uploaded_file(requests[0]) == path.read_bytes()
+    assert "content-length" in requests[0].headers
+
+
+def test_raw_memmap_slice_gets_npy_header(tmp_path: pathlib.Path, no_temp_files: None) -> None:
+    raw = np.memmap(tmp_path / "raw.bin", dtype=np.int16, mode="w+", shape=(10, 300))
+    raw[:] = np.arange(3000, dtype=np.int16).reshape(10, 300)
+    raw.flush()
+    requests: typing.List[httpx.Request] = []
+
+    _client(requests).control.models.batch.run(model=MODEL, data=raw[2:4])
+
+    assert _uploaded_file(requests[0]) == _npy_bytes(np.asarray(raw[2:4]))
+
+
+@pytest.mark.parametrize("as_str", [False, True])
+def test_npy_path_is_uploaded_as_is(tmp_path: pathlib.Path, no_temp_files: None, as_str: bool) -> None:
+    path = tmp_path / "trace.npy"
+    np.save(path, np.arange(10.0).reshape(2, 5))
+    requests: typing.List[httpx.Request] = []
+
+    _client(requests).control.models.batch.run(model=MODEL, data=str(path) if as_str else path)
+
+    assert _uploaded_file(requests[0]) == path.read_bytes()
+
+
+@pytest.mark.parametrize("name", ["trace.csv", "missing.npy"])
+def test_other_paths_are_not_opened_as_npy(tmp_path: pathlib.Path, name: str) -> None:
+    (tmp_path / "trace.csv").write_text("1,2,3\n")
+    path = tmp_path / name
+
+    assert _open_npy_path(path) is path
+    assert _open_npy_path(str(path)) == str(path)
+
+
+def test_npy_path_with_compression(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "trace.npy"
+    np.save(path, np.arange(10.0).reshape(2, 5))
+    requests: typing.List[httpx.Request] = []
+
+    _client(requests).control.models.batch.run(model=MODEL, data=path, compression="gzip")
+
+    assert _uploaded_file(requests[0]) == path.read_bytes()
+
+
+def test_strided_memmap_falls_back_to_a_temporary_copy(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "scan.npy"
+    np.save(path, np.arange(40.0).reshape(4, 10))
+    strided = np.load(path, mmap_mode="r")[:, ::2]
+    requests: typing.List[httpx.Request] = []
+
+    _client(requests).control.models.batch.run(model=MODEL, data=strided)
+
+    assert _uploaded_file(requests[0]) == _npy_bytes(np.asarray(strided))
+
+
+async def test_async_memmap_upload(tmp_path: pathlib.Path, no_temp_files: None) -> None:
+    path = tmp_path / "scan.npy"
+    np.save(path, np.arange(20.0).reshape(2, 10))
+    requests: typing.List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        requests.append(request)
+        return httpx.Response(200, json=_batch_response())
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    await client.control.models.batch.run(model=MODEL, data=np.load(path, mmap_mode="r"))
+
+    assert _uploaded_file(requests[0]) == path.read_bytes()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum
+from conductorquantum.core.api_error import ApiError
+from conductorquantum.types.model_batch_result_public import ModelBatchResultPublic
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _client(delay: float, calls: typing.List[str], *, status: int = 200) -> AsyncConductorQuantum:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(delay)
+        if status != 200:
+            return httpx.Response(status, json={"detail": "boom"})
+        body = request.read()
+        array = np.load(io.BytesIO(body[body.index(b"\x93NUMPY") :]))
+        if request.url.path.endswith("/batch"):
+            return httpx.Response(
+                200,
+                json={
+                    "id": "batch-result-id",
+                    "created_at": "2026-05-13T19:00:00Z",
+                    "input_file_name": "data.npy",
+                    "model": MODEL,
+                    "batch_size": len(array),
+                    "output": {"outputs": [{"value": float(item[0])} for item in array]},
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "id": "result-id",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "input_file_size": 1024,
+                "model": MODEL,
+                "output": {"value": float(array[0])},
+            },
+        )
+
+    return AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+async def _feed(count: int, interval: float = 0.0) -> typing.AsyncIterator[np.ndarray]:
+    for index in range(count):
+        yield np.full(4, index, dtype=np.float32)
+        await asyncio.sleep(interval)
+
+
+async def test_drop_oldest_keeps_buffer_bounded_when_api_falls_behind() -> None:
+    calls: typing.List[str] = []
+    runner = _client(0.05, calls).control.models.online(model=MODEL, buffer_size=3, max_in_flight=1)
+
+    results = [item async for item in runner.run(_feed(20))]
+
+    assert runner.stats.received == 20
+    assert runner.stats.dropped > 0
+    assert runner.stats.completed + runner.stats.dropped == 20
+    assert len(results) == runner.stats.calls == len(calls)
+    # The last arrays are never the ones dropped.
+    assert results[-1].result.output["value"] == 19
+    assert all(item.size == 1 and item.latency > 0 for item in results)
+    p50 = runner.stats.latency_percentile(50)
+    assert p50 is not None and p50 <= typing.cast(float, runner.stats.latency_percentile(100))
+
+
+async def test_stalled_consumer_pauses_the_calls() -> None:
+    calls: typing.List[str] = []
+    runner = _client(0.0, calls).control.models.online(model=MODEL, buffer_size=3, max_in_flight=1)
+    results = runner.run(_feed(50, interval=0.002))
+
+    first = await results.__anext__()
+    await asyncio.sleep(0.3)
+    # One result read, buffer_size waiting to be read and one call waiting for room.
+    assert len(calls) <= 1 + 3 + 1
+    rest = [item async for item in results]
+
+    assert first.result.output["value"] == 0
+    assert runner.stats.dropped > 0
+    assert runner.stats.completed + runner.stats.dropped == 50
+    assert 1 + len(rest) == runner.stats.calls == len(calls)
+    assert rest[-1].result.output["value"] == 49
+
+
+async def test_coalesce_batches_everything_buffered() -> None:
+    calls: typing.List[str] = []
+    runner = _client(0.05, calls).control.models.online(model=MODEL, buffer_size=64, max_in_flight=1, policy="coalesce")
+
+    results = [item async for item in runner.run(_feed(20, interval=0.005))]
+
+    assert runner.stats.dropped == 0
+    assert sum(item.size for item in results) == 20
+    assert len(results) < 20
+    assert all(path.endswith("/models/batch") for path in calls)
+    values = [
+        output["value"]
+        for item in results
+        for output in typing.cast(ModelBatchResultPublic, item.result).output["outputs"]
+    ]
+    assert sorted(values) == list(range(20))
+
+
+async def test_queue_source_and_parallel_calls() -> None:
+    calls: typing.List[str] = []
+    runner = _client(0.02, calls).control.models.online(model=MODEL, buffer_size=16, max_in_flight=4)
+    queue: asyncio.Queue[typing.Optional[np.ndarray]] = asyncio.Queue()
+    for index in range(8):
+        queue.put_nowait(np.full(2, index, dtype=np.float32))
+    queue.put_nowait(None)
+
+    results = [item async for item in runner.run(queue)]
+
+    values = []
+    for item in results:
+        assert item.result.output is not None
+        value = item.result.output["value"]
+        assert value is not None
+        values.append(value)
+    assert sorted(values) == list(range(8))
+    assert runner.stats.dropped == 0
+
+
+async def test_errors_stop_the_run() -> None:
+    calls: typing.List[str] = []
+    runner = _client(0.0, calls, status=500).control.models.online(
+        model=MODEL, max_in_flight=1, request_options={"max_retries": 0}
+    )
+
+    with pytest.raises(ApiError):
+        async for _ in runner.run(_feed(5)):
+            pass
+
+
+def test_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        _client(0.0, []).control.models.online(model=MODEL, policy="newest")  # type: ignore[arg-type]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing
+
+import numpy as np
+
+from conductorquantum import ModelBatchResultPublic, ModelResultPublicMasked
+from conductorquantum.core.decoding import parse_obj_as
+from conductorquantum.models.outputs import batch_output_as_arrays, output_as_arrays
+
+CREATED_AT = dt.datetime(2026, 5, 13, 19, 0, tzinfo=dt.timezone.utc)
+
+
+def _batch_result(outputs: typing.List[typing.Any]) -> ModelBatchResultPublic:
+    return ModelBatchResultPublic(
+        id="batch-result-id",
+        created_at=CREATED_AT,
+        input_file_name="batch.npy",
+        model="coulomb-blockade-peak-detector-v2",
+        batch_size=len(outputs),
+        output={"outputs": outputs, "model_version": "2"},
+    )
+
+
+def test_output_as_arrays_converts_numeric_lists() -> None:
+    result = ModelResultPublicMasked(
+        id="result-id",
+        model="coulomb-blockade-peak-detector-v2",
+        created_at=CREATED_AT,
+        output={
+            "heatmap": [[0.0, 0.5], [1.0, 1.5]],
+            "peak_indices": [3, 7],
+            "labels": ["left", "right"],
+            "fit": {"params": [1.0, 2.0], "converged": True},
+            "empty": [],
+            "score": None,
+        },
+    )
+
+    arrays = output_as_arrays(result.output)
+
+    assert arrays["heatmap"].shape == (2, 2) and arrays["heatmap"].dtype == np.float64
+    assert arrays["heatmap"].flags.c_contiguous
+    np.testing.assert_array_equal(arrays["peak_indices"], np.array([3, 7]))
+    assert arrays["labels"] == ["left", "right"]
+    np.testing.assert_array_equal(arrays["fit"]["params"], np.array([1.0, 2.0]))
+    assert arrays["fit"]["converged"] is True
+    assert arrays["empty"] == [] and arrays["score"] is None
+    assert isinstance(result.output["heatmap"], list)
+
+
+def test_output_as_arrays_keeps_ragged_lists() -> None:
+    arrays = output_as_arrays({"peaks": [[1, 2], [3]]})
+
+    assert isinstance(arrays["peaks"], list)
+    np.testing.assert_array_equal(arrays["peaks"][0], np.array([1, 2]))
+
+
+def test_batch_output_as_arrays_stacks_along_first_axis() -> None:
+    outputs = [{"trace": [float(index)] * 4, "peak_indices": [index, index + 1], "label": "ok"} for index in range(3)]
+
+    arrays = batch_output_as_arrays(_batch_result(outputs).output)
+
+    assert arrays["model_version"] == "2"
+    assert arrays["outputs"]["trace"].shape == (3, 4)
+    np.testing.assert_array_equal(arrays["outputs"]["trace"][2], np.full(4, 2.0))
+    np.testing.assert_array_equal(arrays["outputs"]["peak_indices"], np.array([[0, 1], [1, 2], [2, 3]]))
+    assert arrays["outputs"]["label"] == ["ok", "ok", "ok"]
+
+
+def test_batch_output_as_arrays_handles_mismatched_items() -> None:
+    outputs = [{"peaks": [1, 2], "extra": [0.5]}, {"peaks": [3]}]
+
+    arrays = batch_output_as_arrays({"outputs": outputs})
+
+    np.testing.assert_array_equal(arrays["outputs"]["peaks"][0], np.array([1, 2]))
+    np.testing.assert_array_equal(arrays["outputs"]["peaks"][1], np.array([3]))
+    assert arrays["outputs"]["extra"][1] is None
+
+
+def test_batch_output_as_arrays_stacks_plain_array_items() -> None:
+    arrays = batch_output_as_arrays({"outputs": [[1.0, 2.0], [3.0, 4.0]]})
+
+    assert arrays["outputs"].shape == (2, 2)
+
+
+def test_trusted_batch_results_convert_to_arrays() -> None:
+    payload = {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "batch.npy",
+        "model": "coulomb-blockade-peak-detector-v2",
+        "batch_size": 2,
+        "output": {"outputs": [{"trace": [1, 2]}, {"trace": [3, 4]}]},
+    }
+
+    result = parse_obj_as(ModelBatchResultPublic, payload, decode_mode="trusted")
+
+    np.testing.assert_array_equal(batch_output_as_arrays(result.output)["outputs"]["trace"], np.array([[1, 2], [3, 4]]))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import typing
+
+from typing_extensions import Annotated, TypedDict
+
+from conductorquantum import ModelResultPublicMasked
+from conductorquantum.core.decoding import get_type_adapter, parse_obj_as
+from conductorquantum.core.pydantic_utilities import UniversalBaseModel
+from conductorquantum.core.serialization import FieldMetadata
+
+
+class _AliasedPayload(TypedDict):
+    trace_id: Annotated[str, FieldMetadata(alias="traceId")]
+
+
+class _AliasedModel(UniversalBaseModel):
+    payloads: typing.List[_AliasedPayload]
+
+
+def test_type_adapter_is_built_once_per_type() -> None:
+    list_type = typing.List[ModelResultPublicMasked]
+
+    assert get_type_adapter(list_type) is get_type_adapter(list_type)
+    assert get_type_adapter(list_type) is not get_type_adapter(ModelResultPublicMasked)
+
+
+def test_parse_obj_as_reuses_cached_adapter() -> None:
+    payload = [{"id": "result-1", "model": "m", "created_at": "2026-05-13T19:00:00Z", "output": {}}]
+
+    first = parse_obj_as(typing.List[ModelResultPublicMasked], payload)
+    second = parse_obj_as(typing.List[ModelResultPublicMasked], payload)
+
+    assert first == second
+    assert first[0].id == "result-1"
+
+
+def test_parse_obj_as_still_dealiases_nested_fields() -> None:
+    parsed = parse_obj_as(_AliasedModel, {"payloads": [{"traceId": "abc"}]})
+
+    assert parsed.payloads == [{"trace_id": "abc"}]
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.models.preflight import InputShapeError, parse_shape_requirements
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _catalog() -> typing.List[typing.Dict[str, typing.Any]]:
+    return [
+        {
+            "id": MODEL,
+            "name": "Coulomb blockade peak detector",
+            "description": "Finds Coulomb blockade peaks in 1D traces.",
+            "released": "2026-05-13T19:00:00Z",
+            "input_shape_requirements": "1D trace of shape (N,)",
+        },
+        {
+            "id": "charge-stability-diagram-v1",
+            "name": "Charge stability diagram",
+            "description": "Segments charge stability diagrams.",
+            "released": "2026-05-13T19:00:00Z",
+            "input_shape_requirements": "A 128x128 CSD",
+        },
+        {
+            "id": "free-form-v1",
+            "name": "Free form",
+            "description": "Accepts anything.",
+            "released": "2026-05-13T19:00:00Z",
+            "input_shape_requirements": "Any numeric data",
+        },
+    ]
+
+
+def _batch_response() -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "input_file_name": "data.npy",
+        "model": MODEL,
+        "batch_size": 2,
+        "output": {"outputs": [{}, {}]},
+    }
+
+
+def _handler(paths: typing.List[str]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.method == "GET":
+            return httpx.Response(200, json=_catalog())
+        return httpx.Response(200, json=_batch_response())
+
+    return handler
+
+
+def _client(paths: typing.List[str]) -> ConductorQuantum:
+    return ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(paths))),
+    )
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2D array of shape (128, 128)", [(128, 128)]),
+        ("1D trace of shape (N,)", [(None,)]),
+        ("(batch, *, 64) or (batch, 64)", [(None, None, 64), (None, 64)]),
+        ("A 128x128 CSD", [(128, 128)]),
+        ("2D numpy array (optional)", [(None, None)]),
+        ("Any numeric data", []),
+    ],
+)
+def test_parse_shape_requirements(text: str, expected: typing.List[typing.Tuple[typing.Optional[int], ...]]) -> None:
+    assert parse_shape_requirements(text) == expected
+
+
+def test_preflight_rejects_bad_shape_without_uploading() -> None:
+    paths: typing.List[str] = []
+    client = _client(paths)
+
+    with pytest.raises(InputShapeError, match="Nothing was uploaded"):
+        client.control.models.batch.run(model="charge-stability-diagram-v1", data=np.zeros((2, 64, 64)), preflight=True)
+    with pytest.raises(InputShapeError, match="real numeric"):
+        client.control.models.run(model=MODEL, data=np.zeros(8, dtype=np.complex64), preflight=True)
+
+    assert all(not path.endswith("/models/batch") for path in paths)
+
+
+def test_preflight_accepts_matching_and_unenforced_inputs() -> None:
+    paths: typing.List[str] = []
+    client = _client(paths)
+
+    client.control.models.batch.run(model=MODEL, data=np.zeros((2, 100), dtype=np.float32), preflight=True)
+    client.control.models.batch.run(model="charge-stability-diagram-v1", data=np.zeros((2, 128, 128)), preflight=True)
+    client.control.models.batch.run(model="free-form-v1", data=np.zeros((2, 3, 4, 5)), preflight=True)
+    client.control.models.batch.run(model="unlisted-model", data=np.zeros((2, 3)), preflight=True)
+
+    # The catalog is listed once and reused for every later run.
+    assert [path.rsplit("/", 1)[-1] for path in paths].count("models") == 1
+    assert [path.rsplit("/", 1)[-1] for path in paths].count("batch") == 4
+
+
+def test_catalog_refreshes_after_ttl() -> None:
+    paths: typing.List[str] = []
+    client = _client(paths)
+    catalog = client.control.models._catalog
+
+    assert catalog.get(MODEL) is not None
+    assert catalog.get(MODEL) is not None
+    catalog.ttl_seconds = 0.0
+    assert catalog.get("missing") is None
+
+    assert len(paths) == 2
+
+
+def test_preflight_is_off_by_default() -> None:
+    paths: typing.List[str] = []
+    client = _client(paths)
+
+    client.control.models.batch.run(model="charge-stability-diagram-v1", data=np.zeros((2, 64, 64)))
+
+    assert len(paths) == 1 and paths[0].endswith("/models/batch")
+
+
+async def test_async_preflight_rejects_bad_shape() -> None:
+    paths: typing.List[str] = []
+    handler = _handler(paths)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+
+    with pytest.raises(InputShapeError):
+        await client.control.models.batch.run(model=MODEL, data=np.zeros((2, 3, 4)), preflight=True)
+    await client.control.models.batch.run(model=MODEL, data=np.zeros((2, 100)), preflight=True)
+
+    assert len(paths) == 2 and paths[-1].endswith("/models/batch")
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import io
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.models.preflight import InputShapeError
+from conductorquantum.models.preprocess import to_nn_input
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _catalog() -> typing.List[typing.Dict[str, typing.Any]]:
+    return [
+        {
+            "id": MODEL,
+            "name": "Coulomb blockade peak detector",
+            "description": "Finds Coulomb blockade peaks in 1D traces.",
+            "released": "2026-05-13T19:00:00Z",
+            "input_shape_requirements": "1D trace of shape (N,)",
+            "nn_input_shape_requirements": ["(100,)"],
+        },
+        {
+            "id": "unsized-v1",
+            "name": "Unsized",
+            "description": "Declares no NN input shape.",
+            "released": "2026-05-13T19:00:00Z",
+            "input_shape_requirements": "Any numeric data",
+        },
+    ]
+
+
+def _uploaded_array(request: httpx.Request) -> np.ndarray:
+    body = request.read()
+    start = body.index(b"\x93NUMPY")
+    return np.load(io.BytesIO(body[start:]))
+
+
+def _handler(uploads: typing.List[np.ndarray]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=_catalog())
+        array = _uploaded_array(request)
+        uploads.append(array)
+        return httpx.Response(
+            200,
+            json={
+                "id": "batch-result-id",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "model": MODEL,
+                "batch_size": len(array),
+                "output": {"outputs": [{} for _ in array]},
+            },
+        )
+
+    return handler
+
+
+def test_resample_averages_whole_factor_blocks() -> None:
+    data = np.arange(12, dtype=np.float32).reshape(2, 6)
+
+    result = to_nn_input(data, (3,), batched=True)
+
+    np.testing.assert_allclose(result, [[0.5, 2.5, 4.5], [6.5, 8.5, 10.5]])
+    assert result.dtype == np.float32
+
+
+def test_resample_converts_integers_to_float32() -> None:
+    data = np.arange(24, dtype=np.int16).reshape(2, 12)
+
+    result = to_nn_input(data, (5,), batched=True)
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result[:, 0], [0, 12])
+    assert to_nn_input(data, (4,), mode="crop", normalize=True, batched=True).dtype == np.float32
+
+
+def test_resample_interpolates_matches_per_item_loop() -> None:
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((4, 37, 23))
+
+    batched = to_nn_input(data, (10, 7), batched=True)
+    looped = np.stack([to_nn_input(item, (10, 7)) for item in data])
+
+    assert batched.shape == (4, 10, 7)
+    np.testing.assert_allclose(batched, looped)
+    np.testing.assert_allclose(batched[:, 0, 0], data[:, 0, 0])
+    np.testing.assert_allclose(batched[:, -1, -1], data[:, -1, -1])
+
+
+def test_crop_keeps_centre_and_dtype() -> None:
+    data = np.arange(20, dtype=np.int16).reshape(2, 10)
+
+    result = to_nn_input(data, (4,), mode="crop", batched=True)
+
+    np.testing.assert_array_equal(result, [[3, 4, 5, 6], [13, 14, 15, 16]])
+    assert result.dtype == np.int16
+    with pytest.raises(InputShapeError):
+        to_nn_input(data, (12,), mode="crop", batched=True)
+
+
+def test_open_axes_and_normalize() -> None:
+    data = np.random.default_rng(1).uniform(5, 9, size=(3, 8, 40))
+
+    result = to_nn_input(data, (None, 20), normalize=True, batched=True)
+
+    assert result.shape == (3, 8, 20)
+    np.testing.assert_allclose(result.mean(axis=(1, 2)), 0, atol=1e-12)
+    np.testing.assert_allclose(result.std(axis=(1, 2)), 1)
+
+
+def test_batch_run_uploads_preprocessed_array() -> None:
+    uploads: typing.List[np.ndarray] = []
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(uploads))),
+    )
+
+    client.control.models.batch.run(model=MODEL, data=np.ones((2, 1000)), preprocess="resample")
+    client.control.models.batch.run(model="unsized-v1", data=np.ones((2, 1000)), preprocess="crop")
+
+    assert [array.shape for array in uploads] == [(2, 100), (2, 1000)]
+
+
+async def test_async_run_uploads_preprocessed_array() -> None:
+    uploads: typing.List[np.ndarray] = []
+    handler = _handler(uploads)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+
+    await client.control.models.batch.run(model=MODEL, data=np.ones((3, 500)), preprocess="crop", preflight=True)
+
+    assert uploads[0].shape == (3, 100)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.coda._http import async_request, enable_coalescing, sync_request
+from conductorquantum.core.coalescing import AsyncSingleflight, Singleflight, request_key
+
+BASE_URL = "https://api.example.test/v0/control"
+CODA_URL = "https://api.example.test/v0/coda"
+ITEMS = [
+    {"id": f"result-{index}", "model": "coulomb-diamonds", "created_at": "2025-01-01T12:00:00Z", "output": {}}
+    for index in range(3)
+]
+
+
+class SlowServer:
+    """Mock transport handler that holds every request until :meth:`release` is called."""
+
+    def __init__(self) -> None:
+        self.requests: typing.List[httpx.Request] = []
+        self.released = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        self.released.wait(5)
+        return httpx.Response(200, json=ITEMS)
+
+    def release(self) -> None:
+        self.released.set()
+
+
+def _in_threads(count: int, call: typing.Callable[[int], typing.Any], server: SlowServer) -> typing.List[typing.Any]:
+    results: typing.List[typing.Any] = [None] * count
+
+    def run(index: int) -> None:
+        results[index] = call(index)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    # Give every thread time to reach the request before the first response arrives.
+    time.sleep(0.2)
+    server.release()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_request_key() -> None:
+    client = httpx.Client(base_url=BASE_URL)
+
+    key = request_key(client.build_request("GET", "/models", params={"limit": 1}))
+    assert key is not None and key[:2] == ("GET", f"{BASE_URL}/models?limit=1")
+    assert key != request_key(client.build_request("GET", "/models", params={"limit": 2}))
+    assert key != request_key(client.build_request("GET", "/models", params={"limit": 1}, headers={"X-Id": "1"}))
+    assert request_key(client.build_request("POST", "/models")) is None
+    assert request_key(client.build_request("GET", "/models", json={"limit": 1})) is None
+
+
+def test_singleflight_shares_errors() -> None:
+    flights: Singleflight[int] = Singleflight()
+    started = threading.Event()
+    calls: typing.List[int] = []
+
+    def fail() -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("boom")
+
+    errors: typing.List[BaseException] = []
+
+    def run() -> None:
+        started.wait()
+        try:
+            flights.do("key", fail)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    follower = threading.Thread(target=run)
+    follower.start()
+    with pytest.raises(RuntimeError):
+        flights.do("key", fail)
+    follower.join()
+
+    assert len(calls) == 1
+    assert len(errors) == 1
+    # Nothing is kept once the call has finished.
+    assert flights.do("key", lambda: 2) == 2
+
+
+def test_concurrent_identical_gets_share_one_request() -> None:
+    server = SlowServer()
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server)),
+        coalesce_requests=True,
+    )
+
+    results = _in_threads(8, lambda _: client.control.model_results.list(limit=3), server)
+
+    assert len(server.requests) == 1
+    assert all([result.id for result in page] == ["result-0", "result-1", "result-2"] for page in results)
+    # Every caller decodes the shared response itself.
+    assert len({id(page) for page in results}) == 8
+
+
+def test_different_queries_and_tokens_are_not_coalesced() -> None:
+    server = SlowServer()
+    transport = httpx.MockTransport(server)
+    clients = [
+        ConductorQuantum(
+            token=token, base_url=BASE_URL, httpx_client=httpx.Client(transport=transport), coalesce_requests=True
+        )
+        for token in ("token-a", "token-b")
+    ]
+
+    _in_threads(4, lambda index: clients[index % 2].control.model_results.list(limit=index // 2 + 1), server)
+
+    assert len(server.requests) == 4
+
+
+def test_request_option_overrides_client_default() -> None:
+    server = SlowServer()
+    client = ConductorQuantum(
+        token="test-token", base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(server))
+    )
+
+    _in_threads(3, lambda _: client.control.model_results.list(limit=3), server)
+    assert len(server.requests) == 3
+
+    server = SlowServer()
+    client = ConductorQuantum(
+        token="test-token", base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(server))
+    )
+    _in_threads(
+        3, lambda _: client.control.model_results.list(limit=3, request_options={"coalesce_requests": True}), server
+    )
+    assert len(server.requests) == 1
+
+
+async def test_async_identical_gets_share_one_request() -> None:
+    calls: typing.List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=ITEMS)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        coalesce_requests=True,
+    )
+
+    results = await asyncio.gather(*(client.control.model_results.list(limit=3) for _ in range(5)))
+    assert len(calls) == 1
+    assert all(len(page) == 3 for page in results)
+
+    await asyncio.gather(*(client.control.model_results.list(limit=limit) for limit in (1, 2)))
+    assert len(calls) == 3
+
+
+async def test_cancelling_one_caller_does_not_cancel_the_others() -> None:
+    flights: AsyncSingleflight[int] = AsyncSingleflight()
+    calls: typing.List[int] = []
+
+    async def call() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 7
+
+    first = asyncio.ensure_future(flights.do("key", call))
+    second = asyncio.ensure_future(flights.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 7
+    assert first.cancelled()
+    assert len(calls) == 1
+
+
+def test_coda_gets_are_coalesced_per_client() -> None:
+    server = SlowServer()
+    client = httpx.Client(base_url=CODA_URL, transport=httpx.MockTransport(server))
+    enable_coalescing(client)
+
+    _in_threads(4, lambda _: sync_request(client, "GET", "/health"), server)
+    assert len(server.requests) == 1
+
+    server = SlowServer()
+    client = httpx.Client(base_url=CODA_URL, transport=httpx.MockTransport(server))
+    enable_coalescing(client)
+    _in_threads(4, lambda _: sync_request(client, "POST", "/qpu/status", json={"job_id": "job"}), server)
+    assert len(server.requests) == 4
+
+
+async def test_coda_async_gets_are_coalesced() -> None:
+    calls: typing.List[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = httpx.AsyncClient(base_url=CODA_URL, transport=httpx.MockTransport(handler))
+    enable_coalescing(client)
+
+    responses = await asyncio.gather(*(async_request(client, "GET", "/health") for _ in range(3)))
+    assert len(calls) == 1
+    assert all(response.json() == {"status": "ok"} for response in responses)
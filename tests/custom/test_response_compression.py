@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import gzip
+import json
+import typing
+import zlib
+
+import httpx
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.coda._http import async_request, parse_json, sync_request
+from conductorquantum.core import compression
+
+BASE_URL = "https://api.example.test/v0/control"
+CODA_URL = "https://api.example.test/v0/coda"
+PAYLOAD = {"detail": "Vote removed", "padding": "x" * 10_000}
+
+
+def _gzip_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-encoding": "gzip", "content-type": "application/json"},
+        # An unread stream, as from a real transport; content= would be read eagerly.
+        stream=httpx.ByteStream(gzip.compress(json.dumps(PAYLOAD).encode())),
+    )
+
+
+class _DeflateDecoder:
+    """Stands in for a zstd/brotli decoder on an encoding httpx does not know."""
+
+    def __init__(self) -> None:
+        self._decompressor = zlib.decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush()
+
+
+def test_accept_encoding_prefers_modern_codecs() -> None:
+    offered = [encoding.strip() for encoding in compression.accept_encoding().split(",")]
+
+    assert offered[-2:] == ["gzip", "deflate"]
+    assert offered == [encoding for encoding in ("zstd", "br", "gzip", "deflate") if encoding in offered]
+
+
+def test_control_requests_negotiate_and_decode_compression() -> None:
+    captured: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return _gzip_response(request)
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    assert client.control.model_results.remove_vote_on_model_result("result-id") == PAYLOAD
+    assert captured[0].headers["accept-encoding"] == compression.accept_encoding()
+
+
+async def test_async_control_requests_decode_compression() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return _gzip_response(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    assert await client.control.model_results.remove_vote_on_model_result("result-id") == PAYLOAD
+
+
+def test_fallback_decoder_handles_encodings_httpx_cannot(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression, "_fallback_decoders", lambda: {"x-test": _DeflateDecoder})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-encoding": "x-test", "content-type": "application/json"},
+            stream=httpx.ByteStream(zlib.compress(json.dumps(PAYLOAD).encode())),
+        )
+
+    with httpx.Client(base_url=CODA_URL, transport=httpx.MockTransport(handler)) as client:
+        response = sync_request(client, "POST", "/simulate", json={})
+
+    assert parse_json(response) == PAYLOAD
+
+
+async def test_async_fallback_decoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(compression, "_fallback_decoders", lambda: {"x-test": _DeflateDecoder})
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-encoding": "x-test", "content-type": "application/json"},
+            stream=httpx.ByteStream(zlib.compress(json.dumps(PAYLOAD).encode())),
+        )
+
+    async with httpx.AsyncClient(base_url=CODA_URL, transport=httpx.MockTransport(handler)) as client:
+        response = await async_request(client, "POST", "/simulate", json={})
+
+    assert parse_json(response) == PAYLOAD
+
+
+def test_coda_requests_advertise_accept_encoding() -> None:
+    from conductorquantum.coda.client import CodaClient
+
+    captured: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return _gzip_response(request)
+
+    coda = CodaClient(token="coda_test-token", base_url=CODA_URL)
+    transport = httpx.MockTransport(handler)
+    coda._client._transport = transport
+
+    assert coda.tools.simulate(code="OPENQASM 3;") == PAYLOAD
+    assert captured[0].headers["accept-encoding"] == compression.accept_encoding()
+
+
+def test_streamed_requests_only_advertise_what_httpx_decodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Streamed bodies are decoded by httpx alone, so a fallback-only codec must not be offered for them.
+    monkeypatch.setattr(compression, "accept_encoding", lambda: "x-test, gzip, deflate")
+    from conductorquantum.coda.client import CodaClient
+
+    captured: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        if request.url.path.endswith("/download"):
+            return httpx.Response(200, stream=httpx.ByteStream(b"npy-bytes"))
+        if request.url.path.endswith("/agents"):
+            return httpx.Response(200, content=b'data: {"type": "completed"}\n\n')
+        return _gzip_response(request)
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    coda = CodaClient(token="coda_test-token", base_url=CODA_URL)
+    coda._client._transport = httpx.MockTransport(handler)
+
+    client.control.model_results.remove_vote_on_model_result("result-id")
+    assert b"".join(client.control.model_results.download("result-id")) == b"npy-bytes"
+    assert list(coda.agents.run(messages=[{"role": "user", "content": "hi"}])) == [{"type": "completed"}]
+
+    buffered, download, agents = captured
+    native = httpx.Client().headers["accept-encoding"]
+    assert buffered.headers["accept-encoding"] == "x-test, gzip, deflate"
+    assert download.headers["accept-encoding"] == native
+    assert agents.headers["accept-encoding"] == native
+
+
+def test_streamed_zstd_bodies_are_decoded() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    compress = zstandard.ZstdCompressor().compress
+    from conductorquantum.coda.client import CodaClient
+
+    body = bytes(range(256)) * 64
+    events = b'data: {"type": "message", "text": "hi"}\n\ndata: {"type": "completed"}\n\n'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "zstd" in request.headers["accept-encoding"]
+        payload = events if request.url.path.endswith("/agents") else body
+        return httpx.Response(200, headers={"content-encoding": "zstd"}, stream=httpx.ByteStream(compress(payload)))
+
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    coda = CodaClient(token="coda_test-token", base_url=CODA_URL)
+    coda._client._transport = httpx.MockTransport(handler)
+
+    assert b"".join(client.control.model_results.download("result-id")) == body
+    assert [event["type"] for event in coda.agents.run(messages=[{"role": "user", "content": "hi"}])] == [
+        "message",
+        "completed",
+    ]
+
+
+async def test_async_streamed_zstd_bodies_are_decoded() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    body = bytes(range(256)) * 64
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert "zstd" in request.headers["accept-encoding"]
+        return httpx.Response(
+            200,
+            headers={"content-encoding": "zstd"},
+            stream=httpx.ByteStream(zstandard.ZstdCompressor().compress(body)),
+        )
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    assert b"".join([chunk async for chunk in client.control.model_results.download("result-id")]) == body
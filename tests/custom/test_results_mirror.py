@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import pathlib
+import threading
+import typing
+
+import httpx
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.model_results.mirror import ResultsMirror
+
+TOKEN = "test-token"
+BASE_URL = "https://api.example.test/v0/control"
+
+
+def _item(index: int, **overrides: typing.Any) -> typing.Dict[str, typing.Any]:
+    return {
+        "id": f"result-{index}",
+        "model": "coulomb-diamonds" if index % 2 else "charge-stability",
+        "created_at": f"2026-05-{index + 1:02d}T12:00:00Z",
+        "output": {"score": index},
+        **overrides,
+    }
+
+
+class _Server:
+    """Stand-in for the model-results endpoints that honours start_date, skip and limit."""
+
+    def __init__(self, items: typing.List[typing.Dict[str, typing.Any]]) -> None:
+        self.items = items
+        self.requests: typing.List[httpx.Request] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        start = request.url.params.get("start_date")
+        items = [item for item in self.items if start is None or item["created_at"] >= start]
+        skip = int(request.url.params["skip"])
+        return httpx.Response(200, json=items[skip : skip + int(request.url.params["limit"])])
+
+
+def _mirror(server: _Server, path: pathlib.Path, **kwargs: typing.Any) -> ResultsMirror:
+    client = ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(server))
+    )
+    return client.control.model_results.mirror(path, **kwargs)
+
+
+def test_sync_is_incremental(tmp_path: pathlib.Path) -> None:
+    server = _Server([_item(index) for index in range(5)])
+
+    with _mirror(server, tmp_path / "mirror.sqlite", page_size=2) as mirror:
+        assert mirror.sync() == 5
+        assert len(mirror) == 5
+        assert mirror.watermark == "2026-05-05T12:00:00Z"
+        assert [request.url.params["skip"] for request in server.requests] == ["0", "2", "4"]
+
+        server.items.append(_item(5))
+        server.requests.clear()
+        # Results at the watermark come back again and are stored once.
+        assert mirror.sync() == 2
+        assert len(mirror) == 6
+        assert server.requests[0].url.params["start_date"] == "2026-05-05T12:00:00Z"
+        assert mirror.watermark == "2026-05-06T12:00:00Z"
+
+
+def test_mirror_persists_between_sessions(tmp_path: pathlib.Path) -> None:
+    server = _Server([_item(index) for index in range(3)])
+    with _mirror(server, tmp_path / "mirror.sqlite") as mirror:
+        mirror.sync()
+
+    with _mirror(_Server([]), tmp_path / "mirror.sqlite") as mirror:
+        assert len(mirror) == 3
+        assert mirror.watermark == "2026-05-03T12:00:00Z"
+
+
+def test_local_queries(tmp_path: pathlib.Path) -> None:
+    server = _Server([_item(index) for index in range(6)])
+
+    with _mirror(server, tmp_path / "mirror.sqlite") as mirror:
+        mirror.sync()
+        server.requests.clear()
+
+        assert [result.id for result in mirror.list(limit=2)] == ["result-5", "result-4"]
+        assert [result.id for result in mirror.list(skip=4)] == ["result-1", "result-0"]
+        assert [result.id for result in mirror.list(model="coulomb-diamonds")] == ["result-5", "result-3", "result-1"]
+        assert [result.id for result in mirror.list(start_date="2026-05-02", end_date="2026-05-03")] == [
+            "result-2",
+            "result-1",
+        ]
+        assert [result.id for result in mirror.list(end_date="2026-05-01T13:00:00+01:00")] == ["result-0"]
+        assert mirror.list(limit=1)[0].output == {"score": 5}
+        assert server.requests == []
+
+
+def test_forget_removes_a_result(tmp_path: pathlib.Path) -> None:
+    server = _Server([_item(index) for index in range(3)])
+
+    with _mirror(server, tmp_path / "mirror.sqlite") as mirror:
+        mirror.sync()
+        mirror.forget("result-0")
+        assert len(mirror) == 2
+        assert [result.id for result in mirror.list()] == ["result-2", "result-1"]
+
+
+def test_background_sync(tmp_path: pathlib.Path) -> None:
+    server = _Server([_item(index) for index in range(3)])
+
+    with _mirror(server, tmp_path / "mirror.sqlite") as mirror:
+        mirror.start(interval=60)
+        with pytest.raises(RuntimeError):
+            mirror.start()
+        mirror.stop()
+        assert len(mirror) == 3
+
+
+def test_model_filter_is_sent(tmp_path: pathlib.Path) -> None:
+    server = _Server([_item(1)])
+
+    with _mirror(server, tmp_path / "mirror.sqlite", model_str_id="coulomb-diamonds") as mirror:
+        mirror.sync()
+
+    assert server.requests[0].url.params["model_str_id"] == "coulomb-diamonds"
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import tempfile
+import time
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.errors import NotFoundError, UnprocessableEntityError
+from conductorquantum.models import extended_client
+from conductorquantum.models.extended_client import AsyncExtendedModelsClient, RunMultiError
+from conductorquantum.models.upload import npy_bytes
+
+BASE_URL = "https://api.example.test/v0/control"
+MODELS = ["coulomb-blockade-peak-detector-v2", "charge-stability-classifier", "dot-tuning-score"]
+
+
+def _recording_handler(uploads: typing.Dict[str, bytes]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        model = next(model for model in MODELS if f'name="model"\r\n\r\n{model}\r\n'.encode() in body)
+        start = body.index(b"\x93NUMPY")
+        uploads[model] = body[start : body.index(b"\r\n--", start)]
+        return httpx.Response(
+            200,
+            json={
+                "id": f"{model}-result",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "input_file_size": len(body),
+                "model": model,
+                "output": {},
+            },
+        )
+
+    return handler
+
+
+def _npy(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(24, dtype=np.float32).reshape(4, 6),
+        np.asfortranarray(np.arange(24, dtype=np.int16).reshape(4, 6)),
+        np.array([{"a": 1}, None], dtype=object),
+    ],
+)
+def test_npy_bytes_matches_np_save(array: np.ndarray) -> None:
+    assert npy_bytes(array) == _npy(array)
+
+
+def test_run_multi_serializes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_temp_files(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        raise AssertionError("run_multi should not write temporary files")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+    uploads: typing.Dict[str, bytes] = {}
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_recording_handler(uploads))),
+    )
+    array = np.random.default_rng(0).standard_normal((32, 32))
+
+    results = client.control.models.run_multi(models=[*MODELS, MODELS[0]], data=array)
+
+    assert list(results) == MODELS
+    assert {model: result.id for model, result in results.items()} == {model: f"{model}-result" for model in MODELS}
+    assert uploads == {model: _npy(array) for model in MODELS}
+
+
+def test_run_multi_reads_open_files_once(tmp_path: typing.Any) -> None:
+    path = tmp_path / "scan.npy"
+    array = np.arange(10.0)
+    np.save(path, array)
+    uploads: typing.Dict[str, bytes] = {}
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_recording_handler(uploads))),
+    )
+
+    with open(path, "rb") as file:
+        client.control.models.run_multi(models=MODELS, data=file)
+
+    assert uploads == {model: _npy(array) for model in MODELS}
+
+
+async def test_async_run_multi() -> None:
+    uploads: typing.Dict[str, bytes] = {}
+    handler = _recording_handler(uploads)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+    array = np.ones((8, 8), dtype=np.float32)
+
+    results = await client.control.models.run_multi(models=MODELS, data=array)
+
+    assert sorted(results) == sorted(MODELS)
+    assert uploads == {model: _npy(array) for model in MODELS}
+
+
+@pytest.mark.parametrize("source", ["array", "memmap", "file"])
+async def test_async_run_multi_serializes_off_the_loop_within_the_limit(
+    source: str, monkeypatch: pytest.MonkeyPatch, tmp_path: typing.Any
+) -> None:
+    uploads: typing.Dict[str, bytes] = {}
+    handler = _recording_handler(uploads)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+    models = typing.cast(AsyncExtendedModelsClient, client.control.models)
+    models._serialization_slots = asyncio.Semaphore(1)
+    array = np.arange(64, dtype=np.float64).reshape(8, 8)
+    path = tmp_path / "scan.npy"
+    np.save(path, array)
+    data: typing.Any = (
+        array if source == "array" else np.load(path, mmap_mode="r") if source == "memmap" else open(path, "rb")
+    )
+    real_materialize = extended_client._materialized_upload
+
+    def slow_materialize(value: typing.Any) -> typing.Any:
+        time.sleep(0.2)
+        return real_materialize(value)
+
+    monkeypatch.setattr(extended_client, "_materialized_upload", slow_materialize)
+    ticks = 0
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    await models._serialization_slots.acquire()
+    task = asyncio.ensure_future(models.run_multi(models=MODELS, data=data))
+    await asyncio.sleep(0.05)
+    # The upload waits for a free serialization slot.
+    assert not task.done() and not uploads
+    models._serialization_slots.release()
+    beat = asyncio.ensure_future(heartbeat())
+    try:
+        await task
+    finally:
+        beat.cancel()
+        if source == "file":
+            data.close()
+
+    assert ticks >= 5
+    assert uploads == {model: _npy(array) for model in MODELS}
+
+
+def _failing_handler(
+    delays: typing.Dict[str, float], statuses: typing.Dict[str, int]
+) -> typing.Callable[[httpx.Request], httpx.Response]:
+    succeed = _recording_handler({})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        model = next(model for model in MODELS if f'name="model"\r\n\r\n{model}\r\n'.encode() in body)
+        time.sleep(delays[model])
+        if statuses[model] == 200:
+            return succeed(request)
+        return httpx.Response(statuses[model], json={"detail": []})
+
+    return handler
+
+
+def test_run_multi_reports_every_failure_with_the_partial_results() -> None:
+    # The first model in order fails last; every call still finishes and is reported.
+    delays = {MODELS[0]: 0.3, MODELS[1]: 0.0, MODELS[2]: 0.1}
+    statuses = {MODELS[0]: 404, MODELS[1]: 422, MODELS[2]: 200}
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_failing_handler(delays, statuses))),
+    )
+
+    with pytest.raises(RunMultiError) as info:
+        client.control.models.run_multi(models=MODELS, data=np.ones(4), request_options={"max_retries": 0})
+
+    assert list(info.value.failures) == MODELS[:2]
+    assert isinstance(info.value.failures[MODELS[0]], NotFoundError)
+    assert isinstance(info.value.failures[MODELS[1]], UnprocessableEntityError)
+    assert list(info.value.exceptions) == list(info.value.failures.values())
+    assert {model: result.id for model, result in info.value.results.items()} == {MODELS[2]: f"{MODELS[2]}-result"}
+    assert info.value.subgroup(UnprocessableEntityError) is not None
+
+
+async def test_async_run_multi_cancels_the_other_calls_after_a_failure() -> None:
+    finished: typing.List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        model = next(model for model in MODELS if f'name="model"\r\n\r\n{model}\r\n'.encode() in body)
+        if model == MODELS[0]:
+            await asyncio.sleep(5)
+        finished.append(model)
+        if model == MODELS[2]:
+            return _recording_handler({})(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(422, json={"detail": []})
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(RunMultiError) as info:
+        await asyncio.wait_for(client.control.models.run_multi(models=MODELS, data=np.ones(4)), timeout=2)
+
+    assert sorted(finished) == sorted(MODELS[1:])
+    assert list(info.value.failures) == [MODELS[1]]
+    assert isinstance(info.value.failures[MODELS[1]], UnprocessableEntityError)
+    assert list(info.value.results) == [MODELS[2]]
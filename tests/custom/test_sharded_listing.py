@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from conductorquantum import ConductorQuantum
+from conductorquantum.model_results.sharding import DEFAULT_PAGES_AHEAD, _utc_key, date_shards
+
+TOKEN = "test-token"
+BASE_URL = "https://api.example.test/v0/control"
+
+
+def _items() -> typing.List[typing.Dict[str, typing.Any]]:
+    # Two results a day through May 2026, newest first like the API; one sits exactly on midnight.
+    items = [
+        {
+            "id": f"result-{day:02d}-{hour:02d}",
+            "model": "coulomb-diamonds",
+            "created_at": f"2026-05-{day:02d}T{hour:02d}:00:00Z",
+            "output": {"day": day},
+        }
+        for day in range(1, 32)
+        for hour in (0, 12)
+    ]
+    return items[::-1]
+
+
+class _Server:
+    """Stand-in listing endpoint with inclusive start/end filters; records peak concurrency."""
+
+    def __init__(self, items: typing.List[typing.Dict[str, typing.Any]], delay: float = 0.0) -> None:
+        self.items = items
+        self.delay = delay
+        self.requests: typing.List[httpx.Request] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        params = request.url.params
+        start = _utc_key(params["start_date"])
+        end = _utc_key(params["end_date"], end_of_day=True)
+        inclusive_end = len(params["end_date"]) != len("YYYY-MM-DD")
+        matching = [
+            item
+            for item in self.items
+            if start <= _utc_key(item["created_at"])
+            and (_utc_key(item["created_at"]) <= end if inclusive_end else _utc_key(item["created_at"]) < end)
+        ]
+        skip, limit = int(params["skip"]), int(params["limit"])
+        with self._lock:
+            self.active -= 1
+        return httpx.Response(200, json=matching[skip : skip + limit])
+
+
+def _client(server: _Server) -> ConductorQuantum:
+    return ConductorQuantum(
+        token=TOKEN, base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(server))
+    )
+
+
+def test_date_shards() -> None:
+    bounds = date_shards("2026-05-01", "2026-05-04", 4)
+
+    assert bounds == [
+        ("2026-05-01T00:00:00Z", "2026-05-02T00:00:00Z"),
+        ("2026-05-02T00:00:00Z", "2026-05-03T00:00:00Z"),
+        ("2026-05-03T00:00:00Z", "2026-05-04T00:00:00Z"),
+        ("2026-05-04T00:00:00Z", "2026-05-04T23:59:59.999999Z"),
+    ]
+    # More shards than microseconds in the range collapses the repeated boundaries.
+    assert date_shards("2026-05-01T00:00:00Z", "2026-05-01T00:00:00.000002Z", 8) == [
+        ("2026-05-01T00:00:00Z", "2026-05-01T00:00:00.000002Z")
+    ]
+    with pytest.raises(ValueError, match="before"):
+        date_shards("2026-05-03", "2026-05-01", 2)
+    with pytest.raises(ValueError, match="shards"):
+        date_shards("2026-05-01", "2026-05-02", 0)
+
+
+def test_iter_sharded_merges_in_created_at_order_without_duplicates() -> None:
+    items = _items()
+    server = _Server(items)
+
+    results = list(
+        _client(server).control.model_results.iter_sharded(
+            start_date="2026-05-01", end_date="2026-05-31", shards=10, page_size=4
+        )
+    )
+
+    assert [result.id for result in results] == [item["id"] for item in items]
+    # Every shard is paged from skip=0, never deep into the history.
+    assert {request.url.params["skip"] for request in server.requests} == {"0", "4"}
+
+
+def test_iter_sharded_runs_shards_concurrently() -> None:
+    server = _Server(_items(), delay=0.02)
+
+    pages = list(
+        _client(server).control.model_results.iter_sharded(
+            start_date="2026-05-01", end_date="2026-05-31", shards=8, max_workers=4, columnar=True
+        )
+    )
+
+    assert sum(len(page) for page in pages) == 62
+    assert server.peak > 1
+    assert all(request.url.params.get("model_str_id") is None for request in server.requests)
+
+
+def test_bare_end_date_covers_the_whole_day_across_inner_splits() -> None:
+    items = _items()
+    server = _Server(items)
+
+    bounds = date_shards("2026-05-01T00:00:00+00:00", "2026-05-02", 3)
+    results = list(
+        _client(server).control.model_results.iter_sharded(
+            start_date="2026-05-01T00:00:00+00:00", end_date="2026-05-02", shards=3, page_size=4
+        )
+    )
+
+    assert all(bound.endswith("Z") for shard in bounds for bound in shard)
+    assert len(bounds) == 3 and bounds[-1][1] == "2026-05-02T23:59:59.999999Z"
+    assert [result.id for result in results] == ["result-02-12", "result-02-00", "result-01-12", "result-01-00"]
+
+
+def test_iter_sharded_streams_a_large_shard_page_by_page() -> None:
+    server = _Server(_items())
+
+    results = typing.cast(
+        typing.Generator[typing.Any, None, None],
+        _client(server).control.model_results.iter_sharded(
+            start_date="2026-05-01", end_date="2026-05-31", shards=1, page_size=2
+        ),
+    )
+    assert next(results).id == "result-31-12"
+    time.sleep(0.2)
+
+    # One page consumed, DEFAULT_PAGES_AHEAD queued and one waiting for room; not all 31 pages.
+    assert len(server.requests) <= 1 + DEFAULT_PAGES_AHEAD + 1
+    results.close()
+
+
+def test_iter_sharded_rejects_bad_page_size() -> None:
+    with pytest.raises(ValueError, match="page_size"):
+        next(
+            _client(_Server([])).control.model_results.iter_sharded(
+                start_date="2026-05-01", end_date="2026-05-02", page_size=0
+            )
+        )
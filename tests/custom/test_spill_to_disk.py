@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+import typing
+
+import httpx
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.coda.client import CodaClient
+from conductorquantum.core import compression
+from conductorquantum.core.json_codec import response_json
+
+BASE_URL = "https://api.example.test/v0/control"
+CODA_URL = "https://api.example.test/v0/coda"
+PAYLOAD = {"detail": "Vote removed", "padding": "x" * 10_000}
+
+
+def _streamed(request: httpx.Request, *, gzipped: bool = False) -> httpx.Response:
+    body = json.dumps(PAYLOAD).encode()
+    headers = {"content-type": "application/json"}
+    if gzipped:
+        body = gzip.compress(body)
+        headers["content-encoding"] = "gzip"
+    # An unread stream, as from a real transport; content= would be read eagerly.
+    return httpx.Response(200, headers=headers, stream=httpx.ByteStream(body))
+
+
+@pytest.fixture
+def spills(monkeypatch: pytest.MonkeyPatch) -> typing.List[typing.IO[bytes]]:
+    """Record the temporary files responses are spilled to."""
+    opened: typing.List[typing.IO[bytes]] = []
+    original = tempfile.TemporaryFile
+
+    def recording(*args: typing.Any, **kwargs: typing.Any) -> typing.IO[bytes]:
+        file = typing.cast(typing.IO[bytes], original(*args, **kwargs))
+        opened.append(file)
+        return file
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", recording)
+    return opened
+
+
+def test_spill_threshold() -> None:
+    assert compression.spill_threshold(None) is None
+    assert compression.spill_threshold(False) is None
+    assert compression.spill_threshold(True) == compression.DEFAULT_SPILL_THRESHOLD
+    assert compression.spill_threshold(0) == 0
+    with pytest.raises(ValueError):
+        compression.spill_threshold(-1)
+
+
+@pytest.mark.parametrize("gzipped", [False, True])
+def test_large_bodies_are_read_from_a_memory_map(spills: typing.List[typing.IO[bytes]], gzipped: bool) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: _streamed(request, gzipped=gzipped)))
+
+    response = compression.read_response(client.send(client.build_request("GET", BASE_URL), stream=True), 1024)
+
+    assert isinstance(compression.spilled_body(response), memoryview)
+    assert response_json(response) == PAYLOAD
+    assert len(spills) == 1 and spills[0].closed
+    # The httpx API still works on a spilled response, with content copied in on demand.
+    assert response.json() == PAYLOAD
+    assert isinstance(response.content, bytes) and response.content == json.dumps(PAYLOAD).encode()
+    assert response.text.startswith('{"detail"')
+    assert response.read() == response.content
+
+
+def test_small_bodies_stay_in_memory(spills: typing.List[typing.IO[bytes]]) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(_streamed))
+
+    response = compression.read_response(client.send(client.build_request("GET", BASE_URL), stream=True), 1 << 20)
+
+    assert type(response.content) is bytes
+    assert compression.spilled_body(response) is None
+    assert response_json(response) == PAYLOAD
+    assert response.json() == PAYLOAD
+    assert spills == []
+
+
+def test_client_option_and_request_override(spills: typing.List[typing.IO[bytes]]) -> None:
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_streamed)),
+        spill_to_disk=1024,
+    )
+
+    assert client.control.model_results.remove_vote_on_model_result("result-id") == PAYLOAD
+    assert len(spills) == 1
+    assert (
+        client.control.model_results.remove_vote_on_model_result("result-id", request_options={"spill_to_disk": False})
+        == PAYLOAD
+    )
+    assert len(spills) == 1
+
+
+def test_raw_responses_decode_spilled_bodies(spills: typing.List[typing.IO[bytes]]) -> None:
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_streamed)),
+        spill_to_disk=1024,
+    )
+
+    # with_raw_response goes through the generated client, which calls response.json().
+    response = client.control.model_results.with_raw_response.remove_vote_on_model_result("result-id")
+
+    assert response.data == PAYLOAD
+    assert len(spills) == 1
+
+
+async def test_async_request_option(spills: typing.List[typing.IO[bytes]]) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return _streamed(request, gzipped=True)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    result = await client.control.model_results.remove_vote_on_model_result(
+        "result-id", request_options={"spill_to_disk": 1024}
+    )
+
+    assert result == PAYLOAD
+    assert len(spills) == 1
+
+
+def test_coda_client_spills(spills: typing.List[typing.IO[bytes]]) -> None:
+    client = CodaClient(token="coda_test", base_url=CODA_URL, spill_to_disk=1024)
+    client._client = httpx.Client(base_url=CODA_URL, transport=httpx.MockTransport(_streamed))
+
+    assert client.health() == PAYLOAD
+    assert len(spills) == 1
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import random
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.core.api_error import ApiError
+from conductorquantum.errors.unprocessable_entity_error import UnprocessableEntityError
+from conductorquantum.models.streaming import BatchOutputsParser
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _document(
+    outputs: typing.List[typing.Any], batch_size: typing.Optional[int] = None
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "id": "batch-result-id",
+        "created_at": "2026-05-13T19:00:00Z",
+        "output": {"plots": [{"outputs": ["not these"]}], "outputs": outputs, "summary": {"n": len(outputs)}},
+        "input_file_name": "data.npy",
+        "model": MODEL,
+        "batch_size": len(outputs) if batch_size is None else batch_size,
+    }
+
+
+OUTPUTS: typing.List[typing.Any] = [
+    {"peaks": [1, 2, 3], "label": 'brace } and "quote" \\ ]'},
+    [[1.5, -2e-3], []],
+    "plain",
+    42,
+    None,
+    True,
+    {"nested": {"deeper": [{"x": "é"}]}},
+]
+
+
+def test_parser_decodes_outputs_across_arbitrary_chunks() -> None:
+    body = json.dumps(_document(OUTPUTS), indent=2, ensure_ascii=False).encode()
+    rng = random.Random(0)
+    for _ in range(50):
+        parser = BatchOutputsParser()
+        decoded = []
+        position = 0
+        while position < len(body):
+            size = rng.randint(1, 9)
+            decoded.extend(parser.feed(body[position : position + size]))
+            position += size
+        envelope = parser.close()
+        assert decoded == list(enumerate(OUTPUTS))
+        assert envelope["output"] == {"plots": [{"outputs": ["not these"]}], "outputs": [], "summary": {"n": 7}}
+        assert envelope["batch_size"] == 7
+
+
+def test_parser_rejects_truncated_and_missing_outputs() -> None:
+    body = json.dumps(_document(OUTPUTS)).encode()
+    parser = BatchOutputsParser()
+    parser.feed(body[: len(body) // 2])
+    with pytest.raises(ValueError):
+        parser.close()
+
+    parser = BatchOutputsParser()
+    parser.feed(json.dumps({"output": {"result": [1, 2]}}).encode())
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def _chunked_body(document: typing.Dict[str, typing.Any], sent: typing.List[int]) -> typing.Iterator[bytes]:
+    body = json.dumps(document).encode()
+    for start in range(0, len(body), 16):
+        sent.append(start)
+        yield body[start : start + 16]
+
+
+def _client(handler: typing.Callable[[httpx.Request], httpx.Response]) -> ConductorQuantum:
+    return ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_run_streaming_yields_before_the_body_is_complete() -> None:
+    outputs = [{"row": index, "values": list(range(10))} for index in range(50)]
+    sent: typing.List[int] = []
+    client = _client(lambda request: httpx.Response(200, content=_chunked_body(_document(outputs), sent)))
+
+    stream = client.control.models.batch.run_streaming(model=MODEL, data=np.zeros((50, 8)))
+    first = next(stream)
+
+    assert first == (0, outputs[0])
+    total_chunks = len(json.dumps(_document(outputs)).encode()) // 16 + 1
+    assert len(sent) < total_chunks // 2
+    assert list(stream) == list(enumerate(outputs))[1:]
+
+
+def test_run_streaming_checks_the_output_count() -> None:
+    client = _client(lambda request: httpx.Response(200, json=_document([{"row": 0}], batch_size=2)))
+
+    stream = client.control.models.batch.run_streaming(model=MODEL, data=np.zeros((2, 8)))
+
+    assert next(stream) == (0, {"row": 0})
+    with pytest.raises(ApiError):
+        next(stream)
+
+
+def test_run_streaming_raises_typed_errors() -> None:
+    client = _client(lambda request: httpx.Response(422, json={"detail": []}))
+
+    with pytest.raises(UnprocessableEntityError):
+        list(client.control.models.batch.run_streaming(model=MODEL, data=np.zeros((2, 8))))
+
+
+async def test_async_run_streaming() -> None:
+    outputs = [{"row": index} for index in range(20)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        async def body() -> typing.AsyncIterator[bytes]:
+            for chunk in _chunked_body(_document(outputs), []):
+                yield chunk
+
+        return httpx.Response(200, content=body())
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    results = [item async for item in client.control.models.batch.run_streaming(model=MODEL, data=np.zeros((20, 4)))]
+
+    assert results == list(enumerate(outputs))
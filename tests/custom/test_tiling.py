@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.models.tiling import Tiler
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "charge-stability-diagram-v1"
+
+
+def _identity_handler(batch_sizes: typing.List[int]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    """Stand-in model that echoes each tile back as its ``mask`` output."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "id": MODEL,
+                        "name": "Charge stability diagram",
+                        "description": "Segments charge stability diagrams.",
+                        "released": "2026-05-13T19:00:00Z",
+                        "input_shape_requirements": "2D array",
+                        "nn_input_shape_requirements": ["(16, 16)"],
+                    }
+                ],
+            )
+        body = request.read()
+        tiles = np.load(io.BytesIO(body[body.index(b"\x93NUMPY") :]))
+        batch_sizes.append(len(tiles))
+        return httpx.Response(
+            200,
+            json={
+                "id": "batch-result-id",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "model": MODEL,
+                "batch_size": len(tiles),
+                "output": {"outputs": [{"mask": tile.tolist(), "score": float(tile.sum())} for tile in tiles]},
+            },
+        )
+
+    return handler
+
+
+def test_tiler_covers_edges_without_copying() -> None:
+    data = np.arange(50 * 37, dtype=np.float32).reshape(50, 37)
+    tiler = Tiler(data.shape, (16, 16), (10, 10))
+
+    rows = sorted({row for row, _ in tiler.origins})
+    cols = sorted({col for _, col in tiler.origins})
+    assert rows == [0, 10, 20, 30, 34]
+    assert cols == [0, 10, 20, 21]
+
+    batches = list(tiler.batches(data, max_batch_size=8))
+    assert [len(batch) for batch in batches] == [8, 8, 4]
+    row, col = tiler.origins[9]
+    np.testing.assert_array_equal(batches[1][1], data[row : row + 16, col : col + 16])
+
+
+def test_tiler_rejects_tiles_larger_than_the_array() -> None:
+    with pytest.raises(ValueError):
+        Tiler((8, 8), (16, 16))
+
+
+def test_run_tiled_stitches_full_resolution_maps() -> None:
+    batch_sizes: typing.List[int] = []
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_identity_handler(batch_sizes))),
+    )
+    data = np.random.default_rng(0).standard_normal((40, 52))
+
+    result = client.control.models.batch.run_tiled(model=MODEL, data=data, max_batch_size=10)
+
+    assert batch_sizes == [10, 10, 4]
+    np.testing.assert_allclose(result.maps["mask"], data)
+    assert "score" not in result.maps
+    assert len(result.tiles) == len(result.origins) == 24
+    row, col = result.origins[5]
+    assert result.tiles[5]["score"] == pytest.approx(data[row : row + 16, col : col + 16].sum())
+
+
+async def test_async_run_tiled() -> None:
+    batch_sizes: typing.List[int] = []
+    handler = _identity_handler(batch_sizes)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+    data = np.random.default_rng(1).standard_normal((20, 20))
+
+    result = await client.control.models.batch.run_tiled(model=MODEL, data=data, tile=(8, 8), stride=(6, 6))
+
+    assert batch_sizes == [9]
+    np.testing.assert_allclose(result.maps["mask"], data)
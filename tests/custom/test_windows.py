@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import io
+import typing
+
+import httpx
+import numpy as np
+import pytest
+
+from conductorquantum import AsyncConductorQuantum, ConductorQuantum
+from conductorquantum.models.tiling import window_batches
+
+BASE_URL = "https://api.example.test/v0/control"
+MODEL = "coulomb-blockade-peak-detector-v2"
+
+
+def _mean_handler(batch_sizes: typing.List[int]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    """Stand-in model that returns the mean of each window."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        windows = np.load(io.BytesIO(body[body.index(b"\x93NUMPY") :]))
+        batch_sizes.append(len(windows))
+        return httpx.Response(
+            200,
+            json={
+                "id": "batch-result-id",
+                "created_at": "2026-05-13T19:00:00Z",
+                "input_file_name": "data.npy",
+                "model": MODEL,
+                "batch_size": len(windows),
+                "output": {"outputs": [{"mean": float(window.mean())} for window in windows]},
+            },
+        )
+
+    return handler
+
+
+def test_window_batches_are_views_into_the_trace() -> None:
+    trace = np.arange(100, dtype=np.float64)
+
+    batches = list(window_batches(trace, window=10, stride=7, max_batch_size=5))
+
+    assert [len(starts) for starts, _ in batches] == [5, 5, 3]
+    starts, windows = batches[1]
+    assert list(starts) == [35, 42, 49, 56, 63]
+    assert np.shares_memory(windows, trace)
+    np.testing.assert_array_equal(windows[2], trace[49:59])
+
+
+def test_window_batches_validates_arguments() -> None:
+    with pytest.raises(ValueError):
+        list(window_batches(np.zeros((2, 10)), window=4, stride=1))
+    with pytest.raises(ValueError):
+        list(window_batches(np.zeros(3), window=4, stride=1))
+
+
+def test_run_windows_streams_bounded_batches() -> None:
+    batch_sizes: typing.List[int] = []
+    client = ConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_mean_handler(batch_sizes))),
+    )
+    trace = np.random.default_rng(0).standard_normal(1_000)
+
+    outputs = client.control.models.batch.run_windows(model=MODEL, trace=trace, window=50, stride=25, max_batch_size=16)
+    first = next(outputs)
+
+    # Only the first batch has been requested so far.
+    assert batch_sizes == [16]
+    rest = list(outputs)
+    assert batch_sizes == [16, 16, 7]
+    results = [first, *rest]
+    assert [start for start, _ in results] == list(range(0, 951, 25))
+    start, output = results[10]
+    assert output["mean"] == pytest.approx(trace[start : start + 50].mean())
+
+
+async def test_async_run_windows() -> None:
+    batch_sizes: typing.List[int] = []
+    handler = _mean_handler(batch_sizes)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AsyncConductorQuantum(
+        token="test-token",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+    trace = np.arange(40, dtype=np.float32)
+
+    results = [
+        item async for item in client.control.models.batch.run_windows(model=MODEL, trace=trace, window=8, stride=8)
+    ]
+
+    assert batch_sizes == [5]
+    assert [output["mean"] for _, output in results] == [3.5, 11.5, 19.5, 27.5, 35.5]